@@ -163,8 +163,14 @@ DEFAULT_SETTINGS = {
 # Project Status Options
 PROJECT_STATUS = ["planning", "active", "paused", "completed", "archived"]
 
-# Task Status Options
-TASK_STATUS = ["todo", "in_progress", "blocked", "completed"]
+# Task Status Options: (stored value, display label)
+TASK_STATUS_DISPLAY = [
+    ("todo", "To Do"),
+    ("in_progress", "In Progress"),
+    ("blocked", "Blocked"),
+    ("completed", "Completed"),
+]
+TASK_STATUS = [status for status, _ in TASK_STATUS_DISPLAY]
 
 # Priority Options
 PRIORITY_LEVELS = ["low", "medium", "high"]
@@ -25,6 +25,10 @@ class StorageManager:
     
     def __init__(self):
         """Initialize storage manager and create necessary directories."""
+        # Bumped on every write so views can tell whether a file changed
+        self._revisions: Dict[Path, int] = {}
+        # (tasks revision, open tasks with a due date) for the reminder checks
+        self._open_due_tasks = None
         self._ensure_directories()
         self._ensure_data_files()
     
@@ -67,6 +71,7 @@ class StorageManager:
             
             # Atomic rename
             shutil.move(temp_path, file_path)
+            self._bump_revision(file_path)
         except Exception as e:
             # Clean up temp file on error
             try:
@@ -75,6 +80,20 @@ class StorageManager:
                 pass
             raise e
     
+    def _bump_revision(self, file_path: Path):
+        """Record that a data file changed."""
+        self._revisions[file_path] = self._revisions.get(file_path, 0) + 1
+    
+    @property
+    def projects_revision(self) -> int:
+        """Counter that changes whenever the projects file is written."""
+        return self._revisions.get(PROJECTS_FILE, 0)
+    
+    @property
+    def tasks_revision(self) -> int:
+        """Counter that changes whenever the tasks file is written."""
+        return self._revisions.get(TASKS_FILE, 0)
+    
     def _read_json(self, file_path: Path) -> Any:
         """Read JSON data from file."""
         try:
@@ -124,6 +143,7 @@ class StorageManager:
         if backups:
             print(f"Restoring from backup: {backups[0].name}")
             shutil.copy2(backups[0], file_path)
+            self._bump_revision(file_path)
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         
@@ -131,6 +151,27 @@ class StorageManager:
         print("No backups available. Returning empty data.")
         return [] if file_path != SETTINGS_FILE else DEFAULT_SETTINGS
     
+    def _save_records_bulk(self, file_path: Path, records: List[Any], key: str):
+        """Create or update many records with one backup and one write."""
+        self._create_backup(file_path)
+        data = self._read_json(file_path)
+        
+        # Position of each existing record, so updates replace it in place
+        positions: Dict[Any, int] = {}
+        for i, record_data in enumerate(data):
+            positions.setdefault(record_data.get(key), i)
+        
+        for record in records:
+            record_data = record.to_dict()
+            i = positions.get(record_data[key])
+            if i is None:
+                positions[record_data[key]] = len(data)
+                data.append(record_data)
+            else:
+                data[i] = record_data
+        
+        self._write_json(file_path, data)
+    
     # Project CRUD Operations
     
     def get_all_projects(self) -> List[Project]:
@@ -166,6 +207,10 @@ class StorageManager:
         data = [p.to_dict() for p in projects]
         self._write_json(PROJECTS_FILE, data)
     
+    def save_projects_bulk(self, projects: List[Project]):
+        """Save many projects (create or update) in a single write."""
+        self._save_records_bulk(PROJECTS_FILE, projects, "id")
+    
     def delete_project(self, project_id: str):
         """Delete a project."""
         self._create_backup(PROJECTS_FILE)
@@ -182,6 +227,18 @@ class StorageManager:
         data = self._read_json(TASKS_FILE)
         return [Task.from_dict(t) for t in data]
     
+    def get_open_tasks_with_due_date(self) -> List[Task]:
+        """Get uncompleted tasks that have a due date; rebuilt only after the tasks file changes."""
+        cached = self._open_due_tasks
+        revision = self.tasks_revision
+        if cached is None or cached[0] != revision:
+            tasks = [
+                Task.from_dict(t) for t in self._read_json(TASKS_FILE)
+                if t.get("due_date") and t.get("status") != "completed"
+            ]
+            cached = self._open_due_tasks = (revision, tasks)
+        return cached[1]
+    
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a specific task by ID."""
         tasks = self.get_all_tasks()
@@ -195,6 +252,26 @@ class StorageManager:
         tasks = self.get_all_tasks()
         return [t for t in tasks if t.project_id == project_id]
     
+    def get_progress_batch(self, project_ids: List[str]) -> Dict[str, float]:
+        """
+        Get task-based progress for several projects with a single read.
+        Projects without tasks are left out so callers can fall back to milestones.
+        """
+        wanted = set(project_ids)
+        counts: Dict[str, List[int]] = {}
+        for task in self._read_json(TASKS_FILE):
+            project_id = task.get("project_id")
+            if project_id in wanted:
+                completed_total = counts.setdefault(project_id, [0, 0])
+                completed_total[1] += 1
+                if task.get("status") == "completed":
+                    completed_total[0] += 1
+        
+        return {
+            project_id: (completed / total) * 100
+            for project_id, (completed, total) in counts.items()
+        }
+    
     def save_task(self, task: Task):
         """Save a task (create or update)."""
         self._create_backup(TASKS_FILE)
@@ -215,6 +292,10 @@ class StorageManager:
         data = [t.to_dict() for t in tasks]
         self._write_json(TASKS_FILE, data)
     
+    def save_tasks_bulk(self, tasks: List[Task]):
+        """Save many tasks (create or update) in a single write."""
+        self._save_records_bulk(TASKS_FILE, tasks, "id")
+    
     def delete_task(self, task_id: str):
         """Delete a task."""
         self._create_backup(TASKS_FILE)
@@ -235,6 +316,16 @@ class StorageManager:
         """Save application settings."""
         self._write_json(SETTINGS_FILE, settings.to_dict())
     
+    def get_ui_state(self, key: str, default: Any = None) -> Any:
+        """Get remembered view state."""
+        return self.get_settings().ui_state.get(key, default)
+    
+    def set_ui_state(self, key: str, value: Any):
+        """Remember view state across sessions."""
+        settings = self.get_settings()
+        settings.ui_state[key] = value
+        self.save_settings(settings)
+    
     # Daily Plan Operations
     
     def get_daily_plan(self, plan_date: str) -> Optional['DailyPlan']:
@@ -300,6 +391,10 @@ class StorageManager:
         
         self._write_json(DAILY_PLANS_FILE, data)
     
+    def save_daily_plans_bulk(self, plans: List['DailyPlan']):
+        """Save many daily plans (create or update) in a single write."""
+        self._save_records_bulk(DAILY_PLANS_FILE, plans, "date")
+    
     def delete_daily_plan(self, plan_date: str):
         """Delete a daily plan."""
         self._create_backup(DAILY_PLANS_FILE)
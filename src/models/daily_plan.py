@@ -2,6 +2,7 @@
 Daily Plan data model for Desk Flow.
 """
 import uuid
+from bisect import bisect_right
 from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 
@@ -67,7 +68,8 @@ class DailyPlan:
         self.date = plan_date
         self.focus_goal = focus_goal
         self.tasks = tasks or []
-        self.time_blocks = time_blocks or []
+        # Kept sorted by start time so views can iterate without re-sorting
+        self.time_blocks = sorted(time_blocks or [], key=lambda b: b.start_time)
         self.notes = notes
         self.mood = mood
         self.completed = completed
@@ -98,8 +100,10 @@ class DailyPlan:
             self.tasks.remove(task_id)
     
     def add_time_block(self, time_block: TimeBlock):
-        """Add a time block to the plan."""
-        self.time_blocks.append(time_block)
+        """Add a time block to the plan, keeping blocks ordered by start time."""
+        start_times = [b.start_time for b in self.time_blocks]
+        index = bisect_right(start_times, time_block.start_time)
+        self.time_blocks.insert(index, time_block)
     
     def remove_time_block(self, block_id: str):
         """Remove a time block from the plan."""
@@ -3,7 +3,9 @@ Project data model for Desk Flow.
 """
 import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
+
+from utils.helpers import truncate_text
 
 
 class Milestone:
@@ -91,6 +93,36 @@ class Project:
         self.tags = tags or []
         self._progress_percentage = 0.0
         self._storage = None  # Will be set by ProjectsView
+        self._cache: Dict[str, Any] = {}
+    
+    def _cached(self, attr: str, compute: Callable[[], Any]) -> Any:
+        """Return a derived value, computing it once until the project next changes."""
+        if attr not in self._cache:
+            self._cache[attr] = compute()
+        return self._cache[attr]
+    
+    def _touch(self):
+        """Mark the project as modified and drop derived values."""
+        self.updated_at = datetime.now().isoformat()
+        self._cache.clear()
+    
+    @property
+    def name_trunc35(self) -> str:
+        """Project name truncated for cards."""
+        return self._cached("name_trunc35", lambda: truncate_text(self.name, 35))
+    
+    @property
+    def desc_trunc100(self) -> str:
+        """Project description truncated for cards."""
+        return self._cached("desc_trunc100", lambda: truncate_text(self.description, 100))
+    
+    @property
+    def milestones_completed_count(self) -> int:
+        """Number of completed milestones."""
+        return self._cached(
+            "milestones_completed_count",
+            lambda: sum(1 for m in self.milestones if m.completed)
+        )
     
     @property
     def progress_percentage(self) -> float:
@@ -105,8 +137,7 @@ class Project:
                     # Fall back to milestones if no tasks
                     if not self.milestones:
                         return 0.0
-                    completed = sum(1 for m in self.milestones if m.completed)
-                    return (completed / len(self.milestones)) * 100
+                    return (self.milestones_completed_count / len(self.milestones)) * 100
                 
                 # Calculate based on tasks
                 completed_tasks = sum(1 for t in project_tasks if t.status == "completed")
@@ -117,25 +148,24 @@ class Project:
         # Fallback to milestones-based calculation
         if not self.milestones:
             return 0.0
-        completed = sum(1 for m in self.milestones if m.completed)
-        return (completed / len(self.milestones)) * 100
+        return (self.milestones_completed_count / len(self.milestones)) * 100
     
     def update(self, **kwargs):
         """Update project fields."""
         for key, value in kwargs.items():
             if hasattr(self, key):
                 setattr(self, key, value)
-        self.updated_at = datetime.now().isoformat()
+        self._touch()
     
     def add_milestone(self, milestone: Milestone):
         """Add a milestone to the project."""
         self.milestones.append(milestone)
-        self.updated_at = datetime.now().isoformat()
+        self._touch()
     
     def remove_milestone(self, milestone_id: str):
         """Remove a milestone from the project."""
         self.milestones = [m for m in self.milestones if m.id != milestone_id]
-        self.updated_at = datetime.now().isoformat()
+        self._touch()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert project to dictionary for JSON serialization."""
@@ -23,6 +23,9 @@ class Settings:
         self.first_launch = settings_dict.get("first_launch", True)
         self.last_backup = settings_dict.get("last_backup")
         
+        # View state remembered across sessions, keyed by view
+        self.ui_state = settings_dict.get("ui_state", {})
+        
         # Notification settings
         self.notification_settings = settings_dict.get("notification_settings", {
             "enabled": True,
@@ -49,7 +52,8 @@ class Settings:
             "task_sort_order": self.task_sort_order,
             "first_launch": self.first_launch,
             "last_backup": self.last_backup,
-            "notification_settings": self.notification_settings
+            "notification_settings": self.notification_settings,
+            "ui_state": self.ui_state
         }
     
     @classmethod
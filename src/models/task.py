@@ -5,10 +5,14 @@ import uuid
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from utils.helpers import parse_iso
+
 
 class ChecklistItem:
     """Represents a checklist item within a task."""
     
+    __slots__ = ("id", "text", "completed")
+    
     def __init__(
         self,
         text: str,
@@ -90,16 +94,29 @@ class Task:
         completed = sum(1 for item in self.checklist if item.completed)
         return completed, len(self.checklist)
     
+    @property
+    def created_dt(self) -> Optional[datetime]:
+        """Parsed created_at."""
+        return parse_iso(self.created_at)
+    
+    @property
+    def completed_dt(self) -> Optional[datetime]:
+        """Parsed completed_at, or None if the task is not completed."""
+        return parse_iso(self.completed_at)
+    
+    @property
+    def due_dt(self) -> Optional[datetime]:
+        """Parsed due_date, or None if no due date is set."""
+        return parse_iso(self.due_date)
+    
     @property
     def is_overdue(self) -> bool:
         """Check if task is overdue."""
-        if not self.due_date or self.status == "completed":
-            return False
-        try:
-            due = datetime.fromisoformat(self.due_date)
-            return datetime.now() > due
-        except:
+        if self.status == "completed":
             return False
+        due = self.due_dt
+        # Aware due dates (an offset or "Z") compare against the current time in their zone
+        return due is not None and datetime.now(due.tzinfo) > due
     
     def update(self, **kwargs):
         """Update task fields."""
@@ -158,13 +175,10 @@ class Task:
     def get_total_time_seconds(self) -> int:
         """Get total time including running timer."""
         total = self.timer_elapsed_seconds
-        if self.timer_running and self.timer_start_time:
-            try:
-                start = datetime.fromisoformat(self.timer_start_time)
-                elapsed_now = (datetime.now() - start).total_seconds()
-                total += int(elapsed_now)
-            except:
-                pass
+        if self.timer_running:
+            start = parse_iso(self.timer_start_time)
+            if start:
+                total += int((datetime.now(start.tzinfo) - start).total_seconds())
         return total
     
     def to_dict(self) -> Dict[str, Any]:
@@ -1,8 +1,11 @@
 """
 Common reusable UI components.
 """
+import sys
 import customtkinter as ctk
-from typing import Callable, Optional
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 class StatusBadge(ctk.CTkFrame):
@@ -103,6 +106,12 @@ class SearchBar(ctk.CTkFrame):
     def clear(self):
         """Clear search text."""
         self.entry.delete(0, "end")
+    
+    def set(self, text: str):
+        """Replace search text without firing on_change."""
+        self.clear()
+        if text:
+            self.entry.insert(0, text)
 
 
 class EmptyState(ctk.CTkFrame):
@@ -137,3 +146,258 @@ class EmptyState(ctk.CTkFrame):
                 command=action_command
             )
             button.pack(pady=(16, 0))
+
+
+def set_gridded(widget, visible: bool):
+    """Show or hide a gridded widget only when its visibility changes, avoiding layout passes."""
+    gridded = bool(widget.winfo_manager())
+    if visible and not gridded:
+        widget.grid()
+    elif gridded and not visible:
+        widget.grid_remove()
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Scrollable list that only keeps row widgets for the rows inside the viewport.
+    Rows leaving the viewport go to a free list and are rebound to other items;
+    rows whose item key survives a set_items() call keep showing that item.
+    While scrolling, rows can be bound with a cheap preview and fully bound
+    once scrolling settles.
+    Rows share row_height unless item_height gives a per-item height, in which
+    case bind_row must size the row to that height.
+    """
+    
+    WHEEL_STEP = 40
+    HYDRATE_DELAY_MS = 250
+    
+    def __init__(self, parent, row_height: int, create_row: Callable[[Any, Any], Any],
+                 bind_row: Callable[[Any, Any], None], overscan: int = 1,
+                 key: Callable[[Any], Any] = id,
+                 preview_row: Optional[Callable[[Any, Any], None]] = None,
+                 item_height: Optional[Callable[[Any], int]] = None, **kwargs):
+        super().__init__(parent, fg_color="transparent", **kwargs)
+        
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.overscan = overscan
+        self.key = key
+        self.preview_row = preview_row
+        self.item_height = item_height
+        self.items: list = []
+        self._tops: List[int] = [0]  # Row tops plus content height, for item_height lists
+        self.offset = 0.0  # Scroll position in unscaled pixels
+        self._visible_rows: Dict[int, Any] = {}
+        self._free_rows: list = []
+        self._row_y: Dict[Any, float] = {}
+        self._overscan_after_id: Optional[str] = None
+        self._hydrate_after_id: Optional[str] = None
+        self._scrolling = False
+        self._preview_rows: set = set()
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        
+        self._viewport_px = 0
+        self.viewport.bind("<Configure>", self._on_viewport_configure)
+        
+        # One wheel binding per list, reached from rows through a bind tag
+        self._wheel_tag = f"VirtualListWheel{id(self)}"
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self._wheel_tag, sequence, self._on_mousewheel)
+        self._bind_wheel(self.viewport)
+    
+    def _on_viewport_configure(self, event):
+        """Re-render when the viewport height changes; rows follow width changes via relwidth."""
+        if event.height != self._viewport_px:
+            self._viewport_px = event.height
+            self._render()
+    
+    def set_items(self, items: list):
+        """Show a new list of items, reusing on-screen rows by item key."""
+        keyed_rows = {self.key(self.items[i]): row for i, row in self._visible_rows.items()}
+        self._visible_rows = {}
+        self.items = items
+        if self.item_height is not None:
+            self._tops = [0, *accumulate(map(self.item_height, items))]
+        self._render(keyed_rows)
+    
+    def _bind_wheel(self, widget):
+        """Scroll the list with the mouse wheel over the widget and everything inside it."""
+        widget.bindtags((self._wheel_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+    
+    def _on_mousewheel(self, event):
+        """Handle mouse wheel events on all platforms."""
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        elif sys.platform == "darwin":
+            steps = -event.delta
+        else:
+            steps = -event.delta / 120
+        self.scroll_to(self.offset + steps * self.WHEEL_STEP)
+    
+    def _on_scrollbar(self, *args):
+        """Handle scrollbar drag and scroll commands."""
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self._content_height())
+        elif args[0] == "scroll":
+            step = self._viewport_height() if args[2] == "pages" else self.row_height / 4
+            self.scroll_to(self.offset + float(args[1]) * step)
+    
+    def scroll_to(self, offset: float):
+        """Scroll so the given pixel offset is at the top of the viewport."""
+        self.offset = offset
+        if self.preview_row is not None:
+            self._scrolling = True
+            if self._hydrate_after_id is not None:
+                self.after_cancel(self._hydrate_after_id)
+            self._hydrate_after_id = self.after(self.HYDRATE_DELAY_MS, self._hydrate_rows)
+        self._render()
+    
+    def _hydrate_rows(self):
+        """Fully bind the rows that were only previewed while scrolling."""
+        self._hydrate_after_id = None
+        self._scrolling = False
+        for index, row in self._visible_rows.items():
+            if row in self._preview_rows:
+                self.bind_row(row, self.items[index])
+        self._preview_rows.clear()
+    
+    def _row_top(self, index: int) -> float:
+        """Content y of the row at the given index."""
+        if self.item_height is None:
+            return index * self.row_height
+        return self._tops[index]
+    
+    def _row_at(self, y: float) -> int:
+        """Index of the row covering content y."""
+        if self.item_height is None:
+            return int(y // self.row_height)
+        return bisect_right(self._tops, y) - 1
+    
+    def _content_height(self) -> float:
+        """Total height of all rows."""
+        if self.item_height is None:
+            return len(self.items) * self.row_height
+        return self._tops[-1]
+    
+    def _viewport_height(self) -> float:
+        """Viewport height in unscaled pixels."""
+        return self.viewport.winfo_height() / self._get_widget_scaling()
+    
+    def _release_row(self, index: int):
+        """Hide the row at the given index and keep it for reuse."""
+        row = self._visible_rows.pop(index)
+        row.place_forget()
+        self._row_y.pop(row, None)
+        self._free_rows.append(row)
+    
+    def _render(self, keyed_rows: Optional[dict] = None):
+        """Place rows for the items inside the viewport and queue the overscan rows."""
+        total = len(self.items)
+        view_height = self._viewport_height()
+        content_height = self._content_height()
+        self.offset = max(0.0, min(self.offset, content_height - view_height))
+        
+        visible_first = self._row_at(self.offset)
+        visible_last = min(total, self._row_at(self.offset + view_height) + 1)
+        first = max(0, visible_first - self.overscan)
+        last = min(total, visible_last + self.overscan)
+        
+        for index in [i for i in self._visible_rows if not first <= i < last]:
+            self._release_row(index)
+        
+        self._place_rows(range(visible_first, visible_last), keyed_rows)
+        
+        # Rows whose items left the list or the window become free
+        for row in (keyed_rows or {}).values():
+            row.place_forget()
+            self._row_y.pop(row, None)
+            self._free_rows.append(row)
+        
+        # Overscan rows are built once the visible rows are on screen;
+        # a newer render supersedes any pending one
+        if self._overscan_after_id is not None:
+            self.after_cancel(self._overscan_after_id)
+            self._overscan_after_id = None
+        if (first, last) != (visible_first, visible_last):
+            self._overscan_after_id = self.after_idle(self._render_overscan, first, last)
+        
+        if content_height > view_height:
+            self.scrollbar.set(self.offset / content_height, (self.offset + view_height) / content_height)
+        else:
+            self.scrollbar.set(0, 1)
+    
+    def _render_overscan(self, first: int, last: int):
+        """Place the rows just outside the viewport."""
+        self._overscan_after_id = None
+        self._place_rows(range(first, last))
+    
+    def _place_rows(self, indices: range, keyed_rows: Optional[dict] = None):
+        """Bind and position the rows for the given item indices."""
+        for index in indices:
+            row = self._visible_rows.get(index)
+            if row is None:
+                item = self.items[index]
+                row = keyed_rows.pop(self.key(item), None) if keyed_rows else None
+                if row is None and self._free_rows:
+                    row = self._free_rows.pop()
+                if row is not None and self._scrolling:
+                    self.preview_row(row, item)
+                    self._preview_rows.add(row)
+                elif row is not None:
+                    self.bind_row(row, item)
+                    self._preview_rows.discard(row)
+                else:
+                    row = self.create_row(self.viewport, item)
+                    self._bind_wheel(row)
+                self._visible_rows[index] = row
+            # Re-placing a row at its current position still costs a layout pass
+            y = self._row_top(index) - self.offset
+            if self._row_y.get(row) != y:
+                row.place(x=0, y=y, relwidth=1)
+                self._row_y[row] = y
+    
+    def destroy(self):
+        """Cancel pending rendering before the list goes away."""
+        for after_id in (self._overscan_after_id, self._hydrate_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._overscan_after_id = self._hydrate_after_id = None
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.unbind_class(self._wheel_tag, sequence)
+        super().destroy()
+
+
+class VirtualButtonList(VirtualList):
+    """Virtual list of buttons built from (text, command) pairs."""
+    
+    def __init__(self, parent, items: List[Tuple[str, Callable]], row_height: int = 32,
+                 button_kwargs: Optional[dict] = None, **kwargs):
+        self.button_kwargs = button_kwargs or {}
+        super().__init__(parent, row_height, self._create_button, self._bind_button, **kwargs)
+        self.items = items
+    
+    def _create_button(self, parent, item: Tuple[str, Callable]) -> ctk.CTkButton:
+        """Create a pooled button for an item."""
+        text, command = item
+        return ctk.CTkButton(
+            parent,
+            text=text,
+            command=command,
+            height=self.row_height - 4,
+            **self.button_kwargs
+        )
+    
+    def _bind_button(self, button: ctk.CTkButton, item: Tuple[str, Callable]):
+        """Point a pooled button at another item."""
+        text, command = item
+        button.configure(text=text, command=command)
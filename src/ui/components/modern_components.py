@@ -84,20 +84,27 @@ class GradientProgress(ctk.CTkFrame):
             corner_radius=height // 2
         )
         
+        self.progress: Optional[float] = None
         self.set_progress(progress)
     
     def set_progress(self, progress: float):
-        """Set progress percentage (0-100)."""
+        """Set progress percentage (0-100); unchanged values are skipped."""
         progress = max(0, min(100, progress))
+        if progress == self.progress:
+            return
+        self.progress = progress
         if progress > 0:
             self.progress_fill.place(relx=0, rely=0, relwidth=progress/100, relheight=1)
         else:
             self.progress_fill.place_forget()
     
     def set_gradient(self, colors: list):
-        """Update gradient colors."""
+        """Update gradient colors; unchanged colors are skipped."""
+        gradient_end = colors[1] if len(colors) > 1 else colors[0]
+        if (colors[0], gradient_end) == (self.gradient_start, self.gradient_end):
+            return
         self.gradient_start = colors[0]
-        self.gradient_end = colors[1] if len(colors) > 1 else colors[0]
+        self.gradient_end = gradient_end
         self.progress_fill.configure(fg_color=self.gradient_start)
 
 
@@ -137,6 +144,11 @@ class TagChip(ctk.CTkFrame):
     def set_color(self, color: str):
         """Update chip color."""
         self.configure(fg_color=color)
+    
+    def set(self, text: str, color: str):
+        """Update chip text and color together."""
+        self.label.configure(text=text)
+        self.configure(fg_color=color)
 
 
 class MetricCard(ctk.CTkFrame):
@@ -100,8 +100,10 @@ class MainWindow(ctk.CTk):
     
     def _show_view(self, view_name: str):
         """Show the specified view."""
-        # Hide current view
+        # Hide current view, letting it save its UI state first
         if self.current_view:
+            if hasattr(self.current_view, 'save_state'):
+                self.current_view.save_state()
             self.current_view.pack_forget()
         
         # Get or create and show new view
@@ -146,6 +148,13 @@ class MainWindow(ctk.CTk):
         
         # Reload settings after dialog closes
         self.settings = self.storage.get_settings()
+        
+        # Data may have been imported; drop cached daily plans
+        planner = self.views.get("daily_planner")
+        if planner:
+            planner.invalidate_plan_cache()
+            if planner is self.current_view:
+                planner.refresh()
     
     def _setup_keyboard_shortcuts(self):
         """Setup global keyboard shortcuts."""
@@ -196,6 +205,11 @@ class MainWindow(ctk.CTk):
         if hasattr(self, 'notification_manager'):
             self.notification_manager.stop()
         
+        # Save the visible view's UI state, and keep state views saved since startup
+        if hasattr(self.current_view, 'save_state'):
+            self.current_view.save_state()
+        self.settings.ui_state = self.storage.get_settings().ui_state
+        
         # Save window size and position
         self.settings.update(
             window_size={
@@ -2,29 +2,45 @@
 Analytics dashboard view with metrics and charts.
 """
 import customtkinter as ctk
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Tuple
 from PIL import Image
 import sys
 sys.path.append('..')
 
 from ui.components.common import IconButton
-from utils.analytics_data import (
-    get_project_status_distribution,
-    get_tasks_by_status,
-    get_tasks_completed_per_day,
-    get_time_by_project,
-    get_priority_distribution,
-    calculate_completion_rate,
-    get_best_productivity_day,
-    get_most_used_tags,
-    get_average_tasks_per_day
-)
-from utils.chart_generator import (
-    generate_pie_chart,
-    generate_donut_chart,
-    generate_bar_chart,
-    generate_horizontal_bar
-)
+from utils.analytics_data import get_project_status_distribution, aggregate_all
+from utils.error_handler import logger
+
+
+# Charts render on worker threads; the UI checks for finished ones on this interval
+CHART_WORKERS = 4
+CHART_POLL_MS = 50
+
+# Largest size a chart image is shown at
+CHART_MAX_SIZE = (800, 400)
+
+
+def _load_chart_image(chart_path: str) -> Image.Image:
+    """Decode a chart PNG and shrink it to display size; safe to run off the UI thread."""
+    image = Image.open(chart_path)
+    image.thumbnail(CHART_MAX_SIZE, Image.Resampling.LANCZOS)
+    return image
+
+
+def _render_chart_image(generator: str, args) -> Optional[Image.Image]:
+    """Render a chart and load its display image; runs on a chart worker."""
+    # matplotlib is only imported once a chart is drawn, keeping it out of app startup
+    from utils import chart_generator
+    chart_path = getattr(chart_generator, generator)(*args)
+    if not chart_path:
+        return None
+    try:
+        return _load_chart_image(chart_path)
+    except FileNotFoundError:
+        # Another worker pruned this image between lookup and load; render it again
+        chart_path = getattr(chart_generator, generator)(*args)
+        return _load_chart_image(chart_path) if chart_path else None
 
 
 class MetricCard(ctk.CTkFrame):
@@ -64,7 +80,8 @@ class MetricCard(ctk.CTkFrame):
 class ChartCard(ctk.CTkFrame):
     """Chart display card."""
     
-    def __init__(self, parent, title: str, chart_path: Optional[str] = None, **kwargs):
+    def __init__(self, parent, title: str, chart_path: Optional[str] = None,
+                 loading: bool = False, **kwargs):
         super().__init__(parent, fg_color=("white", "#2D2D2D"), corner_radius=12, **kwargs)
         
         # Title
@@ -80,37 +97,44 @@ class ChartCard(ctk.CTkFrame):
         
         if chart_path:
             self.display_chart(chart_path)
+        elif loading:
+            self._show_message("Rendering chart...")
         else:
             self.show_no_data()
     
     def display_chart(self, chart_path: str):
         """Display chart image."""
         try:
-            # Clear container
-            for widget in self.chart_container.winfo_children():
-                widget.destroy()
-            
-            # Load and display image
-            image = Image.open(chart_path)
-            # Resize to fit
-            image.thumbnail((800, 400), Image.Resampling.LANCZOS)
-            photo = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
-            
-            label = ctk.CTkLabel(self.chart_container, image=photo, text="")
-            label.image = photo  # Keep reference
-            label.pack()
+            image = _load_chart_image(chart_path)
         except Exception as e:
             print(f"Error displaying chart: {e}")
             self.show_no_data()
+            return
+        self.display_image(image)
+    
+    def display_image(self, image: Image.Image):
+        """Display an already loaded and sized chart image."""
+        # Clear container
+        for widget in self.chart_container.winfo_children():
+            widget.destroy()
+        
+        photo = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+        label = ctk.CTkLabel(self.chart_container, image=photo, text="")
+        label.image = photo  # Keep reference
+        label.pack()
     
     def show_no_data(self):
         """Show no data message."""
+        self._show_message("No data available")
+    
+    def _show_message(self, text: str):
+        """Replace the chart area with a short message."""
         for widget in self.chart_container.winfo_children():
             widget.destroy()
         
         ctk.CTkLabel(
             self.chart_container,
-            text="No data available",
+            text=text,
             font=("Segoe UI", 12),
             text_color="gray60"
         ).pack(pady=40)
@@ -125,6 +149,11 @@ class AnalyticsView(ctk.CTkScrollableFrame):
         self.storage = storage_manager
         self.date_range = 30  # Default to last 30 days
         
+        # Charts of the current refresh still rendering, with the cards waiting for them
+        self._chart_executor = ThreadPoolExecutor(max_workers=CHART_WORKERS)
+        self._chart_jobs: List[Tuple[ChartCard, Future]] = []
+        self._chart_after_id: Optional[str] = None
+        
         self._create_ui()
         self.refresh()
     
@@ -171,6 +200,8 @@ class AnalyticsView(ctk.CTkScrollableFrame):
     
     def refresh(self):
         """Refresh analytics data and charts."""
+        self._cancel_chart_jobs()
+        
         # Clear content
         for widget in self.content.winfo_children():
             widget.destroy()
@@ -183,10 +214,14 @@ class AnalyticsView(ctk.CTkScrollableFrame):
             self._show_empty_state()
             return
         
+        # One pass over the projects and one over the tasks feed every metric, chart and insight
+        project_status = get_project_status_distribution(projects)
+        aggregates = aggregate_all(tasks, projects, self.date_range)
+        
         # Render metrics and charts
-        self._render_metrics(projects, tasks)
-        self._render_charts(projects, tasks)
-        self._render_insights(tasks)
+        self._render_metrics(projects, tasks, project_status, aggregates)
+        self._render_charts(project_status, aggregates)
+        self._render_insights(aggregates)
     
     def _show_empty_state(self):
         """Show empty state when no data."""
@@ -197,18 +232,18 @@ class AnalyticsView(ctk.CTkScrollableFrame):
         )
         empty.pack(fill="both", expand=True, pady=100)
     
-    def _render_metrics(self, projects, tasks):
+    def _render_metrics(self, projects, tasks, project_status, aggregates):
         """Render key metrics cards."""
         metrics_frame = ctk.CTkFrame(self.content, fg_color="transparent")
         metrics_frame.pack(fill="x", pady=(0, 16))
         
         # Calculate metrics
         total_projects = len(projects)
-        active_projects = len([p for p in projects if p.status == "active"])
+        active_projects = project_status.get("active", 0)
         total_tasks = len(tasks)
-        active_tasks = len([t for t in tasks if t.status in ["todo", "in_progress"]])
-        completion_rate = calculate_completion_rate(tasks, self.date_range)
-        completed_this_month = len([p for p in projects if p.status == "completed"])
+        active_tasks = aggregates.status.get("todo", 0) + aggregates.status.get("in_progress", 0)
+        completion_rate = aggregates.completion_rate()
+        completed_this_month = project_status.get("completed", 0)
         
         # Create metric cards in grid
         MetricCard(
@@ -239,69 +274,71 @@ class AnalyticsView(ctk.CTkScrollableFrame):
             subtitle="This period"
         ).pack(side="left", fill="both", expand=True, padx=(8, 0))
     
-    def _render_charts(self, projects, tasks):
-        """Render analytics charts."""
-        # Project status distribution
-        project_status = get_project_status_distribution(projects)
-        if project_status:
-            chart_path = generate_pie_chart(
-                project_status,
-                "Project Status Distribution",
-                "project_status"
-            )
-            chart = ChartCard(self.content, "Project Status Distribution", chart_path)
-            chart.pack(fill="x", pady=(0, 16))
-        
-        # Tasks completed per day
-        tasks_per_day = get_tasks_completed_per_day(tasks, self.date_range)
-        if tasks_per_day:
-            chart_path = generate_bar_chart(
-                tasks_per_day,
-                f"Tasks Completed - Last {self.date_range} Days",
-                "Date",
-                "Tasks Completed",
-                "tasks_per_day"
-            )
-            chart = ChartCard(self.content, "Daily Task Completion", chart_path)
-            chart.pack(fill="x", pady=(0, 16))
-        
-        # Tasks by status
-        tasks_by_status = get_tasks_by_status(tasks)
-        if tasks_by_status:
-            chart_path = generate_donut_chart(
-                tasks_by_status,
-                "Tasks by Status",
-                "tasks_status"
-            )
-            chart = ChartCard(self.content, "Task Status Distribution", chart_path)
-            chart.pack(fill="x", pady=(0, 16))
+    def _render_charts(self, project_status, aggregates):
+        """Lay out the chart cards and render their images on the chart workers."""
+        tasks_per_day = aggregates.completed_per_day(self.date_range)
+        tasks_by_status = dict(aggregates.status)
+        time_by_project = aggregates.time_by_project()
+        priority_dist = dict(aggregates.priority)
+        
+        # (card title, generator name, generator arguments, has data)
+        charts = (
+            # Project status distribution
+            ("Project Status Distribution", "generate_pie_chart",
+             (project_status, "Project Status Distribution", "project_status"), project_status),
+            # Tasks completed per day
+            ("Daily Task Completion", "generate_bar_chart",
+             (tasks_per_day, f"Tasks Completed - Last {self.date_range} Days",
+              "Date", "Tasks Completed", "tasks_per_day"), tasks_per_day),
+            # Tasks by status
+            ("Task Status Distribution", "generate_donut_chart",
+             (tasks_by_status, "Tasks by Status", "tasks_status"), tasks_by_status),
+            # Time logged by project
+            ("Time by Project", "generate_horizontal_bar",
+             (time_by_project, "Time Logged by Project (Top 10)", "Hours", "time_by_project"),
+             time_by_project),
+            # Priority distribution
+            ("Priority Distribution", "generate_bar_chart",
+             (priority_dist, "Task Priority Distribution", "Priority", "Number of Tasks", "priority_dist"),
+             priority_dist),
+        )
         
-        # Time logged by project
-        time_by_project = get_time_by_project(projects, tasks)
-        if time_by_project:
-            chart_path = generate_horizontal_bar(
-                time_by_project,
-                "Time Logged by Project (Top 10)",
-                "Hours",
-                "time_by_project"
-            )
-            chart = ChartCard(self.content, "Time by Project", chart_path)
+        for title, generate, args, data in charts:
+            if not data:
+                continue
+            chart = ChartCard(self.content, title, loading=True)
             chart.pack(fill="x", pady=(0, 16))
+            self._chart_jobs.append((chart, self._chart_executor.submit(_render_chart_image, generate, args)))
         
-        # Priority distribution
-        priority_dist = get_priority_distribution(tasks)
-        if priority_dist:
-            chart_path = generate_bar_chart(
-                priority_dist,
-                "Task Priority Distribution",
-                "Priority",
-                "Number of Tasks",
-                "priority_dist"
-            )
-            chart = ChartCard(self.content, "Priority Distribution", chart_path)
-            chart.pack(fill="x", pady=(0, 16))
+        if self._chart_jobs:
+            self._chart_after_id = self.after(CHART_POLL_MS, self._poll_charts)
     
-    def _render_insights(self, tasks):
+    def _poll_charts(self):
+        """Show the charts that finished rendering."""
+        pending = []
+        for chart, future in self._chart_jobs:
+            if not future.done():
+                pending.append((chart, future))
+            elif future.exception() is not None:
+                logger.error("Chart rendering failed", exc_info=future.exception())
+                chart.show_no_data()
+            elif future.result() is not None:
+                chart.display_image(future.result())
+            else:
+                chart.show_no_data()
+        self._chart_jobs = pending
+        self._chart_after_id = self.after(CHART_POLL_MS, self._poll_charts) if pending else None
+    
+    def _cancel_chart_jobs(self):
+        """Drop the charts of an outdated refresh."""
+        if self._chart_after_id is not None:
+            self.after_cancel(self._chart_after_id)
+            self._chart_after_id = None
+        for _, future in self._chart_jobs:
+            future.cancel()
+        self._chart_jobs = []
+    
+    def _render_insights(self, aggregates):
         """Render productivity insights."""
         insights_frame = ctk.CTkFrame(self.content, fg_color=("white", "#2D2D2D"), corner_radius=12)
         insights_frame.pack(fill="x")
@@ -316,15 +353,15 @@ class AnalyticsView(ctk.CTkScrollableFrame):
         insights_content.pack(fill="x", padx=16, pady=(0, 16))
         
         # Best productivity day
-        best_day = get_best_productivity_day(tasks)
+        best_day = aggregates.best_productivity_day()
         self._add_insight(insights_content, "Best Productivity Day", best_day)
         
         # Average tasks per day
-        avg_tasks = get_average_tasks_per_day(tasks, self.date_range)
+        avg_tasks = aggregates.average_tasks_per_day(self.date_range)
         self._add_insight(insights_content, "Average Tasks/Day", f"{avg_tasks:.1f}")
         
         # Most used tags
-        top_tags = get_most_used_tags(tasks, 5)
+        top_tags = aggregates.tag_counts.most_common(5)
         if top_tags:
             tags_str = ", ".join([f"#{tag} ({count})" for tag, count in top_tags])
             self._add_insight(insights_content, "Most Used Tags", tags_str)
@@ -359,3 +396,9 @@ class AnalyticsView(ctk.CTkScrollableFrame):
         }
         self.date_range = range_map.get(value, 30)
         self.refresh()
+    
+    def destroy(self):
+        """Stop polling for charts before the view goes away."""
+        self._cancel_chart_jobs()
+        self._chart_executor.shutdown(wait=False)
+        super().destroy()
@@ -2,15 +2,54 @@
 Daily Planner view with focus goals, tasks, and time blocks.
 """
 import customtkinter as ctk
-from datetime import datetime, timedelta
-from typing import List, Optional
+from collections import OrderedDict
+from datetime import date, timedelta
+from functools import lru_cache, partial
+from typing import Dict, List, Optional
 import sys
 sys.path.append('..')
 
 from models.daily_plan import DailyPlan, TimeBlock
 from models.task import Task
-from ui.components.common import IconButton, EmptyState
-from config import TASK_STATUS
+from ui.components.common import IconButton, EmptyState, VirtualButtonList
+from config import TASK_STATUS, FONT_FAMILY
+
+# Fonts shared by every section, row and dialog in this view
+FONT_H1 = (FONT_FAMILY, 18, "bold")
+FONT_H2 = (FONT_FAMILY, 16, "bold")
+FONT_STAT = (FONT_FAMILY, 24, "bold")
+FONT_DIALOG_TITLE = (FONT_FAMILY, 14, "bold")
+FONT_ENTRY = (FONT_FAMILY, 14)
+FONT_BODY = (FONT_FAMILY, 13)
+FONT_BODY_BOLD = (FONT_FAMILY, 13, "bold")
+FONT_SMALL = (FONT_FAMILY, 12)
+FONT_SMALL_BOLD = (FONT_FAMILY, 12, "bold")
+FONT_ICON = (FONT_FAMILY, 18)
+FONT_EMOJI = (FONT_FAMILY, 24)
+
+# Mood values and their radio button labels
+MOODS = (
+    ("excellent", "😊"),
+    ("good", "🙂"),
+    ("neutral", "😐"),
+    ("tired", "😴"),
+    ("stressed", "😓")
+)
+
+# Format of the date shown in the navigation header
+DATE_LABEL_FORMAT = "%A, %B %d, %Y"
+
+# Delay before focus/mood changes are written to storage
+SAVE_DELAY_MS = 250
+
+# Number of recently viewed daily plans kept in memory
+PLAN_CACHE_SIZE = 7
+
+
+@lru_cache(maxsize=32)
+def format_plan_date(plan_date: date) -> str:
+    """Format a plan date for the header, caching recently shown dates."""
+    return plan_date.strftime(DATE_LABEL_FORMAT)
 
 
 class DailyPlannerView(ctk.CTkFrame):
@@ -20,9 +59,18 @@ class DailyPlannerView(ctk.CTkFrame):
         super().__init__(parent, fg_color="transparent", **kwargs)
         
         self.storage = storage_manager
-        self.current_date = datetime.now().strftime("%Y-%m-%d")
+        self._current_date_obj = date.today()
+        self.current_date = self._current_date_obj.isoformat()
+        self._today = self._current_date_obj
+        self._label_key: Optional[tuple] = None
         self.current_plan: Optional[DailyPlan] = None
         self.available_tasks: List[Task] = []
+        self._all_tasks_by_id: Dict[str, Task] = {}
+        self._completed_tasks_count = 0
+        self._save_after_id: Optional[str] = None
+        self._plan_dirty = False
+        self._notes_dirty = False
+        self._plan_cache: "OrderedDict[str, DailyPlan]" = OrderedDict()
         
         self._create_ui()
         self.refresh()
@@ -47,7 +95,7 @@ class DailyPlannerView(ctk.CTkFrame):
         self.date_label = ctk.CTkLabel(
             nav_frame,
             text="",
-            font=("Segoe UI", 18, "bold")
+            font=FONT_H1
         )
         self.date_label.pack(side="left", padx=16)
         
@@ -71,87 +119,127 @@ class DailyPlannerView(ctk.CTkFrame):
         # Main content - scrollable
         self.content = ctk.CTkScrollableFrame(self, fg_color="transparent")
         self.content.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        
+        # Sections are built once; refresh only updates their contents
+        self._create_focus_goal()
+        self._create_scheduled_tasks()
+        self._create_time_blocks()
+        self._create_notes()
+        self._create_mood()
+        self._create_stats()
     
     def refresh(self):
         """Refresh daily planner data."""
-        # Load current plan
-        self.current_plan = self.storage.get_daily_plan(self.current_date)
+        # Persist pending edits before the widgets are repopulated
+        self._flush_save()
         
-        # If no plan exists, create empty one
-        if not self.current_plan:
-            self.current_plan = DailyPlan(plan_date=self.current_date)
+        # Load current plan; the in-memory copy is authoritative for its date
+        if not self.current_plan or self.current_plan.date != self.current_date:
+            self.current_plan = self._load_plan(self.current_date)
         
-        # Load available tasks
-        self.available_tasks = [t for t in self.storage.get_all_tasks() if t.status != "completed"]
+        # Load tasks once per refresh; sections look them up by id
+        self._all_tasks_by_id = {t.id: t for t in self.storage.get_all_tasks()}
+        self._update_available_tasks()
         
         # Update UI
+        self._today = date.today()
         self._update_date_label()
         self._render_content()
     
+    def _load_plan(self, plan_date: str) -> DailyPlan:
+        """Get the plan for a date, reading storage only on a cache miss."""
+        plan = self._plan_cache.get(plan_date)
+        if plan is None:
+            plan = self.storage.get_daily_plan(plan_date)
+            
+            # If no plan exists, create empty one
+            if not plan:
+                plan = DailyPlan(plan_date=plan_date)
+        
+        self._cache_plan(plan)
+        return plan
+    
+    def _cache_plan(self, plan: DailyPlan):
+        """Store a plan as the most recently used cache entry."""
+        self._plan_cache[plan.date] = plan
+        self._plan_cache.move_to_end(plan.date)
+        while len(self._plan_cache) > PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+    
+    def invalidate_plan_cache(self):
+        """Drop cached plans after storage was changed outside this view."""
+        self._flush_save()
+        self._plan_cache.clear()
+        self.current_plan = None
+    
+    def _update_available_tasks(self):
+        """Recompute tasks that can still be added to the plan."""
+        self.available_tasks = [
+            t for t in self._all_tasks_by_id.values() if t.status != "completed"
+        ]
+    
     def _update_date_label(self):
         """Update date label."""
-        date_obj = datetime.fromisoformat(self.current_date)
+        # Only reformat when the shown date (or what counts as today) changed
+        label_key = (self._current_date_obj, self._today)
+        if label_key == self._label_key:
+            return
+        self._label_key = label_key
         
-        # Check if today
-        today = datetime.now().strftime("%Y-%m-%d")
-        if self.current_date == today:
-            date_str = f"Today - {date_obj.strftime('%A, %B %d, %Y')}"
-        else:
-            date_str = date_obj.strftime("%A, %B %d, %Y")
+        date_str = format_plan_date(self._current_date_obj)
+        if self._current_date_obj == self._today:
+            date_str = f"Today - {date_str}"
         
         self.date_label.configure(text=date_str)
     
     def _render_content(self):
-        """Render daily plan content."""
-        # Clear content
-        for widget in self.content.winfo_children():
-            widget.destroy()
-        
+        """Fill the existing sections with the current plan."""
         # Focus Goal Section
-        self._render_focus_goal()
-        
-        # Scheduled Tasks Section
-        self._render_scheduled_tasks()
+        self.focus_entry.delete(0, "end")
+        if self.current_plan.focus_goal:
+            self.focus_entry.insert(0, self.current_plan.focus_goal)
         
-        # Time Blocks Section
-        self._render_time_blocks()
+        # Scheduled Tasks and Time Blocks Sections
+        self._refresh_tasks_section()
+        self._refresh_blocks_section()
         
         # Notes Section
-        self._render_notes()
+        self.notes_text.delete("1.0", "end")
+        if self.current_plan.notes:
+            self.notes_text.insert("1.0", self.current_plan.notes)
+        self.notes_text.edit_modified(False)
+        self._notes_dirty = False
         
         # Mood Tracker
-        self._render_mood()
+        self.mood_var.set(self.current_plan.mood or "")
         
         # Stats
-        self._render_stats()
+        self._refresh_stats()
     
-    def _render_focus_goal(self):
-        """Render focus goal section."""
+    def _create_focus_goal(self):
+        """Create focus goal section."""
         section = ctk.CTkFrame(self.content, fg_color=("white", "#2D2D2D"), corner_radius=12)
         section.pack(fill="x", pady=(0, 16))
         
         ctk.CTkLabel(
             section,
             text="🎯 Focus Goal",
-            font=("Segoe UI", 16, "bold")
+            font=FONT_H2
         ).pack(anchor="w", padx=16, pady=(16, 8))
         
         self.focus_entry = ctk.CTkEntry(
             section,
             placeholder_text="What's your main goal for today?",
-            font=("Segoe UI", 14),
+            font=FONT_ENTRY,
             height=45
         )
         self.focus_entry.pack(fill="x", padx=16, pady=(0, 16))
         
-        if self.current_plan.focus_goal:
-            self.focus_entry.insert(0, self.current_plan.focus_goal)
-        
         # Auto-save on focus out
-        self.focus_entry.bind("<FocusOut>", lambda e: self._save_plan())
+        self.focus_entry.bind("<FocusOut>", lambda e: self._schedule_save())
     
-    def _render_scheduled_tasks(self):
-        """Render scheduled tasks section."""
+    def _create_scheduled_tasks(self):
+        """Create scheduled tasks section."""
         section = ctk.CTkFrame(self.content, fg_color=("white", "#2D2D2D"), corner_radius=12)
         section.pack(fill="x", pady=(0, 16))
         
@@ -161,7 +249,7 @@ class DailyPlannerView(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="📋 Scheduled Tasks",
-            font=("Segoe UI", 16, "bold")
+            font=FONT_H2
         ).pack(side="left")
         
         # Add task button
@@ -171,65 +259,58 @@ class DailyPlannerView(ctk.CTkFrame):
             command=self._show_add_task_menu,
             width=100,
             height=30,
-            font=("Segoe UI", 12)
+            font=FONT_SMALL
         ).pack(side="right")
         
         # Tasks list
-        tasks_container = ctk.CTkFrame(section, fg_color="transparent")
-        tasks_container.pack(fill="x", padx=16, pady=(0, 16))
-        
-        if not self.current_plan.tasks:
-            ctk.CTkLabel(
-                tasks_container,
-                text="No tasks scheduled yet",
-                font=("Segoe UI", 12),
-                text_color="gray60"
-            ).pack(pady=8)
-        else:
-            # Get actual task objects
-            all_tasks = {t.id: t for t in self.storage.get_all_tasks()}
-            
-            for task_id in self.current_plan.tasks:
-                task = all_tasks.get(task_id)
-                if task:
-                    self._render_task_item(tasks_container, task)
-    
-    def _render_task_item(self, parent, task: Task):
-        """Render a single task item."""
-        item = ctk.CTkFrame(parent, fg_color=("#F5F5F0", "#3A3A3A"), corner_radius=8)
-        item.pack(fill="x", pady=4)
-        
-        content = ctk.CTkFrame(item, fg_color="transparent")
-        content.pack(fill="x", padx=12, pady=10)
+        self._tasks_container = ctk.CTkFrame(section, fg_color="transparent")
+        self._tasks_container.pack(fill="x", padx=16, pady=(0, 16))
         
-        # Checkbox
-        completed = task.status == "completed"
-        checkbox = ctk.CTkCheckBox(
-            content,
-            text=task.title,
-            font=("Segoe UI", 13),
-            command=lambda: self._toggle_task_completion(task)
+        self._tasks_empty_label = ctk.CTkLabel(
+            self._tasks_container,
+            text="No tasks scheduled yet",
+            font=FONT_SMALL,
+            text_color="gray60"
         )
-        if completed:
-            checkbox.select()
-        checkbox.pack(side="left", fill="x", expand=True)
+        self._task_row_pool: List[TaskRowWidgets] = []
+    
+    def _refresh_tasks_section(self):
+        """Update the scheduled task rows, reusing pooled row widgets."""
+        # Resolve rows and count completed tasks in the same pass
+        tasks_by_id = self._all_tasks_by_id
+        tasks = []
+        completed_count = 0
+        for task_id in self.current_plan.tasks:
+            # Skip ids of deleted tasks before any widget work
+            if (task := tasks_by_id.get(task_id)) is not None:
+                tasks.append(task)
+                if task.status == "completed":
+                    completed_count += 1
+        self._completed_tasks_count = completed_count
+        
+        if tasks:
+            self._tasks_empty_label.pack_forget()
+        else:
+            self._tasks_empty_label.pack(pady=8)
         
-        # Remove button
-        remove_btn = ctk.CTkButton(
-            content,
-            text="×",
-            width=30,
-            height=30,
-            corner_radius=15,
-            fg_color="transparent",
-            hover_color=("gray85", "gray25"),
-            font=("Segoe UI", 18),
-            command=lambda: self._remove_task(task.id)
+        self._sync_rows(
+            self._task_row_pool, TaskRowWidgets, self._tasks_container, tasks,
+            self._toggle_task_completion, self._remove_task
         )
-        remove_btn.pack(side="right")
     
-    def _render_time_blocks(self):
-        """Render time blocks section."""
+    def _sync_rows(self, pool: list, row_class, parent, items: list, *callbacks):
+        """Show one pooled row per item, creating rows only when the pool runs short."""
+        for index, item in enumerate(items):
+            if index == len(pool):
+                pool.append(row_class(parent))
+            pool[index].show(item, *callbacks)
+        
+        # Hide surplus rows but keep them for the next refresh
+        for row in pool[len(items):]:
+            row.hide()
+    
+    def _create_time_blocks(self):
+        """Create time blocks section."""
         section = ctk.CTkFrame(self.content, fg_color=("white", "#2D2D2D"), corner_radius=12)
         section.pack(fill="x", pady=(0, 16))
         
@@ -239,7 +320,7 @@ class DailyPlannerView(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="⏰ Time Blocks",
-            font=("Segoe UI", 16, "bold")
+            font=FONT_H2
         ).pack(side="left")
         
         # Add time block button
@@ -249,135 +330,93 @@ class DailyPlannerView(ctk.CTkFrame):
             command=self._add_time_block,
             width=110,
             height=30,
-            font=("Segoe UI", 12)
+            font=FONT_SMALL
         ).pack(side="right")
         
         # Time blocks list
-        blocks_container = ctk.CTkFrame(section, fg_color="transparent")
-        blocks_container.pack(fill="x", padx=16, pady=(0, 16))
-        
-        if not self.current_plan.time_blocks:
-            ctk.CTkLabel(
-                blocks_container,
-                text="No time blocks yet",
-                font=("Segoe UI", 12),
-                text_color="gray60"
-            ).pack(pady=8)
-        else:
-            for block in sorted(self.current_plan.time_blocks, key=lambda b: b.start_time):
-                self._render_time_block(blocks_container, block)
-    
-    def _render_time_block(self, parent, block: TimeBlock):
-        """Render a single time block."""
-        item = ctk.CTkFrame(parent, fg_color=("#F5F5F0", "#3A3A3A"), corner_radius=8)
-        item.pack(fill="x", pady=4)
-        
-        content = ctk.CTkFrame(item, fg_color="transparent")
-        content.pack(fill="x", padx=12, pady=10)
+        self._blocks_container = ctk.CTkFrame(section, fg_color="transparent")
+        self._blocks_container.pack(fill="x", padx=16, pady=(0, 16))
         
-        # Checkbox
-        checkbox = ctk.CTkCheckBox(
-            content,
-            text="",
-            width=20,
-            command=lambda: self._toggle_block_completion(block)
+        self._blocks_empty_label = ctk.CTkLabel(
+            self._blocks_container,
+            text="No time blocks yet",
+            font=FONT_SMALL,
+            text_color="gray60"
         )
-        if block.completed:
-            checkbox.select()
-        checkbox.pack(side="left", padx=(0, 12))
-        
-        # Time and activity
-        info_frame = ctk.CTkFrame(content, fg_color="transparent")
-        info_frame.pack(side="left", fill="x", expand=True)
-        
-        ctk.CTkLabel(
-            info_frame,
-            text=f"{block.start_time} - {block.end_time}",
-            font=("Segoe UI", 12, "bold")
-        ).pack(anchor="w")
+        self._block_row_pool: List[TimeBlockRowWidgets] = []
+    
+    def _refresh_blocks_section(self):
+        """Update the time block rows, reusing pooled row widgets."""
+        blocks = self.current_plan.time_blocks
         
-        ctk.CTkLabel(
-            info_frame,
-            text=block.activity,
-            font=("Segoe UI", 12),
-            text_color="gray60"
-        ).pack(anchor="w")
+        if blocks:
+            self._blocks_empty_label.pack_forget()
+        else:
+            self._blocks_empty_label.pack(pady=8)
         
-        # Delete button
-        delete_btn = ctk.CTkButton(
-            content,
-            text="×",
-            width=30,
-            height=30,
-            corner_radius=15,
-            fg_color="transparent",
-            hover_color=("gray85", "gray25"),
-            font=("Segoe UI", 18),
-            command=lambda: self._delete_time_block(block.id)
+        self._sync_rows(
+            self._block_row_pool, TimeBlockRowWidgets, self._blocks_container, blocks,
+            self._toggle_block_completion, self._delete_time_block
         )
-        delete_btn.pack(side="right")
     
-    def _render_notes(self):
-        """Render notes section."""
+    def _create_notes(self):
+        """Create notes section."""
         section = ctk.CTkFrame(self.content, fg_color=("white", "#2D2D2D"), corner_radius=12)
         section.pack(fill="x", pady=(0, 16))
         
         ctk.CTkLabel(
             section,
             text="📝 Notes",
-            font=("Segoe UI", 16, "bold")
+            font=FONT_H2
         ).pack(anchor="w", padx=16, pady=(16, 8))
         
         self.notes_text = ctk.CTkTextbox(
             section,
-            font=("Segoe UI", 13),
+            font=FONT_BODY,
             height=100
         )
         self.notes_text.pack(fill="x", padx=16, pady=(0, 16))
         
-        if self.current_plan.notes:
-            self.notes_text.insert("1.0", self.current_plan.notes)
-        
         # Auto-save on focus out
-        self.notes_text.bind("<FocusOut>", lambda e: self._save_plan())
+        self.notes_text.bind("<FocusOut>", lambda e: self._schedule_save())
+        self.notes_text.bind("<<Modified>>", self._on_notes_modified)
     
-    def _render_mood(self):
-        """Render mood tracker."""
+    def _on_notes_modified(self, event=None):
+        """Remember that the notes changed so saves only copy them when needed."""
+        if self.notes_text.edit_modified():
+            self._notes_dirty = True
+            # Reset the flag so the next edit fires <<Modified>> again
+            self.notes_text.edit_modified(False)
+    
+    def _create_mood(self):
+        """Create mood tracker."""
         section = ctk.CTkFrame(self.content, fg_color=("white", "#2D2D2D"), corner_radius=12)
         section.pack(fill="x", pady=(0, 16))
         
         ctk.CTkLabel(
             section,
             text="😊 How are you feeling?",
-            font=("Segoe UI", 16, "bold")
+            font=FONT_H2
         ).pack(anchor="w", padx=16, pady=(16, 8))
         
         moods_frame = ctk.CTkFrame(section, fg_color="transparent")
         moods_frame.pack(fill="x", padx=16, pady=(0, 16))
         
-        moods = [
-            ("excellent", "😊"),
-            ("good", "🙂"),
-            ("neutral", "😐"),
-            ("tired", "😴"),
-            ("stressed", "😓")
-        ]
-        
-        self.mood_var = ctk.StringVar(value=self.current_plan.mood or "")
+        self.mood_var = ctk.StringVar(value="")
         
-        for value, emoji in moods:
+        for value, emoji in MOODS:
             radio = ctk.CTkRadioButton(
                 moods_frame,
                 text=emoji,
                 variable=self.mood_var,
                 value=value,
-                font=("Segoe UI", 24),
-                command=self._save_plan
+                font=FONT_EMOJI,
+                command=self._schedule_save
             )
             radio.pack(side="left", padx=8)
     
-    def _render_stats(self):
-        """Render daily stats."""
+    def _create_stats(self):
+        """Create daily stats."""
         section = ctk.CTkFrame(self.content, fg_color=("white", "#2D2D2D"), corner_radius=12)
         section.pack(fill="x")
         
@@ -385,61 +424,65 @@ class DailyPlannerView(ctk.CTkFrame):
         stats_frame.pack(fill="x", padx=16, pady=16)
         
         # Task completion
-        all_tasks = {t.id: t for t in self.storage.get_all_tasks()}
-        completed_tasks = sum(1 for tid in self.current_plan.tasks 
-                             if tid in all_tasks and all_tasks[tid].status == "completed")
-        total_tasks = len(self.current_plan.tasks)
-        
         task_stat = ctk.CTkFrame(stats_frame, fg_color="transparent")
         task_stat.pack(side="left", expand=True)
         
-        ctk.CTkLabel(
+        self._tasks_stat_label = ctk.CTkLabel(
             task_stat,
-            text=f"{completed_tasks}/{total_tasks}",
-            font=("Segoe UI", 24, "bold")
-        ).pack()
+            text="",
+            font=FONT_STAT
+        )
+        self._tasks_stat_label.pack()
         
         ctk.CTkLabel(
             task_stat,
             text="Tasks Completed",
-            font=("Segoe UI", 12),
+            font=FONT_SMALL,
             text_color="gray60"
         ).pack()
         
         # Time blocks completion
-        completed_blocks, total_blocks = self.current_plan.time_blocks_progress
-        
         block_stat = ctk.CTkFrame(stats_frame, fg_color="transparent")
         block_stat.pack(side="left", expand=True)
         
-        ctk.CTkLabel(
+        self._blocks_stat_label = ctk.CTkLabel(
             block_stat,
-            text=f"{completed_blocks}/{total_blocks}",
-            font=("Segoe UI", 24, "bold")
-        ).pack()
+            text="",
+            font=FONT_STAT
+        )
+        self._blocks_stat_label.pack()
         
         ctk.CTkLabel(
             block_stat,
             text="Blocks Completed",
-            font=("Segoe UI", 12),
+            font=FONT_SMALL,
             text_color="gray60"
         ).pack()
     
+    def _refresh_stats(self):
+        """Update the stats label text in place."""
+        total_tasks = len(self.current_plan.tasks)
+        self._tasks_stat_label.configure(text=f"{self._completed_tasks_count}/{total_tasks}")
+        
+        completed_blocks, total_blocks = self.current_plan.time_blocks_progress
+        self._blocks_stat_label.configure(text=f"{completed_blocks}/{total_blocks}")
+    
     def _previous_day(self):
         """Navigate to previous day."""
-        date_obj = datetime.fromisoformat(self.current_date)
-        self.current_date = (date_obj - timedelta(days=1)).strftime("%Y-%m-%d")
-        self.refresh()
+        self._set_current_date(self._current_date_obj - timedelta(days=1))
     
     def _next_day(self):
         """Navigate to next day."""
-        date_obj = datetime.fromisoformat(self.current_date)
-        self.current_date = (date_obj + timedelta(days=1)).strftime("%Y-%m-%d")
-        self.refresh()
+        self._set_current_date(self._current_date_obj + timedelta(days=1))
     
     def _go_to_today(self):
         """Navigate to today."""
-        self.current_date = datetime.now().strftime("%Y-%m-%d")
+        self._set_current_date(date.today())
+    
+    def _set_current_date(self, new_date: date):
+        """Switch the planner to another date."""
+        self._current_date_obj = new_date
+        self.current_date = new_date.isoformat()
         self.refresh()
     
     def _show_add_task_menu(self):
@@ -454,69 +497,248 @@ class DailyPlannerView(ctk.CTkFrame):
         dialog.transient(self)
         dialog.grab_set()
         
-        ctk.CTkLabel(dialog, text="Select a task:", font=("Segoe UI", 14, "bold")).pack(padx=20, pady=(20, 10))
+        ctk.CTkLabel(dialog, text="Select a task:", font=FONT_DIALOG_TITLE).pack(padx=20, pady=(20, 10))
         
-        # Scrollable task list
-        task_list = ctk.CTkScrollableFrame(dialog, fg_color="transparent")
+        # Virtualized task list - only visible rows get a button
+        items = [
+            (task.title, partial(self._add_task_to_plan, task.id, dialog))
+            for task in self.available_tasks
+            if task.id not in self.current_plan.tasks
+        ]
+        task_list = VirtualButtonList(
+            dialog,
+            items=items,
+            button_kwargs={
+                "anchor": "w",
+                "fg_color": "transparent",
+                "hover_color": ("gray85", "gray25")
+            }
+        )
         task_list.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        
-        for task in self.available_tasks:
-            if task.id not in self.current_plan.tasks:
-                btn = ctk.CTkButton(
-                    task_list,
-                    text=task.title,
-                    command=lambda t=task: self._add_task_to_plan(t.id, dialog),
-                    anchor="w",
-                    fg_color="transparent",
-                    hover_color=("gray85", "gray25")
-                )
-                btn.pack(fill="x", pady=2)
     
     def _add_task_to_plan(self, task_id: str, dialog):
         """Add task to daily plan."""
         self.current_plan.add_task(task_id)
-        self._save_plan()
+        self._mark_dirty()
         dialog.destroy()
-        self.refresh()
+        self._refresh_tasks_section()
+        self._refresh_stats()
     
     def _remove_task(self, task_id: str):
         """Remove task from daily plan."""
         self.current_plan.remove_task(task_id)
-        self._save_plan()
-        self.refresh()
+        self._mark_dirty()
+        self._refresh_tasks_section()
+        self._refresh_stats()
     
-    def _toggle_task_completion(self, task: Task):
+    def _toggle_task_completion(self, task: Task, checkbox: ctk.CTkCheckBox):
         """Toggle task completion status."""
-        new_status = "completed" if task.status != "completed" else "todo"
-        task.update(status=new_status)
+        completed = task.status != "completed"
+        task.update(status="completed" if completed else "todo")
         self.storage.save_task(task)
-        self.refresh()
+        self._update_available_tasks()
+        
+        # Only the clicked row and the counters change
+        if completed:
+            checkbox.select()
+            self._completed_tasks_count += 1
+        else:
+            checkbox.deselect()
+            self._completed_tasks_count -= 1
+        self._refresh_stats()
     
     def _add_time_block(self):
         """Show dialog to add time block."""
-        TimeBlockDialog(self, self.current_plan, self.storage, self.refresh)
+        TimeBlockDialog(self, self.current_plan, self.storage, self._on_blocks_changed)
     
     def _delete_time_block(self, block_id: str):
         """Delete a time block."""
         self.current_plan.remove_time_block(block_id)
-        self._save_plan()
-        self.refresh()
+        self._mark_dirty()
+        self._on_blocks_changed()
     
-    def _toggle_block_completion(self, block: TimeBlock):
+    def _toggle_block_completion(self, block: TimeBlock, checkbox: ctk.CTkCheckBox):
         """Toggle time block completion."""
         block.completed = not block.completed
-        self._save_plan()
-        self.refresh()
+        self._mark_dirty()
+        
+        if block.completed:
+            checkbox.select()
+        else:
+            checkbox.deselect()
+        self._refresh_stats()
+    
+    def _on_blocks_changed(self):
+        """Refresh the sections that depend on time blocks."""
+        self._refresh_blocks_section()
+        self._refresh_stats()
+    
+    def _schedule_save(self):
+        """Save the plan shortly, coalescing bursts of focus/mood changes."""
+        if self._save_after_id:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(SAVE_DELAY_MS, self._save_plan)
+    
+    def _mark_dirty(self):
+        """Record an in-memory plan change and schedule a batched write."""
+        self._plan_dirty = True
+        self._schedule_save()
+    
+    def _flush_save(self):
+        """Write pending plan changes immediately."""
+        if self._save_after_id:
+            self.after_cancel(self._save_after_id)
+            self._save_plan()
+        elif self._plan_dirty:
+            self._save_plan()
+    
+    def destroy(self):
+        """Flush pending saves before the view goes away."""
+        self._flush_save()
+        super().destroy()
     
     def _save_plan(self):
         """Save current plan."""
+        self._save_after_id = None
+        self._plan_dirty = False
+        
         # Update from UI
         self.current_plan.focus_goal = self.focus_entry.get()
-        self.current_plan.notes = self.notes_text.get("1.0", "end-1c")
+        if self._notes_dirty:
+            self.current_plan.notes = self.notes_text.get("1.0", "end-1c")
+            self._notes_dirty = False
         self.current_plan.mood = self.mood_var.get() if self.mood_var.get() else None
         
         # Save to storage
         self.storage.save_daily_plan(self.current_plan)
+        self._cache_plan(self.current_plan)
+
+
+class TaskRowWidgets:
+    """Reusable widgets for one scheduled task row."""
+    
+    __slots__ = ("frame", "visible", "checkbox", "remove_btn")
+    
+    def __init__(self, parent):
+        self.frame = ctk.CTkFrame(parent, fg_color=("#F5F5F0", "#3A3A3A"), corner_radius=8)
+        self.visible = False
+        
+        content = ctk.CTkFrame(self.frame, fg_color="transparent")
+        content.pack(fill="x", padx=12, pady=10)
+        
+        # Checkbox
+        self.checkbox = ctk.CTkCheckBox(
+            content,
+            text="",
+            font=FONT_BODY
+        )
+        self.checkbox.pack(side="left", fill="x", expand=True)
+        
+        # Remove button
+        self.remove_btn = ctk.CTkButton(
+            content,
+            text="×",
+            width=30,
+            height=30,
+            corner_radius=15,
+            fg_color="transparent",
+            hover_color=("gray85", "gray25"),
+            font=FONT_ICON
+        )
+        self.remove_btn.pack(side="right")
+    
+    def show(self, task: Task, on_toggle: callable, on_remove: callable):
+        """Bind the row to a task and make it visible."""
+        self.checkbox.configure(text=task.title, command=partial(on_toggle, task, self.checkbox))
+        if task.status == "completed":
+            self.checkbox.select()
+        else:
+            self.checkbox.deselect()
+        self.remove_btn.configure(command=partial(on_remove, task.id))
+        
+        if not self.visible:
+            self.frame.pack(fill="x", pady=4)
+            self.visible = True
+    
+    def hide(self):
+        """Hide the row without destroying it."""
+        if self.visible:
+            self.frame.pack_forget()
+            self.visible = False
+
+
+class TimeBlockRowWidgets:
+    """Reusable widgets for one time block row."""
+    
+    __slots__ = ("frame", "visible", "checkbox", "time_label", "activity_label", "delete_btn")
+    
+    def __init__(self, parent):
+        self.frame = ctk.CTkFrame(parent, fg_color=("#F5F5F0", "#3A3A3A"), corner_radius=8)
+        self.visible = False
+        
+        content = ctk.CTkFrame(self.frame, fg_color="transparent")
+        content.pack(fill="x", padx=12, pady=10)
+        
+        # Checkbox
+        self.checkbox = ctk.CTkCheckBox(
+            content,
+            text="",
+            width=20
+        )
+        self.checkbox.pack(side="left", padx=(0, 12))
+        
+        # Time and activity
+        info_frame = ctk.CTkFrame(content, fg_color="transparent")
+        info_frame.pack(side="left", fill="x", expand=True)
+        
+        self.time_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=FONT_SMALL_BOLD
+        )
+        self.time_label.pack(anchor="w")
+        
+        self.activity_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=FONT_SMALL,
+            text_color="gray60"
+        )
+        self.activity_label.pack(anchor="w")
+        
+        # Delete button
+        self.delete_btn = ctk.CTkButton(
+            content,
+            text="×",
+            width=30,
+            height=30,
+            corner_radius=15,
+            fg_color="transparent",
+            hover_color=("gray85", "gray25"),
+            font=FONT_ICON
+        )
+        self.delete_btn.pack(side="right")
+    
+    def show(self, block: TimeBlock, on_toggle: callable, on_delete: callable):
+        """Bind the row to a time block and make it visible."""
+        self.checkbox.configure(command=partial(on_toggle, block, self.checkbox))
+        if block.completed:
+            self.checkbox.select()
+        else:
+            self.checkbox.deselect()
+        self.time_label.configure(text=f"{block.start_time} - {block.end_time}")
+        self.activity_label.configure(text=block.activity)
+        self.delete_btn.configure(command=partial(on_delete, block.id))
+        
+        if not self.visible:
+            self.frame.pack(fill="x", pady=4)
+            self.visible = True
+    
+    def hide(self):
+        """Hide the row without destroying it."""
+        if self.visible:
+            self.frame.pack_forget()
+            self.visible = False
 
 
 class TimeBlockDialog(ctk.CTkToplevel):
@@ -543,18 +765,18 @@ class TimeBlockDialog(ctk.CTkToplevel):
         container.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Start time
-        ctk.CTkLabel(container, text="Start Time (HH:MM)", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.start_entry = ctk.CTkEntry(container, placeholder_text="09:00", font=("Segoe UI", 13))
+        ctk.CTkLabel(container, text="Start Time (HH:MM)", font=FONT_BODY_BOLD).pack(anchor="w", pady=(0, 4))
+        self.start_entry = ctk.CTkEntry(container, placeholder_text="09:00", font=FONT_BODY)
         self.start_entry.pack(fill="x", pady=(0, 16))
         
         # End time
-        ctk.CTkLabel(container, text="End Time (HH:MM)", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.end_entry = ctk.CTkEntry(container, placeholder_text="11:00", font=("Segoe UI", 13))
+        ctk.CTkLabel(container, text="End Time (HH:MM)", font=FONT_BODY_BOLD).pack(anchor="w", pady=(0, 4))
+        self.end_entry = ctk.CTkEntry(container, placeholder_text="11:00", font=FONT_BODY)
         self.end_entry.pack(fill="x", pady=(0, 16))
         
         # Activity
-        ctk.CTkLabel(container, text="Activity", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.activity_entry = ctk.CTkEntry(container, placeholder_text="Development work", font=("Segoe UI", 13))
+        ctk.CTkLabel(container, text="Activity", font=FONT_BODY_BOLD).pack(anchor="w", pady=(0, 4))
+        self.activity_entry = ctk.CTkEntry(container, placeholder_text="Development work", font=FONT_BODY)
         self.activity_entry.pack(fill="x", pady=(0, 16))
         
         # Buttons
@@ -0,0 +1,270 @@
+"""
+Project creation/edit form dialog.
+"""
+import customtkinter as ctk
+import logging
+from typing import Optional, Callable
+
+from models.project import Project
+from ui.components.common import IconButton
+from config import PROJECT_STATUS, PRIORITY_LEVELS, PROJECT_COLORS
+
+log = logging.getLogger(__name__)
+
+# Color picker swatch geometry
+_SWATCH_SIZE = 30
+_SWATCH_STEP = 38
+
+# Option menu labels and the stored values they map to
+_STATUS_DISPLAY = tuple(s.capitalize() for s in PROJECT_STATUS)
+_STATUS_TO_DISPLAY = dict(zip(PROJECT_STATUS, _STATUS_DISPLAY))
+_STATUS_FROM_DISPLAY = dict(zip(_STATUS_DISPLAY, PROJECT_STATUS))
+_PRIORITY_DISPLAY = tuple(p.capitalize() for p in PRIORITY_LEVELS)
+_PRIORITY_TO_DISPLAY = dict(zip(PRIORITY_LEVELS, _PRIORITY_DISPLAY))
+_PRIORITY_FROM_DISPLAY = dict(zip(_PRIORITY_DISPLAY, PRIORITY_LEVELS))
+
+
+class ProjectFormDialog(ctk.CTkToplevel):
+    """
+    Project creation/edit form dialog.
+    Closing hides the window so the same dialog can be reset() and shown again.
+    """
+    
+    def __init__(self, parent, storage_manager, project: Optional[Project] = None,
+                 on_save: Optional[Callable[[Project], None]] = None):
+        super().__init__(parent)
+        
+        self.storage = storage_manager
+        self.on_save = on_save or storage_manager.save_project
+        
+        # Configure window
+        self.geometry("600x700")
+        self.resizable(False, False)
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        
+        self._create_ui()
+        self.reset(project)
+    
+    def reset(self, project: Optional[Project] = None):
+        """Clear the form and show it as a modal for a new or existing project."""
+        self.project = project
+        self.result = None
+        self.title("New Project" if not project else "Edit Project")
+        
+        self.name_entry.delete(0, "end")
+        self.desc_text.delete("1.0", "end")
+        self.status_menu.set(_STATUS_DISPLAY[0])
+        self.priority_menu.set(_PRIORITY_DISPLAY[0])
+        self._select_color(PROJECT_COLORS[0])
+        self.repo_entry.delete(0, "end")
+        self.tech_entry.delete(0, "end")
+        self.notes_text.delete("1.0", "end")
+        
+        # Populate if editing
+        if project:
+            self._populate_fields()
+        
+        # Make modal
+        self.deiconify()
+        self.grab_set()
+    
+    def close(self):
+        """Hide the dialog and release the modal grab."""
+        self.grab_release()
+        self.withdraw()
+    
+    def _create_ui(self):
+        """Create form UI."""
+        # Main container
+        container = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        container.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Name
+        ctk.CTkLabel(container, text="Project Name *", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
+        self.name_entry = ctk.CTkEntry(container, font=("Segoe UI", 13), height=40)
+        self.name_entry.pack(fill="x", pady=(0, 16))
+        
+        # Description
+        ctk.CTkLabel(container, text="Description", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
+        self.desc_text = ctk.CTkTextbox(container, font=("Segoe UI", 13), height=100)
+        self.desc_text.pack(fill="x", pady=(0, 16))
+        
+        # Status and Priority row
+        row1 = ctk.CTkFrame(container, fg_color="transparent")
+        row1.pack(fill="x", pady=(0, 16))
+        
+        # Status
+        status_frame = ctk.CTkFrame(row1, fg_color="transparent")
+        status_frame.pack(side="left", fill="x", expand=True, padx=(0, 8))
+        ctk.CTkLabel(status_frame, text="Status", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
+        self.status_menu = ctk.CTkOptionMenu(
+            status_frame,
+            values=list(_STATUS_DISPLAY),
+            font=("Segoe UI", 13)
+        )
+        self.status_menu.pack(fill="x")
+        
+        # Priority
+        priority_frame = ctk.CTkFrame(row1, fg_color="transparent")
+        priority_frame.pack(side="left", fill="x", expand=True, padx=(8, 0))
+        ctk.CTkLabel(priority_frame, text="Priority", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
+        self.priority_menu = ctk.CTkOptionMenu(
+            priority_frame,
+            values=list(_PRIORITY_DISPLAY),
+            font=("Segoe UI", 13)
+        )
+        self.priority_menu.pack(fill="x")
+        
+        # Color picker
+        ctk.CTkLabel(container, text="Project Color", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
+        self._color_canvas = ctk.CTkCanvas(
+            container,
+            width=len(PROJECT_COLORS) * _SWATCH_STEP,
+            height=_SWATCH_STEP,
+            bg=self._apply_appearance_mode(self.cget("fg_color")),
+            highlightthickness=0,
+            cursor="hand2"
+        )
+        self._color_canvas.pack(anchor="w", pady=(0, 16))
+        self._color_canvas.bind("<Button-1>", self._on_color_click)
+        
+        self._draw_color_swatches()
+        
+        # Repository URL
+        ctk.CTkLabel(container, text="Repository URL", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
+        self.repo_entry = ctk.CTkEntry(container, font=("Segoe UI", 13), height=40)
+        self.repo_entry.pack(fill="x", pady=(0, 16))
+        
+        # Tech stack
+        ctk.CTkLabel(container, text="Tech Stack (comma-separated)", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
+        self.tech_entry = ctk.CTkEntry(container, font=("Segoe UI", 13), height=40)
+        self.tech_entry.pack(fill="x", pady=(0, 16))
+        
+        # Notes
+        ctk.CTkLabel(container, text="Notes", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
+        self.notes_text = ctk.CTkTextbox(container, font=("Segoe UI", 13), height=100)
+        self.notes_text.pack(fill="x", pady=(0, 16))
+        
+        # Buttons
+        buttons_frame = ctk.CTkFrame(self, fg_color="transparent")
+        buttons_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        cancel_btn = IconButton(
+            buttons_frame,
+            text="Cancel",
+            command=self.close,
+            fg_color="gray70",
+            hover_color="gray60"
+        )
+        cancel_btn.pack(side="right", padx=(8, 0))
+        
+        save_btn = IconButton(
+            buttons_frame,
+            text="Save Project",
+            command=self._on_save,
+            fg_color=("#E07B53", "#F4A261"),
+            hover_color=("#D06B43", "#E49251"),
+            text_color="white",
+            font=("Segoe UI", 13, "bold")
+        )
+        save_btn.pack(side="right")
+    
+    def _draw_color_swatches(self):
+        """Draw one circle per project color on the picker canvas."""
+        inset = (_SWATCH_STEP - _SWATCH_SIZE) // 2
+        for i, color in enumerate(PROJECT_COLORS):
+            x = i * _SWATCH_STEP + inset
+            self._color_canvas.create_oval(
+                x, inset, x + _SWATCH_SIZE, inset + _SWATCH_SIZE,
+                fill=color, outline="", tags=("swatch", f"c{i}")
+            )
+        
+        # One selection ring, moved between swatches instead of redrawn
+        self._ring = self._color_canvas.create_oval(
+            1, 1, _SWATCH_STEP - 1, _SWATCH_STEP - 1,
+            outline=self._apply_appearance_mode(("#202124", "#E8EAED")),
+            width=2, state="hidden"
+        )
+    
+    def _on_color_click(self, event):
+        """Select the color under the pointer."""
+        index = int(self._color_canvas.canvasx(event.x) // _SWATCH_STEP)
+        if 0 <= index < len(PROJECT_COLORS):
+            self._select_color(PROJECT_COLORS[index])
+    
+    def _select_color(self, color: str):
+        """Select project color and ring its swatch."""
+        self.selected_color = color
+        if color not in PROJECT_COLORS:
+            self._color_canvas.itemconfigure(self._ring, state="hidden")
+            return
+        x = PROJECT_COLORS.index(color) * _SWATCH_STEP
+        self._color_canvas.coords(self._ring, x + 1, 1, x + _SWATCH_STEP - 1, _SWATCH_STEP - 1)
+        self._color_canvas.itemconfigure(self._ring, state="normal")
+    
+    def _populate_fields(self):
+        """Populate form with existing project data."""
+        if not self.project:
+            return
+        
+        self.name_entry.insert(0, self.project.name)
+        self.desc_text.insert("1.0", self.project.description)
+        self.status_menu.set(_STATUS_TO_DISPLAY[self.project.status])
+        self.priority_menu.set(_PRIORITY_TO_DISPLAY[self.project.priority])
+        self._select_color(self.project.color)
+        
+        if self.project.repository_url:
+            self.repo_entry.insert(0, self.project.repository_url)
+        
+        if self.project.tech_stack:
+            self.tech_entry.insert(0, ", ".join(self.project.tech_stack))
+        
+        if self.project.notes:
+            self.notes_text.insert("1.0", self.project.notes)
+    
+    def _on_save(self):
+        """Handle save button."""
+        # Validate
+        name = self.name_entry.get().strip()
+        if not name:
+            # TODO: Show error message
+            return
+        
+        # Create or update project
+        if self.project:
+            # Update existing
+            self.project.update(
+                name=name,
+                description=self.desc_text.get("1.0", "end-1c").strip(),
+                status=_STATUS_FROM_DISPLAY[self.status_menu.get()],
+                priority=_PRIORITY_FROM_DISPLAY[self.priority_menu.get()],
+                color=self.selected_color,
+                repository_url=self.repo_entry.get().strip() or None,
+                tech_stack=[t.strip() for t in self.tech_entry.get().split(",") if t.strip()],
+                notes=self.notes_text.get("1.0", "end-1c").strip()
+            )
+        else:
+            # Create new
+            self.project = Project(
+                name=name,
+                description=self.desc_text.get("1.0", "end-1c").strip(),
+                status=_STATUS_FROM_DISPLAY[self.status_menu.get()],
+                priority=_PRIORITY_FROM_DISPLAY[self.priority_menu.get()],
+                color=self.selected_color,
+                repository_url=self.repo_entry.get().strip() or None,
+                tech_stack=[t.strip() for t in self.tech_entry.get().split(",") if t.strip()],
+                notes=self.notes_text.get("1.0", "end-1c").strip()
+            )
+        
+        # Validate
+        valid, error = self.project.validate()
+        if not valid:
+            # TODO: Show error message
+            log.warning("Validation error: %s", error)
+            return
+        
+        # Save to storage
+        self.on_save(self.project)
+        self.result = self.project
+        self.close()
@@ -2,24 +2,90 @@
 Project management view with dashboard, creation, and detail views.
 """
 import customtkinter as ctk
-from typing import Optional, List, Callable
+import logging
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from PIL import Image, ImageDraw
+from typing import Optional, List, Dict, Tuple, Callable
 import sys
 sys.path.append('..')
 
 from models.project import Project, Milestone
 from ui.components.common import (
-    StatusBadge, ProgressBar, IconButton, SearchBar, EmptyState, PriorityIndicator
+    StatusBadge, ProgressBar, IconButton, SearchBar, EmptyState, PriorityIndicator, VirtualList,
+    set_gridded
 )
-from utils.helpers import truncate_text, time_ago
-from config import PROJECT_STATUS, PRIORITY_LEVELS, PROJECT_COLORS
+from ui.components.modern_components import TagChip, GradientProgress
+from utils.helpers import cached_time_ago
+from config import STATUS_GRADIENTS, FONT_FAMILY
+
+log = logging.getLogger(__name__)
+
+# Fonts
+FONT_TITLE = (FONT_FAMILY, 28, "bold")
+FONT_CARD_TITLE = (FONT_FAMILY, 18, "bold")
+FONT_BUTTON = (FONT_FAMILY, 14, "bold")
+FONT_BODY = (FONT_FAMILY, 13)
+FONT_BODY_BOLD = (FONT_FAMILY, 13, "bold")
+FONT_SMALL = (FONT_FAMILY, 12)
+
+# Card geometry used by the virtual projects list
+CARD_HEIGHT = 210
+CARD_SPACING = 24
+
+# Delays before a search burst or filter menu change re-filters the list
+SEARCH_DELAY_MS = 120
+FILTER_DELAY_MS = 50
+
+# Descriptions up to this length are shown inline next to the name
+SHORT_DESCRIPTION_LENGTH = 20
+
+# How often the UI checks for a finished background load
+LOAD_POLL_MS = 20
+
+# Number of recent filter results kept
+FILTER_CACHE_SIZE = 8
+
+# Card colors
+_STATUS_COLORS = {
+    "planning": "#4A90E2",
+    "active": "#27AE60",
+    "paused": "#F5A623",
+    "completed": "#81C995",
+    "archived": "#9B59B6"
+}
+_PRIORITY_COLORS = {"high": "#E74C3C", "medium": "#F5A623", "low": "#95a5a6"}
+_DEFAULT_GRADIENT = ("#4A90E2", "#357ABD")
+
+# Filter menu labels and the statuses they map to
+_FILTER_FROM_DISPLAY = {
+    "All": "all",
+    "Active": "active",
+    "Planning": "planning",
+    "Paused": "paused",
+    "Completed": "completed",
+    "Archived": "archived"
+}
+
+
+@lru_cache(maxsize=128)
+def _swatch(color: str, width: int, height: int, radius: int) -> ctk.CTkImage:
+    """Solid color swatch image, shared by every card using the same color."""
+    image = Image.new("RGBA", (width, height))
+    ImageDraw.Draw(image).rounded_rectangle((0, 0, width - 1, height - 1), radius=radius, fill=color)
+    return ctk.CTkImage(light_image=image, dark_image=image, size=(width, height))
 
 
 class ProjectCard(ctk.CTkFrame):
     """Modern project card component matching mockup design."""
     
-    def __init__(self, parent, project: Project, on_click: Callable, **kwargs):
+    def __init__(self, parent, project: Project, on_click: Callable,
+                 progress: Optional[float] = None, **kwargs):
         super().__init__(
             parent,
+            height=CARD_HEIGHT,
             corner_radius=16,
             fg_color=("white", "#1E1E1E"),
             border_width=1,
@@ -31,165 +97,164 @@ class ProjectCard(ctk.CTkFrame):
         self.on_click = on_click
         self.default_fg = ("white", "#1E1E1E")
         self.hover_fg = ("#F8F9FA", "#2A2A2A")
+        self._last_sig: Optional[tuple] = None
         
+        # Uniform height so the virtual list can position cards by index
+        self.grid_propagate(False)
         self._create_ui()
+        self.update_from(project, progress)
         
         # Make card clickable with hover effect
-        self.bind("<Button-1>", lambda e: on_click(project))
+        self.bind("<Button-1>", lambda e: self.on_click(self.project))
         self.bind("<Enter>", self._on_hover)
         self.bind("<Leave>", self._on_leave)
         self.configure(cursor="hand2")
     
     def _create_ui(self):
-        """Create modern card UI."""
-        # Thick color indicator bar (left side, 6px)
-        color_bar = ctk.CTkFrame(
-            self,
-            width=6,
-            fg_color=self.project.color,
-            corner_radius=0
-        )
-        color_bar.pack(side="left", fill="y")
+        """Create modern card UI, gridded directly into the card without wrapper frames."""
+        # Columns: name, short description (stretches), priority dot, status badge
+        self.grid_columnconfigure(1, weight=1)
         
-        # Main content area with generous padding
-        content = ctk.CTkFrame(self, fg_color="transparent")
-        content.pack(side="left", fill="both", expand=True, padx=24, pady=20)
+        # Thick color indicator bar (left side, 6px)
+        self._color_bar = ctk.CTkLabel(self, text="")
+        self._color_bar.place(x=0, y=1)
         
         # === HEADER ROW ===
-        header = ctk.CTkFrame(content, fg_color="transparent")
-        header.pack(fill="x", pady=(0, 12))
-        
         # Project name (larger, bolder)
-        name_label = ctk.CTkLabel(
-            header,
-            text=truncate_text(self.project.name, 35),
-            font=("Segoe UI", 18, "bold"),
+        self._name_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=FONT_CARD_TITLE,
             anchor="w"
         )
-        name_label.pack(side="left", fill="x", expand=True)
+        self._name_label.grid(row=0, column=0, sticky="w", padx=(30, 0), pady=(20, 12))
         
-        # Status badge (modern pill-style)
-        from ui.components.modern_components import TagChip
-        from config import STATUS_GRADIENTS
-        
-        status_colors = {
-            "planning": "#4A90E2",
-            "active": "#27AE60",
-            "paused": "#F5A623",
-            "completed": "#81C995",
-            "archived": "#9B59B6"
-        }
-        status_badge = TagChip(
-            header,
-            text=self.project.status.upper(),
-            color=status_colors.get(self.project.status, "#999999")
+        # Short descriptions sit next to the name instead of in a wrapping label
+        self._desc_suffix_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=FONT_BODY,
+            text_color=("#5F6368", "#9AA0A6"),
+            anchor="w"
         )
-        status_badge.pack(side="right", padx=(8, 0))
+        self._desc_suffix_label.grid(row=0, column=1, sticky="ew", padx=(8, 0), pady=(20, 12))
+        self._desc_suffix_label.grid_remove()
         
         # Priority indicator (color dot)
-        priority_colors = {"high": "#E74C3C", "medium": "#F5A623", "low": "#95a5a6"}
-        priority_dot = ctk.CTkFrame(
-            header,
-            width=10,
-            height=10,
-           corner_radius=5,
-            fg_color=priority_colors.get(self.project.priority, "#999999")
-        )
-        priority_dot.pack(side="right", padx=(0, 8))
+        self._priority_dot = ctk.CTkLabel(self, text="")
+        self._priority_dot.grid(row=0, column=2, padx=(0, 8), pady=(20, 12))
+        
+        # Status badge (modern pill-style)
+        self._status_badge = TagChip(self, text="")
+        self._status_badge.grid(row=0, column=3, sticky="e", padx=(0, 24), pady=(20, 12))
         
         # === DESCRIPTION ===
-        if self.project.description:
-            desc_label = ctk.CTkLabel(
-                content,
-                text=truncate_text(self.project.description, 100),
-                font=("Segoe UI", 13),
-                text_color=("#5F6368", "#9AA0A6"),
-                anchor="w",
-                justify="left",
-                wraplength=350
-            )
-            desc_label.pack(fill="x", pady=(0, 16))
+        self._desc_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=FONT_BODY,
+            text_color=("#5F6368", "#9AA0A6"),
+            anchor="w",
+            justify="left",
+            wraplength=350
+        )
+        self._desc_label.grid(row=1, column=0, columnspan=4, sticky="ew", padx=(30, 24), pady=(0, 16))
+        self._desc_label.grid_remove()
         
         # === PROGRESS BAR (Gradient) ===
-        progress_frame = ctk.CTkFrame(content, fg_color="transparent")
-        progress_frame.pack(fill="x", pady=(0, 16))
-        
-        from ui.components.modern_components import GradientProgress
-        from config import STATUS_GRADIENTS
-        
-        gradient = STATUS_GRADIENTS.get(self.project.status, ["#4A90E2", "#357ABD"])
-        progress_bar = GradientProgress(
-            progress_frame,
-            progress=self.project.progress_percentage,
-            gradient_colors=gradient,
-            height=10
-        )
-        progress_bar.pack(fill="x", side="left", expand=True)
+        self._progress_bar = GradientProgress(self, height=10)
+        self._progress_bar.grid(row=2, column=0, columnspan=3, sticky="ew", padx=(30, 0), pady=(0, 16))
         
         # Progress percentage label
-        progress_label = ctk.CTkLabel(
-            progress_frame,
-            text=f"{int(self.project.progress_percentage)}%",
-            font=("Segoe UI", 13, "bold"),
-            text_color=self.project.color,
+        self._progress_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=FONT_BODY_BOLD,
             width=50
         )
-        progress_label.pack(side="right", padx=(12, 0))
+        self._progress_label.grid(row=2, column=3, sticky="e", padx=(12, 24), pady=(0, 16))
         
-        # === META INFO ROW (Icons + Text) ===
-        meta_row = ctk.CTkFrame(content, fg_color="transparent")
-        meta_row.pack(fill="x")
-        
-        # Last updated
-        updated_icon = ctk.CTkLabel(
-            meta_row,
-            text="🕐",
-            font=("Segoe UI", 14)
+        # === META INFO ROW ===
+        self._meta_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=FONT_SMALL,
+            text_color=("#80868B", "#70757A"),
+            anchor="w"
+        )
+        self._meta_label.grid(row=3, column=0, columnspan=4, sticky="ew", padx=(30, 24))
+    
+    def preview_from(self, project: Project):
+        """Show just the header of a project while the list is scrolling."""
+        self.project = project
+        self._last_sig = None
+        self._configure_changed(self._color_bar, image=_swatch(project.color, 6, CARD_HEIGHT - 2, 0))
+        self._configure_changed(self._name_label, text=project.name_trunc35)
+        self._status_badge.set(project.status.upper(), _STATUS_COLORS.get(project.status, "#999999"))
+        self._configure_changed(
+            self._priority_dot,
+            image=_swatch(_PRIORITY_COLORS.get(project.priority, "#999999"), 10, 10, 5)
         )
-        updated_icon.pack(side="left")
+        set_gridded(self._desc_label, False)
+        set_gridded(self._desc_suffix_label, False)
         
-        updated_label = ctk.CTkLabel(
-            meta_row,
-            text=time_ago(self.project.updated_at),
-            font=("Segoe UI", 12),
-            text_color=("#80868B", "#70757A")
+        # Progress needs the full bind; empty the recycled card's bar until then
+        self._progress_bar.set_progress(0)
+        self._configure_changed(self._progress_label, text="")
+        self._configure_changed(self._meta_label, text="")
+    
+    def update_from(self, project: Project, progress: Optional[float] = None):
+        """Show another project by updating the existing widgets in place."""
+        self.project = project
+        if progress is None:
+            progress = project.progress_percentage
+        
+        # Projects re-entering the viewport unchanged need no widget work
+        time_ago = cached_time_ago(project.updated_at)
+        sig = (
+            project.id, project.name, project.description, project.status,
+            project.priority, project.color, progress, time_ago,
+            len(project.tech_stack), project.milestones_completed_count, len(project.milestones)
         )
-        updated_label.pack(side="left", padx=(4, 16))
-        
-        # Tech stack count (if available)
-        if self.project.tech_stack:
-            tech_icon = ctk.CTkLabel(
-                meta_row,
-                text="⚙️",
-                font=("Segoe UI", 14)
-            )
-            tech_icon.pack(side="left")
-            
-            tech_label = ctk.CTkLabel(
-                meta_row,
-                text=f"{len(self.project.tech_stack)} tech",
-                font=("Segoe UI", 12),
-                text_color=("#80868B", "#70757A")
-            )
-            tech_label.pack(side="left", padx=(4, 16))
-        
-        # Milestones count
-        if self.project.milestones:
-            milestone_icon = ctk.CTkLabel(
-                meta_row,
-                text="🎯",
-                font=("Segoe UI", 14)
-            )
-            milestone_icon.pack(side="left")
-            
-            completed_milestones = sum(1 for m in self.project.milestones if m.completed)
-            milestone_label = ctk.CTkLabel(
-                meta_row,
-                text=f"{completed_milestones}/{len(self.project.milestones)} milestones",
-                font=("Segoe UI", 12),
-                text_color=("#80868B", "#70757A")
-            )
-            milestone_label.pack(side="left", padx=(4, 0))
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+        
+        self._configure_changed(self._color_bar, image=_swatch(project.color, 6, CARD_HEIGHT - 2, 0))
+        self._configure_changed(self._name_label, text=project.name_trunc35)
+        self._status_badge.set(project.status.upper(), _STATUS_COLORS.get(project.status, "#999999"))
+        self._configure_changed(
+            self._priority_dot,
+            image=_swatch(_PRIORITY_COLORS.get(project.priority, "#999999"), 10, 10, 5)
+        )
+        
+        description = project.description or ""
+        long_description = len(description) > SHORT_DESCRIPTION_LENGTH
+        if long_description:
+            self._configure_changed(self._desc_label, text=project.desc_trunc100)
+        set_gridded(self._desc_label, long_description)
+        
+        if description and not long_description:
+            self._configure_changed(self._desc_suffix_label, text=description)
+        set_gridded(self._desc_suffix_label, bool(description) and not long_description)
+        
+        self._progress_bar.set_gradient(STATUS_GRADIENTS.get(project.status, _DEFAULT_GRADIENT))
+        self._progress_bar.set_progress(progress)
+        self._configure_changed(self._progress_label, text=f"{int(progress)}%", text_color=project.color)
+        
+        meta_text = f"🕐 {time_ago}"
+        if project.tech_stack:
+            meta_text += f"   ⚙️ {len(project.tech_stack)} tech"
+        if project.milestones:
+            meta_text += f"   🎯 {project.milestones_completed_count}/{len(project.milestones)} milestones"
+        self._configure_changed(self._meta_label, text=meta_text)
+    
+    @staticmethod
+    def _configure_changed(widget, **kwargs):
+        """Configure only the options that differ, skipping CTk's redraw and image callbacks otherwise."""
+        changed = {key: value for key, value in kwargs.items() if widget.cget(key) != value}
+        if changed:
+            widget.configure(**changed)
     
     def _on_hover(self, event):
         """Handle hover effect."""
@@ -200,7 +265,7 @@ class ProjectCard(ctk.CTkFrame):
         self.configure(fg_color=self.default_fg)
 
 
-class ProjectsView(ctk.CTkScrollableFrame):
+class ProjectsView(ctk.CTkFrame):
     """Projects dashboard view."""
     
     def __init__(self, parent, storage_manager, **kwargs):
@@ -209,8 +274,24 @@ class ProjectsView(ctk.CTkScrollableFrame):
         self.storage = storage_manager
         self.projects: List[Project] = []
         self.filtered_projects: List[Project] = []
+        self._by_status: Dict[str, List[Project]] = defaultdict(list)
+        self._progress: Dict[str, float] = {}
+        self._last_status: Dict[str, str] = {}
+        self._search_indexes: Dict[str, Tuple[str, List[int], List[Project]]] = {}
+        self._projects_version = 0
+        self._filter_cache: OrderedDict = OrderedDict()
+        self._rendered_fingerprint = None
+        self._loaded_revision = None
+        self._pending_revision = None
+        self._form_dialog = None
         self.current_filter = "all"
         self.search_query = ""
+        self._filter_after_id: Optional[str] = None
+        
+        # Storage reads run on a worker thread so disk latency never blocks redraws
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._load_future: Optional[Future] = None
+        self._load_after_id: Optional[str] = None
         
         self._create_ui()
         self.refresh()
@@ -225,7 +306,7 @@ class ProjectsView(ctk.CTkScrollableFrame):
         title = ctk.CTkLabel(
             header,
             text="Projects",
-            font=("Segoe UI", 28, "bold")
+            font=FONT_TITLE
         )
         title.pack(side="left")
         
@@ -237,7 +318,7 @@ class ProjectsView(ctk.CTkScrollableFrame):
             fg_color=("#D93025", "#8AB4F8"),
             hover_color=("#C5221F", "#AECBFA"),
             text_color="white",
-            font=("Segoe UI", 14, "bold"),
+            font=FONT_BUTTON,
             height=44,
             corner_radius=12
         )
@@ -256,295 +337,264 @@ class ProjectsView(ctk.CTkScrollableFrame):
         self.search_bar.pack(side="left", fill="x", expand=True, padx=(0, 16))
         
         # Filter dropdown
-        filter_label = ctk.CTkLabel(filters_frame, text="Filter:", font=("Segoe UI", 13))
+        filter_label = ctk.CTkLabel(filters_frame, text="Filter:", font=FONT_BODY)
         filter_label.pack(side="left", padx=(0, 12))
         
         self.filter_menu = ctk.CTkOptionMenu(
             filters_frame,
-            values=["All", "Active", "Planning", "Paused", "Completed", "Archived"],
+            values=list(_FILTER_FROM_DISPLAY),
             command=self._on_filter_change,
             width=150,
-            font=("Segoe UI", 13),
+            font=FONT_BODY,
             corner_radius=10
         )
         self.filter_menu.pack(side="left")
         
-        # Projects grid container
-        self.projects_container = ctk.CTkFrame(self, fg_color="transparent")
-        self.projects_container.pack(fill="both", expand=True, padx=32, pady=(0, 24))
+        # Projects list; only cards inside the viewport are instantiated
+        self.projects_list = VirtualList(
+            self,
+            row_height=CARD_HEIGHT + CARD_SPACING,
+            create_row=self._create_card,
+            bind_row=self._bind_card,
+            overscan=2,
+            key=lambda project: project.id,
+            preview_row=ProjectCard.preview_from
+        )
+        self.projects_list.pack(fill="both", expand=True, padx=32, pady=(0, 24))
+        
+        self._loading_label = ctk.CTkLabel(
+            self.projects_list.viewport,
+            text="Loading projects…",
+            font=FONT_BODY,
+            text_color="gray"
+        )
+        # Empty states are built once per variant (searching or not) and reused
+        self._empty_states: Dict[bool, EmptyState] = {}
     
     def refresh(self):
-        """Refresh projects list from storage."""
-        self.projects = self.storage.get_all_projects()
+        """Refresh projects list from storage, skipping it when nothing was written."""
+        # Progress depends on tasks, so task writes also count as changes
+        revision = (self.storage.projects_revision, self.storage.tasks_revision)
+        if revision in (self._loaded_revision, self._pending_revision):
+            return
+        
+        if self._loaded_revision is None:
+            self._loading_label.place(relx=0.5, rely=0.3, anchor="center")
+        
+        self._pending_revision = revision
+        self._load_future = self._executor.submit(self._load_projects)
+        if self._load_after_id is not None:
+            self.after_cancel(self._load_after_id)
+        self._load_after_id = self.after(LOAD_POLL_MS, self._poll_load)
+    
+    def _load_projects(self) -> Tuple[List[Project], Dict[str, float]]:
+        """Read projects and their task progress; runs on the loader thread."""
+        projects = self.storage.get_all_projects()
+        return projects, self.storage.get_progress_batch([p.id for p in projects])
+    
+    def _poll_load(self):
+        """Apply the background load once it finishes."""
+        if not self._load_future.done():
+            self._load_after_id = self.after(LOAD_POLL_MS, self._poll_load)
+            return
+        
+        self._load_after_id = None
+        self._loading_label.place_forget()
+        self.projects, progress = self._load_future.result()
+        self._load_future = None
+        self._loaded_revision, self._pending_revision = self._pending_revision, None
+        
+        self._index_projects(progress)
         self._apply_filters()
         self._render_projects()
+        
+        # Storage may have been written while the load was running
+        self.refresh()
+    
+    def _index_projects(self, progress: Dict[str, float]):
+        """Build the progress map and status buckets used by the filters."""
+        self._by_status = defaultdict(list)
+        self._by_status["all"] = self.projects
+        self._progress = progress
+        self._last_status = {}
+        for project in self.projects:
+            # Projects without tasks fall back to milestone progress
+            if project.id not in self._progress:
+                self._progress[project.id] = project.progress_percentage
+            self._by_status[project.status].append(project)
+            self._last_status[project.id] = project.status
+        
+        self._invalidate_filters()
+    
+    def _invalidate_filters(self):
+        """Drop cached filter results and search text after the project list changed."""
+        self._projects_version += 1
+        self._filter_cache.clear()
+        self._search_indexes.clear()
+    
+    def _search_index(self, status: str) -> Tuple[str, List[int], List[Project]]:
+        """Packed search text, blob offsets and projects for one status bucket."""
+        index = self._search_indexes.get(status)
+        if index is None:
+            projects = self._by_status.get(status, [])
+            blobs = [f"{p.name}\x00{p.description or ''}".lower() for p in projects]
+            
+            # All blobs packed into one string so a search is a few C-level find() calls
+            offsets = []
+            offset = 0
+            for blob in blobs:
+                offsets.append(offset)
+                offset += len(blob) + 1
+            
+            index = self._search_indexes[status] = ("\x01".join(blobs), offsets, projects)
+        return index
+    
+    def _search(self, status: str, query: str) -> List[Project]:
+        """Projects in a status bucket whose name or description contains the query."""
+        if "\x01" in query:
+            return []
+        
+        text, offsets, projects = self._search_index(status)
+        matches = []
+        position = text.find(query)
+        while position != -1:
+            index = bisect_right(offsets, position) - 1
+            matches.append(projects[index])
+            # Resume at the next project's blob
+            if index + 1 == len(offsets):
+                break
+            position = text.find(query, offsets[index + 1])
+        return matches
     
     def _apply_filters(self):
         """Apply search and filter to projects."""
-        self.filtered_projects = self.projects
-        
-        # Apply status filter
-        if self.current_filter != "all":
-            self.filtered_projects = [
-                p for p in self.filtered_projects 
-                if p.status == self.current_filter
-            ]
-        
-        # Apply search
-        if self.search_query:
-            query = self.search_query.lower()
-            self.filtered_projects = [
-                p for p in self.filtered_projects
-                if query in p.name.lower() or query in p.description.lower()
-            ]
+        # Queries differing only in case share one cache entry
+        query = self.search_query.lower()
+        key = (self.current_filter, query, self._projects_version)
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            self._filter_cache.move_to_end(key)
+            self.filtered_projects = cached
+            return
+        
+        if query:
+            self.filtered_projects = self._search(self.current_filter, query)
+        else:
+            self.filtered_projects = self._by_status.get(self.current_filter, [])
+        
+        self._filter_cache[key] = self.filtered_projects
+        if len(self._filter_cache) > FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
     
     def _render_projects(self):
-        """Render projects grid."""
-        # Clear container
-        for widget in self.projects_container.winfo_children():
-            widget.destroy()
+        """Render projects list, skipping it when the shown set is unchanged."""
+        fingerprint = (
+            self._projects_version,
+            bool(self.search_query),
+            tuple(p.id for p in self.filtered_projects)
+        )
+        if fingerprint == self._rendered_fingerprint:
+            return
+        self._rendered_fingerprint = fingerprint
+        
+        for empty_state in self._empty_states.values():
+            empty_state.place_forget()
+        
+        self.projects_list.set_items(self.filtered_projects)
         
         if not self.filtered_projects:
-            # Show empty state
-            empty = EmptyState(
-                self.projects_container,
+            self._get_empty_state(bool(self.search_query)).place(x=0, y=0, relwidth=1, relheight=1)
+    
+    def _get_empty_state(self, searching: bool) -> EmptyState:
+        """Get the pooled empty state for searching or browsing."""
+        empty_state = self._empty_states.get(searching)
+        if empty_state is None:
+            empty_state = EmptyState(
+                self.projects_list.viewport,
                 message="No projects found",
-                action_text="Create Project" if not self.search_query else None,
-                action_command=self._on_create_project if not self.search_query else None
+                action_text="Create Project" if not searching else None,
+                action_command=self._on_create_project if not searching else None
             )
-            empty.pack(fill="both", expand=True)
-            return
-        
-        # Render project cards with better spacing
-        for i, project in enumerate(self.filtered_projects):
-            # Inject storage reference for progress calculation
-            project._storage = self.storage
-            
-            card = ProjectCard(
-                self.projects_container,
-                project=project,
-                on_click=self._on_project_click
-            )
-            card.pack(fill="x", pady=12)
+            self._empty_states[searching] = empty_state
+        return empty_state
+    
+    def _create_card(self, parent, project: Project) -> ProjectCard:
+        """Create a pooled project card."""
+        return ProjectCard(
+            parent,
+            project=project,
+            on_click=self._on_project_click,
+            progress=self._progress[project.id]
+        )
+    
+    def _bind_card(self, card: ProjectCard, project: Project):
+        """Point a pooled card at another project."""
+        card.update_from(project, self._progress[project.id])
     
     def _on_search(self, query: str):
-        """Handle search query change."""
+        """Handle search query change, debounced across a typing burst."""
         self.search_query = query
+        self._schedule_filters(SEARCH_DELAY_MS)
+    
+    def _on_filter_change(self, value: str):
+        """Handle filter change, debounced for rapid menu cycling."""
+        self.current_filter = _FILTER_FROM_DISPLAY[value]
+        self._schedule_filters(FILTER_DELAY_MS)
+    
+    def _schedule_filters(self, delay_ms: int):
+        """(Re)schedule a filter and render pass."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(delay_ms, self._run_filters)
+    
+    def _run_filters(self):
+        """Apply the pending search query and status filter."""
+        self._filter_after_id = None
         self._apply_filters()
         self._render_projects()
     
-    def _on_filter_change(self, value: str):
-        """Handle filter change."""
-        self.current_filter = value.lower()
+    def _save_project(self, project: Project):
+        """Save a project and update the filter indexes without reloading."""
+        self.storage.save_project(project)
+        self._loaded_revision = (self.storage.projects_revision, self.storage.tasks_revision)
+        
+        old_status = self._last_status.get(project.id)
+        if old_status is None:
+            self.projects.append(project)
+            self._progress[project.id] = project.progress_percentage
+        elif old_status != project.status:
+            self._by_status[old_status].remove(project)
+        
+        if old_status != project.status:
+            self._by_status[project.status].append(project)
+            self._last_status[project.id] = project.status
+        
+        self._invalidate_filters()
         self._apply_filters()
         self._render_projects()
     
     def _on_create_project(self):
-        """Handle create project button."""
-        dialog = ProjectFormDialog(self, self.storage)
-        dialog.wait_window()
-        self.refresh()
+        """Handle create project button, reusing the form dialog between uses."""
+        if self._form_dialog is not None and self._form_dialog.winfo_exists():
+            self._form_dialog.reset()
+            return
+        
+        # Imported on demand so opening the view doesn't load the form
+        from ui.views.project_form import ProjectFormDialog
+        
+        self._form_dialog = ProjectFormDialog(self, self.storage, on_save=self._save_project)
     
     def _on_project_click(self, project: Project):
         """Handle project card click."""
-        print(f"Project clicked: {project.name}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Project clicked: %s", project.name)
         # TODO: Show project detail view
-
-
-class ProjectFormDialog(ctk.CTkToplevel):
-    """Project creation/edit form dialog."""
     
-    def __init__(self, parent, storage_manager, project: Optional[Project] = None):
-        super().__init__(parent)
-        
-        self.storage = storage_manager
-        self.project = project
-        self.result = None
-        
-        # Configure window
-        self.title("New Project" if not project else "Edit Project")
-        self.geometry("600x700")
-        self.resizable(False, False)
-        
-        # Make modal
-        self.transient(parent)
-        self.grab_set()
-        
-        self._create_ui()
-        
-        # Populate if editing
-        if project:
-            self._populate_fields()
-    
-    def _create_ui(self):
-        """Create form UI."""
-        # Main container
-        container = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        container.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        # Name
-        ctk.CTkLabel(container, text="Project Name *", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.name_entry = ctk.CTkEntry(container, font=("Segoe UI", 13), height=40)
-        self.name_entry.pack(fill="x", pady=(0, 16))
-        
-        # Description
-        ctk.CTkLabel(container, text="Description", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.desc_text = ctk.CTkTextbox(container, font=("Segoe UI", 13), height=100)
-        self.desc_text.pack(fill="x", pady=(0, 16))
-        
-        # Status and Priority row
-        row1 = ctk.CTkFrame(container, fg_color="transparent")
-        row1.pack(fill="x", pady=(0, 16))
-        
-        # Status
-        status_frame = ctk.CTkFrame(row1, fg_color="transparent")
-        status_frame.pack(side="left", fill="x", expand=True, padx=(0, 8))
-        ctk.CTkLabel(status_frame, text="Status", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.status_menu = ctk.CTkOptionMenu(
-            status_frame,
-            values=[s.capitalize() for s in PROJECT_STATUS],
-            font=("Segoe UI", 13)
-        )
-        self.status_menu.pack(fill="x")
-        
-        # Priority
-        priority_frame = ctk.CTkFrame(row1, fg_color="transparent")
-        priority_frame.pack(side="left", fill="x", expand=True, padx=(8, 0))
-        ctk.CTkLabel(priority_frame, text="Priority", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.priority_menu = ctk.CTkOptionMenu(
-            priority_frame,
-            values=[p.capitalize() for p in PRIORITY_LEVELS],
-            font=("Segoe UI", 13)
-        )
-        self.priority_menu.pack(fill="x")
-        
-        # Color picker
-        ctk.CTkLabel(container, text="Project Color", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        colors_frame = ctk.CTkFrame(container, fg_color="transparent")
-        colors_frame.pack(fill="x", pady=(0, 16))
-        
-        self.selected_color = PROJECT_COLORS[0]
-        self.color_buttons = []
-        for color in PROJECT_COLORS:
-            btn = ctk.CTkButton(
-                colors_frame,
-                text="",
-                width=30,
-                height=30,
-                corner_radius=15,
-                fg_color=color,
-                hover_color=color,
-                command=lambda c=color: self._select_color(c)
-            )
-            btn.pack(side="left", padx=4)
-            self.color_buttons.append((btn, color))
-        
-        # Repository URL
-        ctk.CTkLabel(container, text="Repository URL", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.repo_entry = ctk.CTkEntry(container, font=("Segoe UI", 13), height=40)
-        self.repo_entry.pack(fill="x", pady=(0, 16))
-        
-        # Tech stack
-        ctk.CTkLabel(container, text="Tech Stack (comma-separated)", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.tech_entry = ctk.CTkEntry(container, font=("Segoe UI", 13), height=40)
-        self.tech_entry.pack(fill="x", pady=(0, 16))
-        
-        # Notes
-        ctk.CTkLabel(container, text="Notes", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
-        self.notes_text = ctk.CTkTextbox(container, font=("Segoe UI", 13), height=100)
-        self.notes_text.pack(fill="x", pady=(0, 16))
-        
-        # Buttons
-        buttons_frame = ctk.CTkFrame(self, fg_color="transparent")
-        buttons_frame.pack(fill="x", padx=20, pady=(0, 20))
-        
-        cancel_btn = IconButton(
-            buttons_frame,
-            text="Cancel",
-            command=self.destroy,
-            fg_color="gray70",
-            hover_color="gray60"
-        )
-        cancel_btn.pack(side="right", padx=(8, 0))
-        
-        save_btn = IconButton(
-            buttons_frame,
-            text="Save Project",
-            command=self._on_save,
-            fg_color=("#E07B53", "#F4A261"),
-            hover_color=("#D06B43", "#E49251"),
-            text_color="white",
-            font=("Segoe UI", 13, "bold")
-        )
-        save_btn.pack(side="right")
-    
-    def _select_color(self, color: str):
-        """Select project color."""
-        self.selected_color = color
-        # Visual feedback could be added here
-    
-    def _populate_fields(self):
-        """Populate form with existing project data."""
-        if not self.project:
-            return
-        
-        self.name_entry.insert(0, self.project.name)
-        self.desc_text.insert("1.0", self.project.description)
-        self.status_menu.set(self.project.status.capitalize())
-        self.priority_menu.set(self.project.priority.capitalize())
-        self.selected_color = self.project.color
-        
-        if self.project.repository_url:
-            self.repo_entry.insert(0, self.project.repository_url)
-        
-        if self.project.tech_stack:
-            self.tech_entry.insert(0, ", ".join(self.project.tech_stack))
-        
-        if self.project.notes:
-            self.notes_text.insert("1.0", self.project.notes)
-    
-    def _on_save(self):
-        """Handle save button."""
-        # Validate
-        name = self.name_entry.get().strip()
-        if not name:
-            # TODO: Show error message
-            return
-        
-        # Create or update project
-        if self.project:
-            # Update existing
-            self.project.update(
-                name=name,
-                description=self.desc_text.get("1.0", "end-1c").strip(),
-                status=self.status_menu.get().lower(),
-                priority=self.priority_menu.get().lower(),
-                color=self.selected_color,
-                repository_url=self.repo_entry.get().strip() or None,
-                tech_stack=[t.strip() for t in self.tech_entry.get().split(",") if t.strip()],
-                notes=self.notes_text.get("1.0", "end-1c").strip()
-            )
-        else:
-            # Create new
-            self.project = Project(
-                name=name,
-                description=self.desc_text.get("1.0", "end-1c").strip(),
-                status=self.status_menu.get().lower(),
-                priority=self.priority_menu.get().lower(),
-                color=self.selected_color,
-                repository_url=self.repo_entry.get().strip() or None,
-                tech_stack=[t.strip() for t in self.tech_entry.get().split(",") if t.strip()],
-                notes=self.notes_text.get("1.0", "end-1c").strip()
-            )
-        
-        # Validate
-        valid, error = self.project.validate()
-        if not valid:
-            # TODO: Show error message
-            print(f"Validation error: {error}")
-            return
-        
-        # Save to storage
-        self.storage.save_project(self.project)
-        self.result = self.project
-        self.destroy()
+    def destroy(self):
+        """Cancel pending filter and load callbacks before the view goes away."""
+        for after_id in (self._filter_after_id, self._load_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._filter_after_id = self._load_after_id = None
+        self._executor.shutdown(wait=False)
+        super().destroy()
@@ -2,137 +2,225 @@
 Task management view with Kanban board.
 """
 import customtkinter as ctk
-from typing import Optional, List, Callable
-import sys
-sys.path.append('..')
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Sequence, Tuple, Callable
 
-from models.task import Task, ChecklistItem
+from models.task import Task
 from models.project import Project
 from ui.components.common import (
-    StatusBadge, IconButton, SearchBar, EmptyState, PriorityIndicator
+    IconButton, SearchBar, PriorityIndicator, VirtualList,
+    set_gridded
 )
 from utils.helpers import truncate_text, format_date
-from config import TASK_STATUS, PRIORITY_LEVELS
+from config import TASK_STATUS_DISPLAY, PRIORITY_LEVELS
+
+
+# Task card fonts and colors
+FONT_CARD_TITLE = ("Segoe UI", 13, "bold")
+FONT_CARD_META = ("Segoe UI", 11)
+FONT_CARD_SMALL = ("Segoe UI", 10)
+FONT_CARD_SMALL_BOLD = ("Segoe UI", 10, "bold")
+META_COLOR = "gray60"
+TAG_COLOR = ("#E07B53", "#F4A261")
+TIMER_COLOR = ("#4CAF50", "#66BB6A")
+
+# Task card geometry; cards are sized from the rows they show so the column can virtualize them
+TASK_CARD_PADDING = 10
+TASK_HEADER_HEIGHT = 28
+TASK_LINE_HEIGHT = 20
+TASK_CARD_SPACING = 12
+
+# Delays before a search keystroke or menu change re-filters the board
+SEARCH_DELAY_MS = 150
+FILTER_DELAY_MS = 50
+
+# How often the UI checks for finished background loads
+LOAD_POLL_MS = 20
+
+# Settings key for the remembered search and filters
+_FILTER_STATE_KEY = "tasks_view.filters"
+
+# Form option labels and the stored values they map to; also the Kanban columns
+_STATUS_TO_DISPLAY = dict(TASK_STATUS_DISPLAY)
+_STATUS_FROM_DISPLAY = {display: status for status, display in TASK_STATUS_DISPLAY}
+_STATUS_BADGE = {"todo": "📝", "in_progress": "⏳", "blocked": "🚫", "completed": "✅"}
+_PRIORITY_DISPLAY = tuple(p.capitalize() for p in PRIORITY_LEVELS)
+_PRIORITY_TO_DISPLAY = dict(zip(PRIORITY_LEVELS, _PRIORITY_DISPLAY))
+_PRIORITY_FROM_DISPLAY = dict(zip(_PRIORITY_DISPLAY, PRIORITY_LEVELS))
+
+# Optional card rows: (label attribute, TaskCardText field, top padding)
+_TASK_CARD_ROWS = (
+    ("_project_label", "project", 6),
+    ("_due_label", "due", 4),
+    ("_checklist_label", "checklist", 4),
+    ("_tags_label", "tags", 6),
+    ("_deps_label", "deps", 4),
+    ("_timer_label", "timer", 4),
+)
+
+# Optional row grid placement: attribute -> (row, top padding)
+_TASK_ROW_GRID = {attr: (row, pad) for row, (attr, _, pad) in enumerate(_TASK_CARD_ROWS, start=1)}
+
+# Bind tag carrying the card click binding
+_CLICK_TAG = "TaskCardClick"
+
+# Optional row styles: attribute -> (font, text color)
+_TASK_ROW_STYLES = {
+    "_project_label": (FONT_CARD_META, META_COLOR),
+    "_due_label": (FONT_CARD_META, META_COLOR),
+    "_checklist_label": (FONT_CARD_META, META_COLOR),
+    "_tags_label": (FONT_CARD_SMALL, TAG_COLOR),
+    "_deps_label": (FONT_CARD_SMALL, META_COLOR),
+    "_timer_label": (FONT_CARD_SMALL_BOLD, TIMER_COLOR),
+}
+
+
+class TaskCardText:
+    """Display strings and height for one task card, built once per task load."""
+    
+    __slots__ = ("title", "project", "due", "due_color", "checklist", "tags", "deps", "timer", "height")
+    
+    def __init__(self, task: Task, project_name: Optional[str]):
+        self.title = truncate_text(task.title, 35)
+        self.project = f"📁 {truncate_text(project_name, 25)}" if project_name else None
+        self.due = f"📅 {format_date(task.due_date, '%b %d')}" if task.due_date else None
+        self.due_color = "red" if task.is_overdue else META_COLOR
+        
+        self.checklist = None
+        if task.checklist:
+            completed, total = task.checklist_progress
+            self.checklist = f"☑️ {completed}/{total} items"
+        
+        # Max 3 tags
+        self.tags = "  ".join(f"#{tag}" for tag in task.tags[:3]) if task.tags else None
+        
+        dep_count = len(task.dependencies)
+        self.deps = None
+        if dep_count:
+            self.deps = f"🔗 {dep_count} {'dependency' if dep_count == 1 else 'dependencies'}"
+        
+        self.timer = "⏱️ Timer running" if task.timer_running else None
+        
+        self.height = 2 * TASK_CARD_PADDING + TASK_HEADER_HEIGHT
+        for _, field, pad in _TASK_CARD_ROWS:
+            if getattr(self, field):
+                self.height += pad + TASK_LINE_HEIGHT
 
 
 class TaskCard(ctk.CTkFrame):
     """Task card component for Kanban board."""
     
-    def __init__(self, parent, task: Task, project_name: Optional[str], 
+    _click_bound = False
+    
+    def __init__(self, parent, task: Task, text: TaskCardText,
                  on_click: Callable, **kwargs):
         super().__init__(parent, corner_radius=8, fg_color=("white", "#2D2D2D"), **kwargs)
         
         self.task = task
         self.on_click = on_click
         
-        self._create_ui(project_name)
+        # Height is set per task in update_from
+        self.grid_propagate(False)
+        self._create_ui()
+        self.update_from(task, text)
         
-        # Make card clickable
-        self.bind("<Button-1>", lambda e: on_click(task))
-        for child in self.winfo_children():
-            child.bind("<Button-1>", lambda e: on_click(task))
+        # Make card clickable through one class binding shared by every card
+        if not TaskCard._click_bound:
+            self.bind_class(_CLICK_TAG, "<Button-1>", TaskCard._on_card_click)
+            TaskCard._click_bound = True
+        self._add_bindtags(self, (_CLICK_TAG,))
     
-    def _create_ui(self, project_name: Optional[str]):
-        """Create card UI."""
-        content = ctk.CTkFrame(self, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=12, pady=10)
-        
-        # Header row
-        header = ctk.CTkFrame(content, fg_color="transparent")
-        header.pack(fill="x")
+    def _create_ui(self):
+        """Create the card header; optional rows are built the first time a task needs them."""
+        self.grid_columnconfigure(1, weight=1)
         
         # Priority indicator
-        priority_ind = PriorityIndicator(header, self.task.priority)
-        priority_ind.pack(side="left", padx=(0, 8))
+        self._priority_ind = PriorityIndicator(self, self.task.priority)
+        self._priority_ind.grid(row=0, column=0, padx=(12, 8), pady=(TASK_CARD_PADDING, 0))
         
         # Title
-        title_label = ctk.CTkLabel(
-            header,
-            text=truncate_text(self.task.title, 35),
-            font=("Segoe UI", 13, "bold"),
+        self._title_label = ctk.CTkLabel(
+            self,
+            text="",
+            height=TASK_HEADER_HEIGHT,
+            font=FONT_CARD_TITLE,
             anchor="w"
         )
-        title_label.pack(side="left", fill="x", expand=True)
-        
-        # Project tag if present
-        if project_name:
-            project_tag = ctk.CTkLabel(
-                content,
-                text=f"📁 {truncate_text(project_name, 25)}",
-                font=("Segoe UI", 11),
-                text_color="gray60"
-            )
-            project_tag.pack(anchor="w", pady=(6, 0))
+        self._title_label.grid(row=0, column=1, sticky="ew", padx=(0, 12), pady=(TASK_CARD_PADDING, 0))
         
-        # Due date if set
-        if self.task.due_date:
-            due_text = f"📅 {format_date(self.task.due_date, '%b %d')}"
-            color = "red" if self.task.is_overdue else "gray60"
-            due_label = ctk.CTkLabel(
-                content,
-                text=due_text,
-                font=("Segoe UI", 11),
-                text_color=color
-            )
-            due_label.pack(anchor="w", pady=(4, 0))
-        
-        # Checklist progress if present
-        if self.task.checklist:
-            completed, total = self.task.checklist_progress
-            checklist_label = ctk.CTkLabel(
-                content,
-                text=f"☑️ {completed}/{total} items",
-                font=("Segoe UI", 11),
-                text_color="gray60"
-            )
-            checklist_label.pack(anchor="w", pady=(4, 0))
+        for attr, _, _ in _TASK_CARD_ROWS:
+            setattr(self, attr, None)
+    
+    def update_from(self, task: Task, text: TaskCardText):
+        """Show another task by updating the existing widgets in place."""
+        self.task = task
         
-        # Tags if present
-        if self.task.tags:
-            tags_frame = ctk.CTkFrame(content, fg_color="transparent")
-            tags_frame.pack(fill="x", pady=(6, 0))
-            
-            for tag in self.task.tags[:3]:  # Show max 3 tags
-                tag_label = ctk.CTkLabel(
-                    tags_frame,
-                    text=f"#{tag}",
-                    font=("Segoe UI", 10),
-                    text_color=("#E07B53", "#F4A261")
-                )
-                tag_label.pack(side="left", padx=(0, 6))
-        
-        # Dependencies indicator
-        if self.task.dependencies:
-            dep_count = len(self.task.dependencies)
-            dep_label = ctk.CTkLabel(
-                content,
-                text=f"🔗 {dep_count} {'dependency' if dep_count == 1 else 'dependencies'}",
-                font=("Segoe UI", 10),
-                text_color="gray60"
-            )
-            dep_label.pack(anchor="w", pady=(4, 0))
-        
-        # Timer running indicator
-        if self.task.timer_running:
-            timer_label = ctk.CTkLabel(
-                content,
-                text="⏱️ Timer running",
-                font=("Segoe UI", 10, "bold"),
-                text_color=("#4CAF50", "#66BB6A")
+        if self.cget("height") != text.height:
+            self.configure(height=text.height)
+        
+        self._priority_ind.configure(fg_color=PriorityIndicator.COLORS.get(task.priority, "#999999"))
+        self._title_label.configure(text=text.title)
+        
+        for attr, field, _ in _TASK_CARD_ROWS:
+            self._set_row(attr, getattr(text, field))
+        if text.due:
+            self._due_label.configure(text_color=text.due_color)
+    
+    def _set_row(self, attr: str, text: Optional[str]):
+        """Show an optional row with the given text, or hide it when there is no text."""
+        label = getattr(self, attr)
+        if not text:
+            if label is not None:
+                set_gridded(label, False)
+            return
+        
+        if label is None:
+            row, pad = _TASK_ROW_GRID[attr]
+            font, text_color = _TASK_ROW_STYLES[attr]
+            label = ctk.CTkLabel(
+                self,
+                text="",
+                height=TASK_LINE_HEIGHT,
+                font=font,
+                text_color=text_color,
+                anchor="w"
             )
-            timer_label.pack(anchor="w", pady=(4, 0))
+            label.grid(row=row, column=0, columnspan=2, sticky="w", padx=12, pady=(pad, 0))
+            # New rows join the click and scroll bindings the card already has
+            own_tags = self.bindtags()
+            self._add_bindtags(label, own_tags[:own_tags.index(str(self))])
+            setattr(self, attr, label)
+        
+        label.configure(text=text)
+        set_gridded(label, True)
+    
+    def _add_bindtags(self, widget, tags: tuple):
+        """Route events on a widget and everything inside it through extra bind tags."""
+        widget.bindtags(tuple(tags) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_bindtags(child, tags)
+    
+    @staticmethod
+    def _on_card_click(event):
+        """Open the task currently shown by the card that was clicked."""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, TaskCard):
+            widget = getattr(widget, "master", None)
+        if widget is not None:
+            widget.on_click(widget.task)
 
 
 class KanbanColumn(ctk.CTkFrame):
     """Kanban column for a specific task status."""
     
     def __init__(self, parent, status: str, title: str, tasks: List[Task],
-                 projects: List[Project], on_task_click: Callable, **kwargs):
+                 card_text: Callable[[Task], TaskCardText], on_task_click: Callable, **kwargs):
         super().__init__(parent, corner_radius=12, fg_color=("#F5F5F0", "#3A3A3A"), **kwargs)
         
         self.status = status
         self.tasks = tasks
-        self.projects = projects
+        self.card_text = card_text
         self.on_task_click = on_task_click
         
         self._create_ui(title)
@@ -150,18 +238,23 @@ class KanbanColumn(ctk.CTkFrame):
         )
         title_label.pack(side="left")
         
-        count_label = ctk.CTkLabel(
+        self.count_label = ctk.CTkLabel(
             header,
             text=str(len(self.tasks)),
             font=("Segoe UI", 12),
             text_color="gray60"
         )
-        count_label.pack(side="right")
+        self.count_label.pack(side="right")
         
-        # Tasks container - scrollable
-        self.tasks_container = ctk.CTkScrollableFrame(
+        # Tasks container - only cards inside the viewport are built
+        self.tasks_container = VirtualList(
             self,
-            fg_color="transparent"
+            row_height=2 * TASK_CARD_PADDING + TASK_HEADER_HEIGHT + TASK_CARD_SPACING,
+            create_row=self._create_card,
+            bind_row=self._bind_card,
+            overscan=2,
+            key=lambda task: task.id,
+            item_height=lambda task: self.card_text(task).height + TASK_CARD_SPACING
         )
         self.tasks_container.pack(fill="both", expand=True, padx=8, pady=(0, 8))
         
@@ -170,22 +263,26 @@ class KanbanColumn(ctk.CTkFrame):
     
     def _render_tasks(self):
         """Render task cards."""
-        for task in self.tasks:
-            # Find project name if task has project_id
-            project_name = None
-            if task.project_id:
-                for project in self.projects:
-                    if project.id == task.project_id:
-                        project_name = project.name
-                        break
-            
-            card = TaskCard(
-                self.tasks_container,
-                task=task,
-                project_name=project_name,
-                on_click=self.on_task_click
-            )
-            card.pack(fill="x", pady=6)
+        self.tasks_container.set_items(self.tasks)
+    
+    def update_tasks(self, tasks: List[Task]):
+        """Show a new task list, keeping the cards of tasks that stay in the column."""
+        self.tasks = tasks
+        self.count_label.configure(text=str(len(tasks)))
+        self._render_tasks()
+    
+    def _create_card(self, parent, task: Task) -> TaskCard:
+        """Create a pooled task card."""
+        return TaskCard(
+            parent,
+            task=task,
+            text=self.card_text(task),
+            on_click=self.on_task_click
+        )
+    
+    def _bind_card(self, card: TaskCard, task: Task):
+        """Point a pooled card at another task."""
+        card.update_from(task, self.card_text(task))
 
 
 class TasksView(ctk.CTkFrame):
@@ -197,7 +294,28 @@ class TasksView(ctk.CTkFrame):
         self.storage = storage_manager
         self.tasks: List[Task] = []
         self.projects: List[Project] = []
+        self._project_by_id: Dict[str, Project] = {}
+        self._project_by_name: Dict[str, Project] = {}
+        self._card_texts: Dict[str, TaskCardText] = {}
+        self._search_texts: List[str] = []  # Lowercased title and description, parallel to tasks
+        # Task indices by priority and by project id
+        self._by_priority: Dict[str, List[int]] = {}
+        self._by_project: Dict[str, List[int]] = {}
+        # Last filter pass, reused while the search query only grows
+        self._last_filter_key: Optional[tuple] = None
+        self._last_query = ""
+        self._last_matches: Sequence[int] = range(0)
         self.filtered_tasks: List[Task] = []
+        self._filter_after_id: Optional[str] = None
+        
+        # Tasks and projects are read concurrently off the UI thread
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._load_futures: Optional[Tuple[Future, Future]] = None
+        self._load_after_id: Optional[str] = None
+        self._loading_revision: Optional[tuple] = None
+        self._loaded_revision: Optional[tuple] = None
+        self._tasks_version = 0
+        self._rendered_fingerprint: Optional[tuple] = None
         
         self._create_ui()
         self.refresh()
@@ -247,7 +365,7 @@ class TasksView(ctk.CTkFrame):
         self.priority_filter = ctk.CTkOptionMenu(
             filters_frame,
             values=["All", "High", "Medium", "Low"],
-            command=lambda _: self._apply_filters(),
+            command=self._on_filter_change,
             width=120,
             font=("Segoe UI", 13)
         )
@@ -260,7 +378,7 @@ class TasksView(ctk.CTkFrame):
         self.project_filter = ctk.CTkOptionMenu(
             filters_frame,
             values=["All Projects"],
-            command=lambda _: self._apply_filters(),
+            command=self._on_filter_change,
             width=150,
             font=("Segoe UI", 13)
         )
@@ -269,79 +387,194 @@ class TasksView(ctk.CTkFrame):
         # Kanban board container
         self.board_container = ctk.CTkFrame(self, fg_color="transparent")
         self.board_container.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        
+        # Columns are built once and updated in place on every render
+        self.columns: Dict[str, KanbanColumn] = {}
+        for status, title in TASK_STATUS_DISPLAY:
+            column = KanbanColumn(
+                self.board_container,
+                status=status,
+                title=title,
+                tasks=[],
+                card_text=self._card_text,
+                on_task_click=self._on_task_click
+            )
+            column.pack(side="left", fill="both", expand=True, padx=8)
+            self.columns[status] = column
+        
+        # Restore filters before the first render so it only builds the tasks shown
+        self._restore_filters()
+    
+    def _restore_filters(self):
+        """Apply the search and filters remembered from the last session."""
+        self._saved_filters = self.storage.get_ui_state(_FILTER_STATE_KEY, {})
+        priority = self._saved_filters.get("priority", "All")
+        if priority in self.priority_filter.cget("values"):
+            self.priority_filter.set(priority)
+        self.project_filter.set(self._saved_filters.get("project", "All Projects"))
+        self.search_bar.set(self._saved_filters.get("search", ""))
+    
+    def save_state(self):
+        """Remember the current search and filters when they changed; run on hide and close."""
+        state = {
+            "priority": self.priority_filter.get(),
+            "project": self.project_filter.get(),
+            "search": self.search_bar.get()
+        }
+        if state != self._saved_filters:
+            self.storage.set_ui_state(_FILTER_STATE_KEY, state)
+            self._saved_filters = state
     
     def refresh(self):
-        """Refresh tasks and projects from storage."""
-        self.tasks = self.storage.get_all_tasks()
-        self.projects = self.storage.get_all_projects()
+        """Refresh tasks and projects from storage on the loader threads."""
+        # A running load re-checks storage when it finishes
+        if self._load_futures is not None:
+            return
+        
+        revision = (self.storage.tasks_revision, self.storage.projects_revision)
+        if revision == self._loaded_revision:
+            return
         
-        # Update project filter options
+        self._loading_revision = revision
+        self._load_futures = (
+            self._executor.submit(self.storage.get_all_tasks),
+            self._executor.submit(self.storage.get_all_projects)
+        )
+        self._load_after_id = self.after(LOAD_POLL_MS, self._poll_load)
+    
+    def _poll_load(self):
+        """Apply the background load once both reads finish."""
+        if not all(future.done() for future in self._load_futures):
+            self._load_after_id = self.after(LOAD_POLL_MS, self._poll_load)
+            return
+        
+        tasks_future, projects_future = self._load_futures
+        self._load_futures = self._load_after_id = None
+        self._loaded_revision = self._loading_revision
+        self._apply_results(tasks_future.result(), projects_future.result())
+        
+        # Storage may have been written while the load was running
+        self.refresh()
+    
+    def _apply_results(self, tasks: List[Task], projects: List[Project]):
+        """Index freshly loaded tasks and projects and render the board."""
+        self.tasks = tasks
+        self._tasks_version += 1
+        self._card_texts = {}
+        self._search_texts = [
+            f"{t.title}\x00{t.description}".lower() if t.description else t.title.lower()
+            for t in self.tasks
+        ]
+        self._last_filter_key = None
+        
+        by_priority = defaultdict(list)
+        by_project = defaultdict(list)
+        for i, task in enumerate(tasks):
+            by_priority[task.priority].append(i)
+            if task.project_id:
+                by_project[task.project_id].append(i)
+        self._by_priority, self._by_project = dict(by_priority), dict(by_project)
+        
+        self.projects = projects
+        self._project_by_id = {p.id: p for p in self.projects}
+        self._project_by_name = {p.name: p for p in self.projects}
+        
+        # Update project filter options; rebuilding the dropdown is costly, so only when names changed
         project_names = ["All Projects"] + [p.name for p in self.projects]
-        self.project_filter.configure(values=project_names)
+        if project_names != self.project_filter.cget("values"):
+            self.project_filter.configure(values=project_names)
+        if self.project_filter.get() not in self._project_by_name:
+            self.project_filter.set("All Projects")
         
         self._apply_filters()
         self._render_kanban()
     
     def _apply_filters(self):
-        """Apply search and filters to tasks."""
-        self.filtered_tasks = self.tasks
+        """Apply search and filters to tasks, narrowing the last result while the query grows."""
+        tasks = self.tasks
         
         # Filter by priority
         priority = self.priority_filter.get().lower()
-        if priority != "all":
-            self.filtered_tasks = [t for t in self.filtered_tasks if t.priority == priority]
+        if priority == "all":
+            priority = None
         
         # Filter by project
-        if self.project_filter.get() != "All Projects":
-            project_name = self.project_filter.get()
-            # Find project ID from name
-            project_id = None
-            for p in self.projects:
-                if p.name == project_name:
-                    project_id = p.id
-                    break
-            
-            if project_id:
-                self.filtered_tasks = [t for t in self.filtered_tasks if t.project_id == project_id]
+        project_id = None
+        project_name = self.project_filter.get()
+        if project_name != "All Projects":
+            project = self._project_by_name.get(project_name)
+            project_id = project.id if project else None
+        
+        # Filter by search query; the separator keeps matches from spanning title and description
+        search_query = self.search_bar.get().lower().replace("\x00", "")
+        
+        filter_key = (priority, project_id)
+        if filter_key == self._last_filter_key and search_query.startswith(self._last_query):
+            # A query extending the last one can only narrow the last matches
+            candidates = self._last_matches
+        elif priority is None and project_id is None:
+            candidates = range(len(tasks))
+        elif project_id is None:
+            candidates = self._by_priority.get(priority, [])
+        elif priority is None:
+            candidates = self._by_project.get(project_id, [])
+        else:
+            candidates = [i for i in self._by_project.get(project_id, []) if tasks[i].priority == priority]
         
-        # Filter by search query
-        search_query = self.search_bar.get().lower()
         if search_query:
-            self.filtered_tasks = [
-                t for t in self.filtered_tasks
-                if search_query in t.title.lower() or search_query in t.description.lower()
-            ]
+            texts = self._search_texts
+            matches = [i for i in candidates if search_query in texts[i]]
+        else:
+            matches = candidates
+        
+        self._last_filter_key, self._last_query, self._last_matches = filter_key, search_query, matches
+        if isinstance(matches, range):
+            self.filtered_tasks = tasks
+        else:
+            self.filtered_tasks = [tasks[i] for i in matches]
+    
+    def _card_text(self, task: Task) -> TaskCardText:
+        """Card strings for a task, built on first use after each load."""
+        text = self._card_texts.get(task.id)
+        if text is None:
+            project = self._project_by_id.get(task.project_id) if task.project_id else None
+            text = self._card_texts[task.id] = TaskCardText(task, project.name if project else None)
+        return text
     
     def _render_kanban(self):
-        """Render Kanban board with columns."""
-        # Clear board
-        for widget in self.board_container.winfo_children():
-            widget.destroy()
-        
-        # Create columns for each status
-        columns_data = [
-            ("todo", "To Do"),
-            ("in_progress", "In Progress"),
-            ("blocked", "Blocked"),
-            ("completed", "Completed")
-        ]
+        """Render Kanban board with columns, skipping it when the shown tasks are unchanged."""
+        fingerprint = (self._tasks_version, tuple(t.id for t in self.filtered_tasks))
+        if fingerprint == self._rendered_fingerprint:
+            return
+        self._rendered_fingerprint = fingerprint
         
-        for status, title in columns_data:
-            # Filter tasks by status
-            status_tasks = [t for t in self.filtered_tasks if t.status == status]
-            
-            column = KanbanColumn(
-                self.board_container,
-                status=status,
-                title=title,
-                tasks=status_tasks,
-                projects=self.projects,
-                on_task_click=self._on_task_click
-            )
-            column.pack(side="left", fill="both", expand=True, padx=8)
+        # Bucket tasks by status in one pass
+        buckets: Dict[str, List[Task]] = {status: [] for status in self.columns}
+        for task in self.filtered_tasks:
+            bucket = buckets.get(task.status)
+            if bucket is not None:
+                bucket.append(task)
+        
+        for status, column in self.columns.items():
+            column.update_tasks(buckets[status])
     
     def _on_search(self, query: str):
-        """Handle search query change."""
+        """Handle search query change once typing pauses."""
+        self._schedule_filters(SEARCH_DELAY_MS)
+    
+    def _on_filter_change(self, value: str):
+        """Handle priority or project change, debounced for rapid menu cycling."""
+        self._schedule_filters(FILTER_DELAY_MS)
+    
+    def _schedule_filters(self, delay_ms: int):
+        """(Re)schedule a filter and render pass."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(delay_ms, self._run_filters)
+    
+    def _run_filters(self):
+        """Apply the current search and filters to the board."""
+        self._filter_after_id = None
         self._apply_filters()
         self._render_kanban()
     
@@ -356,6 +589,64 @@ class TasksView(ctk.CTkFrame):
         dialog = TaskFormDialog(self, self.storage, self.projects, task)
         dialog.wait_window()
         self.refresh()
+    
+    def destroy(self):
+        """Cancel pending callbacks and save the filters before the view goes away."""
+        for after_id in (self._filter_after_id, self._load_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._filter_after_id = self._load_after_id = None
+        self._executor.shutdown(wait=False)
+        self.save_state()
+        super().destroy()
+
+
+class TaskErrorDialog(ctk.CTkToplevel):
+    """Modal error shown over a task dialog; hidden and reused instead of rebuilt."""
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        
+        self.owner = parent
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self._on_ok)
+        
+        self.heading_label = ctk.CTkLabel(self, font=("Segoe UI", 14, "bold"))
+        self.heading_label.pack(pady=(20, 10))
+        
+        self.message_label = ctk.CTkLabel(self, font=("Segoe UI", 12), wraplength=350)
+        self.message_label.pack(pady=(0, 20))
+        
+        self.detail_label = ctk.CTkLabel(self, font=("Segoe UI", 11), text_color="gray60")
+        
+        self.ok_button = ctk.CTkButton(self, text="OK", command=self._on_ok)
+        self.ok_button.pack()
+    
+    def show(self, title: str, geometry: str, heading: str,
+             message: str, detail: Optional[str] = None):
+        """Fill in the error and show it modally."""
+        self.title(title)
+        self.geometry(geometry)
+        self.heading_label.configure(text=heading)
+        self.message_label.configure(text=message)
+        
+        # The detail line sits between the message and the button only when given
+        if detail:
+            self.message_label.pack_configure(pady=(0, 10))
+            self.detail_label.configure(text=detail)
+            self.detail_label.pack(pady=(0, 20), before=self.ok_button)
+        else:
+            self.message_label.pack_configure(pady=(0, 20))
+            self.detail_label.pack_forget()
+        
+        self.deiconify()
+        self.grab_set()
+    
+    def _on_ok(self):
+        """Hide the error and hand the grab back to the task dialog."""
+        self.grab_release()
+        self.withdraw()
+        self.owner.grab_set()
 
 
 class TaskFormDialog(ctk.CTkToplevel):
@@ -367,6 +658,10 @@ class TaskFormDialog(ctk.CTkToplevel):
         
         self.storage = storage_manager
         self.projects = projects
+        self._project_by_id = {p.id: p for p in projects}
+        self._project_by_name = {p.name: p for p in projects}
+        self._all_tasks_by_id: Optional[Dict[str, Task]] = None
+        self._error_dialog: Optional[TaskErrorDialog] = None
         self.task = task
         
         # Configure window
@@ -414,7 +709,7 @@ class TaskFormDialog(ctk.CTkToplevel):
         ctk.CTkLabel(status_frame, text="Status", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
         self.status_menu = ctk.CTkOptionMenu(
             status_frame,
-            values=["To Do", "In Progress", "Blocked", "Completed"],
+            values=list(_STATUS_FROM_DISPLAY),
             font=("Segoe UI", 13)
         )
         self.status_menu.pack(fill="x")
@@ -425,7 +720,7 @@ class TaskFormDialog(ctk.CTkToplevel):
         ctk.CTkLabel(priority_frame, text="Priority", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 4))
         self.priority_menu = ctk.CTkOptionMenu(
             priority_frame,
-            values=[p.capitalize() for p in PRIORITY_LEVELS],
+            values=list(_PRIORITY_DISPLAY),
             font=("Segoe UI", 13)
         )
         self.priority_menu.pack(fill="x")
@@ -471,13 +766,13 @@ class TaskFormDialog(ctk.CTkToplevel):
         
         # Total logged hours
         total_hours = self.task.actual_hours if self.task and self.task.actual_hours else 0
-        hours_label = ctk.CTkLabel(
+        self.hours_label = ctk.CTkLabel(
             container,
             text=f"Total Logged: {total_hours:.2f} hours",
             font=("Segoe UI", 12),
             text_color="gray60"
         )
-        hours_label.pack(anchor="w", pady=(0, 8))
+        self.hours_label.pack(anchor="w", pady=(0, 8))
         
         # Timer widget
         from ui.components.timer_widget import TimerWidget
@@ -535,21 +830,12 @@ class TaskFormDialog(ctk.CTkToplevel):
         self.title_entry.insert(0, self.task.title)
         
         # Set project
-        if self.task.project_id:
-            for project in self.projects:
-                if project.id == self.task.project_id:
-                    self.project_menu.set(project.name)
-                    break
-        
-        # Map status
-        status_map = {
-            "todo": "To Do",
-            "in_progress": "In Progress",
-            "blocked": "Blocked",
-            "completed": "Completed"
-        }
-        self.status_menu.set(status_map.get(self.task.status, "To Do"))
-        self.priority_menu.set(self.task.priority.capitalize())
+        project = self._project_by_id.get(self.task.project_id) if self.task.project_id else None
+        if project:
+            self.project_menu.set(project.name)
+        
+        self.status_menu.set(_STATUS_TO_DISPLAY.get(self.task.status, "To Do"))
+        self.priority_menu.set(_PRIORITY_TO_DISPLAY.get(self.task.priority, self.task.priority.capitalize()))
         
         if self.task.description:
             self.desc_text.insert("1.0", self.task.description)
@@ -563,11 +849,16 @@ class TaskFormDialog(ctk.CTkToplevel):
         if self.task.blocked_reason:
             self.blocked_entry.insert(0, self.task.blocked_reason)
     
+    def _tasks_by_id(self) -> Dict[str, Task]:
+        """All stored tasks by id, read once per dialog."""
+        if self._all_tasks_by_id is None:
+            self._all_tasks_by_id = {t.id: t for t in self.storage.get_all_tasks()}
+        return self._all_tasks_by_id
+    
     def _render_dependencies_list(self, parent):
         """Render checklist of available tasks for dependencies."""
         # Get all tasks except this one
-        all_tasks = self.storage.get_all_tasks()
-        available_tasks = [t for t in all_tasks if not self.task or t.id != self.task.id]
+        available_tasks = [t for t in self._tasks_by_id().values() if not self.task or t.id != self.task.id]
         
         if not available_tasks:
             ctk.CTkLabel(
@@ -588,10 +879,9 @@ class TaskFormDialog(ctk.CTkToplevel):
                 var.set(True)
             
             # Task checkbox
-            status_badge = {"todo": "📝", "in_progress": "⏳", "blocked": "🚫", "completed": "✅"}
             checkbox = ctk.CTkCheckBox(
                 parent,
-                text=f"{status_badge.get(task.status, '📝')} {task.title}",
+                text=f"{_STATUS_BADGE.get(task.status, '📝')} {task.title}",
                 variable=var,
                 font=("Segoe UI", 12)
             )
@@ -603,29 +893,30 @@ class TaskFormDialog(ctk.CTkToplevel):
             return True, None
         
         # Build dependency graph
-        all_tasks = {t.id: t for t in self.storage.get_all_tasks()}
-        
-        def has_path(from_id: str, to_id: str, visited: set) -> bool:
-            """Check if there's a path from from_id to to_id."""
-            if from_id == to_id:
-                return True
-            if from_id in visited:
-                return False
-            
-            visited.add(from_id)
-            task = all_tasks.get(from_id)
-            if not task:
-                return False
-            
-            for dep_id in task.dependencies:
-                if has_path(dep_id, to_id, visited.copy()):
+        all_tasks = self._tasks_by_id()
+        
+        # Nodes already explored cannot reach this task, so one visited set serves every check
+        visited = set()
+        
+        def reaches_task(start_id: str) -> bool:
+            """Check if there's a dependency path from start_id to this task."""
+            stack = [start_id]
+            while stack:
+                current = stack.pop()
+                if current == self.task.id:
                     return True
+                if current in visited:
+                    continue
+                visited.add(current)
+                task = all_tasks.get(current)
+                if task:
+                    stack.extend(task.dependencies)
             return False
         
         # Check each new dependency
         for dep_id in new_deps:
             # Check if dep_id depends on this task (would create cycle)
-            if has_path(dep_id, self.task.id, set()):
+            if reaches_task(dep_id):
                 dep_task = all_tasks.get(dep_id)
                 dep_name = dep_task.title if dep_task else "Unknown"
                 return False, f"Cannot add '{dep_name}' - would create circular dependency"
@@ -637,7 +928,7 @@ class TaskFormDialog(ctk.CTkToplevel):
         if not self.task or not self.task.dependencies:
             return False, []
         
-        all_tasks = {t.id: t for t in self.storage.get_all_tasks()}
+        all_tasks = self._tasks_by_id()
         incomplete = []
         
         for dep_id in self.task.dependencies:
@@ -658,8 +949,14 @@ class TaskFormDialog(ctk.CTkToplevel):
         if self.task:
             self.task.stop_timer(elapsed_seconds)
             self.storage.save_task(self.task)
-            # Refresh the logged hours display would require recreating the label
-            # For now, it will update when dialog reopens
+            self.hours_label.configure(text=f"Total Logged: {self.task.actual_hours or 0:.2f} hours")
+    
+    def _show_error(self, title: str, geometry: str, heading: str,
+                    message: str, detail: Optional[str] = None):
+        """Show a validation error, building the error dialog on first use."""
+        if self._error_dialog is None:
+            self._error_dialog = TaskErrorDialog(self)
+        self._error_dialog.show(title, geometry, heading, message, detail)
     
     def _on_save(self):
         """Handle save button."""
@@ -671,19 +968,11 @@ class TaskFormDialog(ctk.CTkToplevel):
         # Get project ID
         project_id = None
         if self.project_menu.get() != "No Project":
-            for project in self.projects:
-                if project.name == self.project_menu.get():
-                    project_id = project.id
-                    break
+            project = self._project_by_name.get(self.project_menu.get())
+            project_id = project.id if project else None
         
         # Map status back
-        status_map = {
-            "To Do": "todo",
-            "In Progress": "in_progress",
-            "Blocked": "blocked",
-            "Completed": "completed"
-        }
-        status = status_map.get(self.status_menu.get(), "todo")
+        status = _STATUS_FROM_DISPLAY.get(self.status_menu.get(), "todo")
         
         # Collect dependencies from checkboxes
         dependencies = [task_id for task_id, var in self.dependency_vars.items() if var.get()]
@@ -691,109 +980,52 @@ class TaskFormDialog(ctk.CTkToplevel):
         # Validate circular dependencies
         valid, error = self._check_circular_dependency(dependencies)
         if not valid:
-            # Show error dialog
-            error_dialog = ctk.CTkToplevel(self)
-            error_dialog.title("Invalid Dependencies")
-            error_dialog.geometry("400x150")
-            error_dialog.transient(self)
-            error_dialog.grab_set()
-            
-            ctk.CTkLabel(
-                error_dialog,
-                text="⚠️ Circular Dependency Detected",
-                font=("Segoe UI", 14, "bold")
-            ).pack(pady=(20, 10))
-            
-            ctk.CTkLabel(
-                error_dialog,
-                text=error,
-                font=("Segoe UI", 12),
-                wraplength=350
-            ).pack(pady=(0, 20))
-            
-            ctk.CTkButton(
-                error_dialog,
-                text="OK",
-                command=error_dialog.destroy
-            ).pack()
-            
+            self._show_error(
+                "Invalid Dependencies", "400x150",
+                "⚠️ Circular Dependency Detected", error
+            )
             return
         
         # Check if trying to mark as completed with incomplete dependencies
         if status == "completed":
             has_incomplete, incomplete_names = self._check_incomplete_dependencies()
             if has_incomplete:
-                # Show blocking dialog
-                block_dialog = ctk.CTkToplevel(self)
-                block_dialog.title("Cannot Complete")
-                block_dialog.geometry("450x250")
-                block_dialog.transient(self)
-                block_dialog.grab_set()
-                
-                ctk.CTkLabel(
-                    block_dialog,
-                    text="🚫 Incomplete Dependencies",
-                    font=("Segoe UI", 14, "bold")
-                ).pack(pady=(20, 10))
-                
-                ctk.CTkLabel(
-                    block_dialog,
-                    text="This task cannot be completed because the following\ndependencies are not yet completed:",
-                    font=("Segoe UI", 12)
-                ).pack(pady=(0, 10))
-                
-                deps_text = "\n".join([f"• {name}" for name in incomplete_names])
-                ctk.CTkLabel(
-                    block_dialog,
-                    text=deps_text,
-                    font=("Segoe UI", 11),
-                    text_color="gray60"
-                ).pack(pady=(0, 20))
-                
-                ctk.CTkButton(
-                    block_dialog,
-                    text="OK",
-                    command=block_dialog.destroy
-                ).pack()
-                
+                self._show_error(
+                    "Cannot Complete", "450x250",
+                    "🚫 Incomplete Dependencies",
+                    "This task cannot be completed because the following\ndependencies are not yet completed:",
+                    "\n".join([f"• {name}" for name in incomplete_names])
+                )
                 return
         
         # Parse tags
         tags = [t.strip() for t in self.tags_entry.get().split(",") if t.strip()]
         
-        if self.task:
-            # Update existing
-            self.task.update(
-                title=title,
-                project_id=project_id,
-                description=self.desc_text.get("1.0", "end-1c").strip(),
-                status=status,
-                priority=self.priority_menu.get().lower(),
-                due_date=self.due_entry.get().strip() or None,
-                tags=tags,
-                blocked_reason=self.blocked_entry.get().strip() or None,
-                dependencies=dependencies
-            )
-        else:
-            # Create new
-            self.task = Task(
-                title=title,
-                project_id=project_id,
-                description=self.desc_text.get("1.0", "end-1c").strip(),
-                status=status,
-                priority=self.priority_menu.get().lower(),
-                due_date=self.due_entry.get().strip() or None,
-                tags=tags,
-                blocked_reason=self.blocked_entry.get().strip() or None,
-                dependencies=dependencies
-            )
+        fields = dict(
+            title=title,
+            project_id=project_id,
+            description=self.desc_text.get("1.0", "end-1c").strip(),
+            status=status,
+            priority=_PRIORITY_FROM_DISPLAY[self.priority_menu.get()],
+            due_date=self.due_entry.get().strip() or None,
+            tags=tags,
+            blocked_reason=self.blocked_entry.get().strip() or None,
+            dependencies=dependencies
+        )
         
-        # Validate
-        valid, error = self.task.validate()
+        # Validate on a scratch task so the shared board task is never left invalid
+        valid, error = Task(**fields).validate()
         if not valid:
             print(f"Validation error: {error}")
             return
         
+        if self.task:
+            # Update existing
+            self.task.update(**fields)
+        else:
+            # Create new
+            self.task = Task(**fields)
+        
         # Save
         self.storage.save_task(self.task)
         self.destroy()
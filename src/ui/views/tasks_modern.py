@@ -6,17 +6,40 @@ import customtkinter as ctk
 from typing import Optional, List, Callable
 from models.task import Task
 from models.project import Project
+from ui.components.common import VirtualList, set_gridded
+from ui.components.modern_components import TagChip
 from utils.helpers import truncate_text, format_date
 
 
+# Card colors
+PRIORITY_COLORS = {"high": "#E74C3C", "medium": "#F5A623", "low": "#95a5a6"}
+META_TEXT_COLOR = ("#80868B", "#70757A")
+OVERDUE_TEXT_COLOR = ("#E74C3C", "#F28B82")
+TAG_CHIP_COLORS = ["#4A90E2", "#F5A623", "#9B59B6", "#1ABC9C"]
+MAX_CARD_TAGS = 3
+
+# Delay before a hover change repaints the card, so quick mouse passes coalesce
+HOVER_DELAY_MS = 30
+
+# Bind tag carrying the card click binding
+_CLICK_TAG = "ModernTaskCardClick"
+
+# Card geometry; cards have a fixed height per task so the column can virtualize them
+CARD_PADDING = 14
+CARD_TITLE_HEIGHT = 36
+CARD_BADGE_HEIGHT = 44
+CARD_META_HEIGHT = 36
+CARD_TAGS_HEIGHT = 40
+CARD_DEPS_HEIGHT = 32
+CARD_SPACING = 12
+
+
 class ModernTaskCard(ctk.CTkFrame):
     """Modern task card component matching mockup design."""
     
+    _click_bound = False
+    
     def __init__(self, parent, task: Task, project_name: Optional[str], on_click: Callable, **kwargs):
-        # Priority color for left border
-        priority_colors = {"high": "#E74C3C", "medium": "#F5A623", "low": "#95a5a6"}
-        border_color = priority_colors.get(task.priority, "#E0E0E0")
-        
         super().__init__(
             parent,
             corner_radius=12,
@@ -29,127 +52,216 @@ class ModernTaskCard(ctk.CTkFrame):
         self.on_click = on_click
         self.default_fg = ("white", "#1E1E1E")
         self.hover_fg = ("#F8F9FA", "#2A2A2A")
+        self._last_key: Optional[tuple] = None
+        self._hover_state = False
+        self._hover_after_id: Optional[str] = None
+        
+        # Height is set per task in update_from
+        self.grid_propagate(False)
         
-        # Priority indicator bar (left side)
+        # Priority indicator bar (left side), stretched down to the filler row
         self.priority_bar = ctk.CTkFrame(
             self,
             width=4,
-            fg_color=border_color,
+            fg_color=PRIORITY_COLORS.get(task.priority, "#E0E0E0"),
             corner_radius=0
         )
-        self.priority_bar.pack(side="left", fill="y")
+        self.priority_bar.grid(row=0, column=0, rowspan=6, sticky="nsw")
+        self.grid_rowconfigure(5, weight=1)
+        # The bar's column also holds the left padding, so any meta label can come first
+        self.grid_columnconfigure(0, minsize=4 + CARD_PADDING + 2)
         
-        self._create_ui(project_name)
+        self._create_ui()
+        self.update_from(task, project_name)
         
-        # Make card clickable with hover effect
-        self.bind("<Button-1>", lambda e: on_click(task))
+        # Make card clickable through one class binding shared by every card
+        if not ModernTaskCard._click_bound:
+            self.bind_class(_CLICK_TAG, "<Button-1>", ModernTaskCard._on_card_click)
+            ModernTaskCard._click_bound = True
+        self._add_bindtags(self, (_CLICK_TAG,))
+        
+        # Hover effect
         self.bind("<Enter>", self._on_hover)
         self.bind("<Leave>", self._on_leave)
         self.configure(cursor="hand2")
-        
-        # Bind children
-        for child in self.winfo_children():
-            child.bind("<Button-1>", lambda e: on_click(task))
     
-    def _create_ui(self, project_name: Optional[str]):
-        """Create modern card UI."""
-        content = ctk.CTkFrame(self, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=16, pady=14)
+    @staticmethod
+    def height_for(task: Task, project_name: Optional[str]) -> int:
+        """Card height for a task, matching the rows update_from shows."""
+        height = 2 * CARD_PADDING + CARD_TITLE_HEIGHT
+        if project_name:
+            height += CARD_BADGE_HEIGHT
+        if task.due_date or task.checklist or task.timer_running:
+            height += CARD_META_HEIGHT
+        if task.tags:
+            height += CARD_TAGS_HEIGHT
+        if task.dependencies:
+            height += CARD_DEPS_HEIGHT
+        return height
+    
+    def _create_ui(self):
+        """Create every card row once; update_from shows the rows a task needs."""
+        # Rows are gridded straight onto the card, right of the priority bar;
+        # the meta labels take columns 1-3 and everything else spans them
+        self.grid_columnconfigure(4, weight=1)
+        pad_x = (0, CARD_PADDING + 2)
         
         # === TITLE ===
-        title_label = ctk.CTkLabel(
-            content,
-            text=truncate_text(self.task.title, 40),
+        self.title_label = ctk.CTkLabel(
+            self,
+            text="",
             font=("Segoe UI", 14, "bold"),
             anchor="w",
             justify="left"
         )
-        title_label.pack(fill="x", pady=(0, 8))
+        self.title_label.grid(row=0, column=1, columnspan=4, sticky="ew", padx=pad_x, pady=(CARD_PADDING, 8))
         
         # === PROJECT BADGE ===
-        if project_name:
-            from ui.components.modern_components import TagChip
-            project_badge = TagChip(
-                content,
-                text=project_name[:15],
-                color=("#E8EAED", "#353535"),
-                text_color=("#5F6368", "#9AA0A6")
-            )
-            project_badge.pack(anchor="w", pady=(0, 8))
+        self.project_badge = TagChip(
+            self,
+            text="",
+            color=("#E8EAED", "#353535"),
+            text_color=("#5F6368", "#9AA0A6")
+        )
+        self.project_badge.grid(row=1, column=1, columnspan=4, sticky="w", padx=pad_x, pady=(0, 8))
         
         # === META INFO ROW ===
-        if self.task.due_date or self.task.checklist or self.task.timer_running:
-            meta_row = ctk.CTkFrame(content, fg_color="transparent")
-            meta_row.pack(fill="x", pady=(0, 8))
-            
-            # Due date with icon
-            if self.task.due_date:
-                due_icon = "📅" if not self.task.is_overdue else "⚠️"
-                due_color = ("#E74C3C", "#F28B82") if self.task.is_overdue else ("#80868B", "#70757A")
-                
-                due_label = ctk.CTkLabel(
-                    meta_row,
-                    text=f"{due_icon} {format_date(self.task.due_date, '%b %d')}",
-                    font=("Segoe UI", 11),
-                    text_color=due_color
-                )
-                due_label.pack(side="left", padx=(0, 12))
-            
-            # Checklist progress
-            if self.task.checklist:
-                completed, total = self.task.checklist_progress
-                check_label = ctk.CTkLabel(
-                    meta_row,
-                    text=f"☑️ {completed}/{total}",
-                    font=("Segoe UI", 11),
-                    text_color=("#80868B", "#70757A")
-                )
-                check_label.pack(side="left", padx=(0, 12))
-            
-            # Timer indicator
-            if self.task.timer_running:
-                timer_label = ctk.CTkLabel(
-                    meta_row,
-                    text="⏱️",
-                    font=("Segoe UI", 14),
-                    text_color=("#27AE60", "#81C995")
-                )
-                timer_label.pack(side="left")
+        # Due date with icon
+        self.due_label = ctk.CTkLabel(self, text="", font=("Segoe UI", 11))
+        self.due_label.grid(row=2, column=1, padx=(0, 12), pady=(0, 8))
+        
+        # Checklist progress
+        self.check_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=("Segoe UI", 11),
+            text_color=META_TEXT_COLOR
+        )
+        self.check_label.grid(row=2, column=2, padx=(0, 12), pady=(0, 8))
+        
+        # Timer indicator
+        self.timer_label = ctk.CTkLabel(
+            self,
+            text="⏱️",
+            font=("Segoe UI", 14),
+            text_color=("#27AE60", "#81C995")
+        )
+        self.timer_label.grid(row=2, column=3, pady=(0, 8))
         
         # === TAGS ===
-        if self.task.tags:
-            tags_row = ctk.CTkFrame(content, fg_color="transparent")
-            tags_row.pack(fill="x", pady=(0, 4))
-            
-            from ui.components.modern_components import TagChip
-            tag_colors = ["#4A90E2", "#F5A623", "#9B59B6", "#1ABC9C"]
-            
-            for i, tag in enumerate(self.task.tags[:3]):  # Max 3 tags
-                tag_chip = TagChip(
-                    tags_row,
-                    text=f"#{tag[:10]}",
-                    color=tag_colors[i % len(tag_colors)],
-                    text_color="white"
-                )
-                tag_chip.pack(side="left", padx=(0, 6))
+        self.tags_row = ctk.CTkFrame(self, fg_color="transparent")
+        self.tags_row.grid(row=3, column=1, columnspan=4, sticky="ew", padx=pad_x, pady=(0, 4))
+        self.tag_chips = []
+        for i in range(MAX_CARD_TAGS):
+            tag_chip = TagChip(
+                self.tags_row,
+                text="",
+                color=TAG_CHIP_COLORS[i % len(TAG_CHIP_COLORS)],
+                text_color="white"
+            )
+            tag_chip.grid(row=0, column=i, padx=(0, 6))
+            self.tag_chips.append(tag_chip)
         
         # === DEPENDENCIES INDICATOR ===
-        if self.task.dependencies:
-            dep_label = ctk.CTkLabel(
-                content,
-                text=f"🔗 {len(self.task.dependencies)} linked",
-                font=("Segoe UI", 10),
-                text_color=("#80868B", "#70757A")
+        self.dep_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=("Segoe UI", 10),
+            text_color=META_TEXT_COLOR
+        )
+        self.dep_label.grid(row=4, column=1, columnspan=4, sticky="w", padx=pad_x, pady=(4, 0))
+    
+    def update_from(self, task: Task, project_name: Optional[str]):
+        """Show another task by updating the existing widgets in place."""
+        self.task = task
+        
+        # Every Task mutator bumps updated_at, so an unchanged key means nothing to redraw
+        key = (task.id, task.updated_at, project_name, task.is_overdue)
+        if key == self._last_key:
+            return
+        self._last_key = key
+        
+        height = self.height_for(task, project_name)
+        if self.cget("height") != height:
+            self.configure(height=height)
+        
+        self.priority_bar.configure(fg_color=PRIORITY_COLORS.get(task.priority, "#E0E0E0"))
+        self.title_label.configure(text=truncate_text(task.title, 40))
+        
+        set_gridded(self.project_badge, bool(project_name))
+        if project_name:
+            self.project_badge.set_text(project_name[:15])
+        
+        set_gridded(self.due_label, bool(task.due_date))
+        if task.due_date:
+            overdue = task.is_overdue
+            self.due_label.configure(
+                text=f"{'⚠️' if overdue else '📅'} {format_date(task.due_date, '%b %d')}",
+                text_color=OVERDUE_TEXT_COLOR if overdue else META_TEXT_COLOR
             )
-            dep_label.pack(anchor="w", pady=(4, 0))
+        
+        set_gridded(self.check_label, bool(task.checklist))
+        if task.checklist:
+            completed, total = task.checklist_progress
+            self.check_label.configure(text=f"☑️ {completed}/{total}")
+        
+        set_gridded(self.timer_label, task.timer_running)
+        
+        # Max 3 tags
+        tags = task.tags[:MAX_CARD_TAGS]
+        set_gridded(self.tags_row, bool(tags))
+        for i, tag_chip in enumerate(self.tag_chips):
+            set_gridded(tag_chip, i < len(tags))
+            if i < len(tags):
+                tag_chip.set_text(f"#{tags[i][:10]}")
+        
+        set_gridded(self.dep_label, bool(task.dependencies))
+        if task.dependencies:
+            self.dep_label.configure(text=f"🔗 {len(task.dependencies)} linked")
+    
+    def _add_bindtags(self, widget, tags: tuple):
+        """Route events on a widget and everything inside it through extra bind tags."""
+        widget.bindtags(tuple(tags) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_bindtags(child, tags)
+    
+    @staticmethod
+    def _on_card_click(event):
+        """Open the task currently shown by the card that was clicked."""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, ModernTaskCard):
+            widget = getattr(widget, "master", None)
+        if widget is not None:
+            widget.on_click(widget.task)
     
     def _on_hover(self, event):
         """Handle hover effect."""
-        self.configure(fg_color=self.hover_fg)
+        self._schedule_hover(True)
     
     def _on_leave(self, event):
         """Handle leave effect."""
-        self.configure(fg_color=self.default_fg)
+        self._schedule_hover(False)
+    
+    def _schedule_hover(self, hovered: bool):
+        """Apply the latest hover state once the pointer settles."""
+        if self._hover_after_id is not None:
+            self.after_cancel(self._hover_after_id)
+        self._hover_after_id = self.after(HOVER_DELAY_MS, self._apply_hover, hovered)
+    
+    def _apply_hover(self, hovered: bool):
+        """Repaint the card background if the hover state changed."""
+        self._hover_after_id = None
+        if hovered == self._hover_state:
+            return
+        self._hover_state = hovered
+        self.configure(fg_color=self.hover_fg if hovered else self.default_fg)
+    
+    def destroy(self):
+        """Cancel a pending hover repaint before the card goes away."""
+        if self._hover_after_id is not None:
+            self.after_cancel(self._hover_after_id)
+            self._hover_after_id = None
+        super().destroy()
 
 
 class ModernKanbanColumn(ctk.CTkFrame):
@@ -167,6 +279,7 @@ class ModernKanbanColumn(ctk.CTkFrame):
         self.status = status
         self.tasks = tasks
         self.projects = projects
+        self._project_by_id = {p.id: p for p in projects}
         self.on_task_click = on_task_click
         
         self._create_ui(title)
@@ -215,44 +328,72 @@ class ModernKanbanColumn(ctk.CTkFrame):
         )
         count_badge.pack(side="right")
         
-        count_label = ctk.CTkLabel(
+        self.count_label = ctk.CTkLabel(
             count_badge,
             text=str(len(self.tasks)),
             font=("Segoe UI", 14, "bold"),
             text_color="white"
         )
-        count_label.pack(padx=12, pady=4)
+        self.count_label.pack(padx=12, pady=4)
         
-        # Scrollable tasks container
-        tasks_container = ctk.CTkScrollableFrame(
-            self,
-            fg_color=("transparent", "transparent"),
-            corner_radius=0
+        # Tasks container - only cards inside the viewport are built
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=0)
+        body.grid_columnconfigure(0, weight=1)
+        body.grid_rowconfigure(0, weight=1)
+        
+        self.tasks_container = VirtualList(
+            body,
+            row_height=2 * CARD_PADDING + CARD_TITLE_HEIGHT + CARD_SPACING,
+            create_row=self._create_card,
+            bind_row=self._bind_card,
+            overscan=2,
+            key=lambda task: task.id,
+            item_height=lambda task: ModernTaskCard.height_for(task, self._project_name(task)) + CARD_SPACING
         )
-        tasks_container.pack(fill="both", expand=True, padx=0)
+        self.tasks_container.grid(row=0, column=0, sticky="nsew")
+        
+        # Empty state
+        self.empty_label = ctk.CTkLabel(
+            body,
+            text=f"No {title.lower()} tasks",
+            font=("Segoe UI", 12),
+            text_color=META_TEXT_COLOR
+        )
+        self.empty_label.grid(row=0, column=0, sticky="n", pady=40)
         
         # Render task cards
-        if not self.tasks:
-            # Empty state
-            empty_label = ctk.CTkLabel(
-                tasks_container,
-                text=f"No {title.lower()} tasks",
-                font=("Segoe UI", 12),
-                text_color=("#80868B", "#70757A")
-            )
-            empty_label.pack(pady=40)
-        else:
-            for task in self.tasks:
-                # Get project name
-                project_name = None
-                if task.project_id:
-                    project = next((p for p in self.projects if p.id == task.project_id), None)
-                    project_name = project.name if project else None
-                
-                card = ModernTaskCard(
-                    tasks_container,
-                    task=task,
-                    project_name=project_name,
-                    on_click=self.on_task_click
-                )
-                card.pack(fill="x", pady=(0, 12))
+        self._render_tasks()
+    
+    def _render_tasks(self):
+        """Render task cards, or the empty state when the column has none."""
+        set_gridded(self.empty_label, not self.tasks)
+        set_gridded(self.tasks_container, bool(self.tasks))
+        self.tasks_container.set_items(self.tasks)
+    
+    def update_tasks(self, tasks: List[Task], projects: List[Project]):
+        """Show a new task list, keeping the cards of tasks that stay in the column."""
+        self.tasks = tasks
+        if projects is not self.projects:
+            self.projects = projects
+            self._project_by_id = {p.id: p for p in projects}
+        self.count_label.configure(text=str(len(tasks)))
+        self._render_tasks()
+    
+    def _project_name(self, task: Task) -> Optional[str]:
+        """Find project name if task has project_id."""
+        project = self._project_by_id.get(task.project_id) if task.project_id else None
+        return project.name if project else None
+    
+    def _create_card(self, parent, task: Task) -> ModernTaskCard:
+        """Create a pooled task card."""
+        return ModernTaskCard(
+            parent,
+            task=task,
+            project_name=self._project_name(task),
+            on_click=self.on_task_click
+        )
+    
+    def _bind_card(self, card: ModernTaskCard, task: Task):
+        """Point a pooled card at another task."""
+        card.update_from(task, self._project_name(task))
@@ -1,15 +1,14 @@
 """
 Advanced chart generators for additional analytics visualizations.
 """
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.figure import Figure
 import tempfile
+import numpy as np
 from pathlib import Path
 from typing import List, Dict, Tuple
-from datetime import datetime, timedelta
 from collections import Counter
 
+from utils.chart_generator import get_chart_figure, chart_input_key, save_chart
+
 
 temp_dir = Path(tempfile.gettempdir()) / "deskflow_charts"
 temp_dir.mkdir(exist_ok=True)
@@ -28,6 +27,18 @@ STATUS_COLORS = {
    "completed": "#2ecc71"
 }
 
+# Shared chart styling; passed as keyword dicts rather than rcParams, which are
+# process-global and would race between the chart worker threads
+CHART_BACKGROUND = '#FAFAFA'
+TITLE_STYLE = {'fontsize': 14, 'pad': 15}
+LABEL_STYLE = {'fontsize': 11}
+GRID_STYLE = {'alpha': 0.3, 'linestyle': '--'}
+EMPTY_TEXT_STYLE = {'ha': 'center', 'va': 'center', 'fontsize': 14, 'color': 'gray'}
+
+# Heatmap cell labels; larger heatmaps (over 8 weeks) are shown by color alone
+HEATMAP_MAX_LABELED_CELLS = 56
+HEATMAP_LABEL_STYLE = {"ha": "center", "va": "center", "color": "black", "fontsize": 10}
+
 PRIORITY_COLORS = {
     "low": "#95a5a6",
     "medium": "#f39c12",
@@ -46,40 +57,30 @@ def generate_weekly_heatmap(data: Dict[str, int], filename: str = "weekly_heatma
     Returns:
         Path to saved image
     """
-    fig, ax = plt.subplots(figsize=(10, 4))
-    fig.patch.set_facecolor('#FAFAFA')
-    ax.set_facecolor('#FAFAFA')
+    output_path = temp_dir / f"{Path(filename).stem}_{chart_input_key(data)}.png"
+    if output_path.exists():
+        return str(output_path)
+    
+    fig = get_chart_figure((10, 4), facecolor=CHART_BACKGROUND)
+    ax = fig.add_subplot(facecolor=CHART_BACKGROUND)
     
     # Prepare data - group by week
     if not data:
         # Empty state
-        ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
-                transform=ax.transAxes, fontsize=14, color='gray')
+        ax.text(0.5, 0.5, 'No data available', transform=ax.transAxes, **EMPTY_TEXT_STYLE)
         ax.axis('off')
     else:
-        # Convert to datetime and group by week
-        dates = sorted([datetime.fromisoformat(d) for d in data.keys()])
-        
-        # Get week range
-        weeks = {}
-        for date in dates:
-            week_start = date - timedelta(days=date.weekday())
-            week_key = week_start.strftime("%Y-W%W")
-            day_name = date.strftime("%a")
-            
-            if week_key not in weeks:
-                weeks[week_key] = {d: 0 for d in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]}
-            
-            day_abbr = date.strftime("%a")
-            weeks[week_key][day_abbr] += data[date.strftime("%Y-%m-%d")]
+        # Day numbers since the epoch (a Thursday), their weekday (Mon=0) and week's Monday
+        days = np.array(list(data.keys()), dtype='datetime64[D]').astype(np.int64)
+        counts = np.fromiter(data.values(), dtype=np.int64, count=len(data))
+        weekdays = (days + 3) % 7
+        week_rows, week_idx = np.unique(days - weekdays, return_inverse=True)
         
-        # Prepare matrix
-        week_labels = list(weeks.keys())
+        # One row per week that has data, in date order
         day_labels = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        
-        matrix = []
-        for week in week_labels:
-            matrix.append([weeks[week][day] for day in day_labels])
+        matrix = np.zeros((len(week_rows), 7), dtype=np.int64)
+        np.add.at(matrix, (week_idx, weekdays), counts)
+        week_labels = [f"Week {i+1}" for i in range(len(week_rows))]
         
         # Create heatmap
         im = ax.imshow(matrix, cmap='YlOrRd', aspect='auto')
@@ -88,23 +89,20 @@ def generate_weekly_heatmap(data: Dict[str, int], filename: str = "weekly_heatma
         ax.set_xticks(range(len(day_labels)))
         ax.set_xticklabels(day_labels)
         ax.set_yticks(range(len(week_labels)))
-        ax.set_yticklabels([f"Week {i+1}" for i in range(len(week_labels))])
+        ax.set_yticklabels(week_labels)
         
-        # Add text annotations
-        for i in range(len(week_labels)):
-            for j in range(len(day_labels)):
-                text = ax.text(j, i, matrix[i][j],
-                             ha="center", va="center", color="black", fontsize=10)
+        # Add text annotations while the cells are large enough to read them
+        if matrix.size <= HEATMAP_MAX_LABELED_CELLS:
+            for (i, j), count in np.ndenumerate(matrix):
+                ax.text(j, i, count, **HEATMAP_LABEL_STYLE)
         
         # Colorbar
-        plt.colorbar(im, ax=ax, label='Tasks Completed')
+        fig.colorbar(im, ax=ax, label='Tasks Completed')
         
-        ax.set_title('Weekly Productivity Heatmap', fontsize=14, pad=15)
+        ax.set_title('Weekly Productivity Heatmap', **TITLE_STYLE)
     
-    plt.tight_layout()
-    output_path = temp_dir / filename
-    plt.savefig(output_path, dpi=100, bbox_inches='tight', facecolor='#FAFAFA')
-    plt.close()
+    fig.tight_layout()
+    save_chart(fig, output_path, dpi=100, facecolor=CHART_BACKGROUND)
     
     return str(output_path)
 
@@ -122,42 +120,39 @@ def generate_trend_area_chart(dates: List[str], values: List[int],
     Returns:
         Path to saved image
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    fig.patch.set_facecolor('#FAFAFA')
-    ax.set_facecolor('#FAFAFA')
+    output_path = temp_dir / f"{Path(filename).stem}_{chart_input_key(dates, values)}.png"
+    if output_path.exists():
+        return str(output_path)
+    
+    fig = get_chart_figure((10, 5), facecolor=CHART_BACKGROUND)
+    ax = fig.add_subplot(facecolor=CHART_BACKGROUND)
     
     if not dates or not values:
-        ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
-                transform=ax.transAxes, fontsize=14, color='gray')
+        ax.text(0.5, 0.5, 'No data available', transform=ax.transAxes, **EMPTY_TEXT_STYLE)
         ax.axis('off')
     else:
         # Calculate cumulative
-        cumulative = []
-        total = 0
-        for v in values:
-            total += v
-            cumulative.append(total)
+        cumulative = np.cumsum(values)
+        positions = np.arange(len(dates))
         
         # Plot area chart
-        ax.fill_between(range(len(dates)), cumulative, alpha=0.3, color='#2ecc71')
-        ax.plot(range(len(dates)), cumulative, color='#27ae60', linewidth=2)
+        ax.fill_between(positions, cumulative, alpha=0.3, color='#2ecc71')
+        ax.plot(positions, cumulative, color='#27ae60', linewidth=2)
         
         # Format
-        ax.set_xlabel('Date', fontsize=11)
-        ax.set_ylabel('Cumulative Tasks Completed', fontsize=11)
-        ax.set_title('Task Completion Trend', fontsize=14, pad=15)
+        ax.set_xlabel('Date', **LABEL_STYLE)
+        ax.set_ylabel('Cumulative Tasks Completed', **LABEL_STYLE)
+        ax.set_title('Task Completion Trend', **TITLE_STYLE)
         
         # X-axis labels (show every few dates)
         step = max(1, len(dates) // 10)
-        ax.set_xticks(range(0, len(dates), step))
-        ax.set_xticklabels([dates[i] for i in range(0, len(dates), step)], rotation=45)
+        ax.set_xticks(positions[::step])
+        ax.set_xticklabels(dates[::step], rotation=45)
         
-        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.grid(True, **GRID_STYLE)
     
-    plt.tight_layout()
-    output_path = temp_dir / filename
-    plt.savefig(output_path, dpi=100, bbox_inches='tight', facecolor='#FAFAFA')
-    plt.close()
+    fig.tight_layout()
+    save_chart(fig, output_path, dpi=100, facecolor=CHART_BACKGROUND)
     
     return str(output_path)
 
@@ -174,13 +169,15 @@ def generate_priority_matrix(data: Dict[str, Dict[str, int]],
     Returns:
         Path to saved image
     """
-    fig, ax = plt.subplots(figsize=(8, 5))
-    fig.patch.set_facecolor('#FAFAFA')
-    ax.set_facecolor('#FAFAFA')
+    output_path = temp_dir / f"{Path(filename).stem}_{chart_input_key(data)}.png"
+    if output_path.exists():
+        return str(output_path)
+    
+    fig = get_chart_figure((8, 5), facecolor=CHART_BACKGROUND)
+    ax = fig.add_subplot(facecolor=CHART_BACKGROUND)
     
     if not data:
-        ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
-                transform=ax.transAxes, fontsize=14, color='gray')
+        ax.text(0.5, 0.5, 'No data available', transform=ax.transAxes, **EMPTY_TEXT_STYLE)
         ax.axis('off')
     else:
         priorities = list(data.keys())
@@ -194,18 +191,16 @@ def generate_priority_matrix(data: Dict[str, Dict[str, int]],
         ax.bar(x, completed, width, label='Completed', color='#2ecc71')
         ax.bar(x, incomplete, width, bottom=completed, label='Incomplete', color='#e74c3c')
         
-        ax.set_xlabel('Priority', fontsize=11)
-        ax.set_ylabel('Number of Tasks', fontsize=11)
-        ax.set_title('Priority vs Completion Status', fontsize=14, pad=15)
+        ax.set_xlabel('Priority', **LABEL_STYLE)
+        ax.set_ylabel('Number of Tasks', **LABEL_STYLE)
+        ax.set_title('Priority vs Completion Status', **TITLE_STYLE)
         ax.set_xticks(x)
         ax.set_xticklabels([p.capitalize() for p in priorities])
         ax.legend()
-        ax.grid(True, alpha=0.3, axis='y', linestyle='--')
+        ax.grid(True, axis='y', **GRID_STYLE)
     
-    plt.tight_layout()
-    output_path = temp_dir / filename
-    plt.savefig(output_path, dpi=100, bbox_inches='tight', facecolor='#FAFAFA')
-    plt.close()
+    fig.tight_layout()
+    save_chart(fig, output_path, dpi=100, facecolor=CHART_BACKGROUND)
     
     return str(output_path)
 
@@ -223,13 +218,15 @@ def generate_tag_usage_chart(tags: Dict[str, int], filename: str = "tag_usage.pn
     Returns:
         Path to saved image
     """
-    fig, ax = plt.subplots(figsize=(8, 6))
-    fig.patch.set_facecolor('#FAFAFA')
-    ax.set_facecolor('#FAFAFA')
+    output_path = temp_dir / f"{Path(filename).stem}_{chart_input_key(tags, top_n)}.png"
+    if output_path.exists():
+        return str(output_path)
+    
+    fig = get_chart_figure((8, 6), facecolor=CHART_BACKGROUND)
+    ax = fig.add_subplot(facecolor=CHART_BACKGROUND)
     
     if not tags:
-        ax.text(0.5, 0.5, 'No tags used yet', ha='center', va='center',
-                transform=ax.transAxes, fontsize=14, color='gray')
+        ax.text(0.5, 0.5, 'No tags used yet', transform=ax.transAxes, **EMPTY_TEXT_STYLE)
         ax.axis('off')
     else:
         # Sort and get top N
@@ -244,17 +241,15 @@ def generate_tag_usage_chart(tags: Dict[str, int], filename: str = "tag_usage.pn
         ax.set_yticks(y_pos)
         ax.set_yticklabels(tag_names)
         ax.invert_yaxis()  # Top tag at top
-        ax.set_xlabel('Usage Count', fontsize=11)
-        ax.set_title(f'Top {len(tag_names)} Most Used Tags', fontsize=14, pad=15)
-        ax.grid(True, alpha=0.3, axis='x', linestyle='--')
+        ax.set_xlabel('Usage Count', **LABEL_STYLE)
+        ax.set_title(f'Top {len(tag_names)} Most Used Tags', **TITLE_STYLE)
+        ax.grid(True, axis='x', **GRID_STYLE)
         
         # Add value labels
         for i, v in enumerate(tag_counts):
             ax.text(v + 0.5, i, str(v), va='center')
     
-    plt.tight_layout()
-    output_path = temp_dir / filename
-    plt.savefig(output_path, dpi=100, bbox_inches='tight', facecolor='#FAFAFA')
-    plt.close()
+    fig.tight_layout()
+    save_chart(fig, output_path, dpi=100, facecolor=CHART_BACKGROUND)
     
     return str(output_path)
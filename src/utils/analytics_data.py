@@ -4,6 +4,8 @@ Analytics data aggregation utilities.
 from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+from itertools import islice
+from calendar import day_name
 
 from models.project import Project
 from models.task import Task
@@ -27,25 +29,21 @@ def get_tasks_by_status(tasks: List[Task]) -> Dict[str, int]:
 
 def get_tasks_completed_per_day(tasks: List[Task], days: int = 30) -> Dict[str, int]:
     """Get tasks completed per day for the last N days."""
+    # ISO timestamps start with their YYYY-MM-DD date
+    return _completed_days_window(
+        Counter(task.completed_at[:10] for task in tasks if task.completed_at), days
+    )
+
+
+def _completed_days_window(completed_by_date: Dict[str, int], days: int) -> Dict[str, int]:
+    """Completion counts for each of the last N days, keyed YYYY-MM-DD, zero-filled."""
     today = datetime.now().date()
     start_date = today - timedelta(days=days - 1)
     
-    # Initialize all dates with 0
     date_counts = {}
     for i in range(days):
-        date = start_date + timedelta(days=i)
-        date_counts[date.strftime("%Y-%m-%d")] = 0
-    
-    # Count completed tasks by date
-    for task in tasks:
-        if task.completed_at:
-            try:
-                completed_date = datetime.fromisoformat(task.completed_at).date()
-                if start_date <= completed_date <= today:
-                    date_counts[completed_date.strftime("%Y-%m-%d")] += 1
-            except:
-                pass
-    
+        date = (start_date + timedelta(days=i)).isoformat()
+        date_counts[date] = completed_by_date.get(date, 0)
     return date_counts
 
 
@@ -83,13 +81,13 @@ def calculate_completion_rate(tasks: List[Task], days: int = 7) -> float:
     
     for task in tasks:
         # Check if task was created in the time period
+        created = task.created_dt
         try:
-            created = datetime.fromisoformat(task.created_at)
-            if created >= cutoff_date:
+            if created is not None and created >= cutoff_date:
                 total_tasks += 1
                 if task.status == "completed":
                     completed_tasks += 1
-        except:
+        except TypeError:
             pass
     
     if total_tasks == 0:
@@ -103,13 +101,9 @@ def get_best_productivity_day(tasks: List[Task]) -> str:
     day_counts = defaultdict(int)
     
     for task in tasks:
-        if task.completed_at:
-            try:
-                completed = datetime.fromisoformat(task.completed_at)
-                day_name = completed.strftime("%A")
-                day_counts[day_name] += 1
-            except:
-                pass
+        completed = task.completed_dt
+        if completed is not None:
+            day_counts[completed.strftime("%A")] += 1
     
     if not day_counts:
         return "Not enough data"
@@ -123,8 +117,7 @@ def get_most_used_tags(tasks: List[Task], limit: int = 10) -> List[Tuple[str, in
     tag_counts = Counter()
     
     for task in tasks:
-        for tag in task.tags:
-            tag_counts[tag] += 1
+        tag_counts.update(task.tags)
     
     return tag_counts.most_common(limit)
 
@@ -144,10 +137,85 @@ def get_blocked_tasks_frequency(tasks: List[Task]) -> List[Tuple[str, int]]:
     """Get tasks that are frequently blocked (number of times status was 'blocked')."""
     # For now, just return currently blocked tasks
     # In a real implementation, you'd track status change history
-    blocked_tasks = []
+    blocked_tasks = (task for task in tasks if task.status == "blocked")
+    return [(task.title, 1) for task in islice(blocked_tasks, 10)]
+
+
+class TaskAggregates:
+    """Task metrics gathered in a single pass by aggregate_all()."""
+    
+    __slots__ = (
+        "status", "priority", "project_time", "tag_counts", "weekday_counts",
+        "completed_by_date", "recent_created", "recent_completed"
+    )
+    
+    def __init__(self):
+        self.status: Dict[str, int] = defaultdict(int)
+        self.priority: Dict[str, int] = defaultdict(int)
+        self.project_time: Dict[str, float] = defaultdict(float)
+        self.tag_counts = Counter()
+        self.weekday_counts: Dict[int, int] = defaultdict(int)  # Completions by weekday number
+        self.completed_by_date = Counter()  # Completions by YYYY-MM-DD
+        self.recent_created = 0  # Tasks created inside the completion rate window
+        self.recent_completed = 0
+    
+    def completed_per_day(self, days: int) -> Dict[str, int]:
+        """Tasks completed per day for the last N days."""
+        return _completed_days_window(self.completed_by_date, days)
+    
+    def time_by_project(self, limit: int = 10) -> Dict[str, float]:
+        """Hours logged by project name, largest first."""
+        sorted_projects = sorted(self.project_time.items(), key=lambda x: x[1], reverse=True)
+        return dict(sorted_projects[:limit])
+    
+    def completion_rate(self) -> float:
+        """Percentage of recently created tasks that are completed."""
+        if self.recent_created == 0:
+            return 0.0
+        return (self.recent_completed / self.recent_created) * 100
+    
+    def best_productivity_day(self) -> str:
+        """Day of week with most task completions."""
+        if not self.weekday_counts:
+            return "Not enough data"
+        best_day = max(self.weekday_counts.items(), key=lambda x: x[1])
+        return day_name[best_day[0]]
+    
+    def average_tasks_per_day(self, days: int) -> float:
+        """Average tasks completed per day over the last N days."""
+        if days == 0:
+            return 0.0
+        return sum(self.completed_per_day(days).values()) / days
+
+
+def aggregate_all(tasks: List[Task], projects: List[Project], days: int = 7) -> TaskAggregates:
+    """Walk the tasks once and gather every per-task metric; days sets the completion rate window."""
+    aggregates = TaskAggregates()
+    project_names = {p.id: p.name for p in projects}
+    cutoff = datetime.now() - timedelta(days=days)
     
     for task in tasks:
-        if task.status == "blocked":
-            blocked_tasks.append((task.title, 1))
-    
-    return blocked_tasks[:10]
+        aggregates.status[task.status] += 1
+        aggregates.priority[task.priority] += 1
+        
+        if task.actual_hours and task.project_id:
+            aggregates.project_time[project_names.get(task.project_id, "Unknown")] += task.actual_hours
+        
+        aggregates.tag_counts.update(task.tags)
+        
+        completed = task.completed_dt
+        if completed is not None:
+            aggregates.weekday_counts[completed.weekday()] += 1
+            aggregates.completed_by_date[completed.date().isoformat()] += 1
+        
+        created = task.created_dt
+        try:
+            recent = created is not None and created >= cutoff
+        except TypeError:
+            recent = False
+        if recent:
+            aggregates.recent_created += 1
+            if task.status == "completed":
+                aggregates.recent_completed += 1
+    
+    return aggregates
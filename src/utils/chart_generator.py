@@ -3,9 +3,16 @@ Chart generation utilities using matplotlib.
 """
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle, Wedge
 from typing import Dict, List
+from itertools import accumulate
+import hashlib
+import json
+import math
 import os
+import threading
 from pathlib import Path
 
 
@@ -22,6 +29,13 @@ COLORS = {
     'cyan': '#00BCD4'
 }
 
+# Shared title and axis label styling
+TITLE_STYLE = {'fontsize': 14, 'fontweight': 'bold', 'pad': 20}
+LABEL_STYLE = {'fontsize': 11}
+
+# Pies with at most this many slices are drawn as plain wedges instead of through ax.pie
+SMALL_PIE_SLICES = 8
+
 STATUS_COLORS = {
     'planning': '#2196F3',
     'active': '#4CAF50',
@@ -37,6 +51,22 @@ STATUS_COLORS = {
 }
 
 
+# One reusable Agg figure per thread, so charts skip pyplot's per-figure manager setup and teardown
+_figures = threading.local()
+
+
+def get_chart_figure(figsize: tuple, facecolor: str = 'white') -> Figure:
+    """Get this thread's chart figure, cleared and sized for a new chart."""
+    fig = getattr(_figures, 'figure', None)
+    if fig is None:
+        fig = _figures.figure = Figure()
+        FigureCanvasAgg(fig)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.patch.set_facecolor(facecolor)
+    return fig
+
+
 def get_temp_chart_path(chart_name: str) -> str:
     """Get path for saving temporary chart image."""
     temp_dir = Path(os.environ.get('TEMP', '/tmp')) / 'deskflow_charts'
@@ -44,26 +74,83 @@ def get_temp_chart_path(chart_name: str) -> str:
     return str(temp_dir / f"{chart_name}.png")
 
 
+def chart_input_key(*inputs) -> str:
+    """Hash of everything a chart is drawn from, so unchanged charts reuse their image."""
+    # Keys stay in insertion order; it is the order the chart draws them in
+    encoded = json.dumps(inputs, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def save_chart(fig: Figure, filepath, **kwargs):
+    """Save a keyed chart image atomically and drop older images of the same chart."""
+    path = Path(filepath)
+    temp_path = path.with_name(f".{path.stem}.{threading.get_ident()}.tmp")
+    fig.savefig(temp_path, format='png', **kwargs)
+    os.replace(temp_path, path)
+    
+    # Only prune images written before this one; a newer one may belong to a concurrent job
+    written_at = path.stat().st_mtime_ns
+    chart_name = path.stem.rsplit('_', 1)[0]
+    for old_path in path.parent.glob('*.png'):
+        if old_path == path or old_path.stem.rsplit('_', 1)[0] != chart_name:
+            continue
+        try:
+            if old_path.stat().st_mtime_ns < written_at:
+                old_path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+
+
+def _draw_small_pie(ax, labels: List[str], sizes: List[int], colors: List[str],
+                    pct_distance: float = 0.6, width: float = None):
+    """Draw a few pie slices directly, skipping ax.pie's general label layout."""
+    total = sum(sizes)
+    angles = [90 + 360 * value / total for value in accumulate(sizes, initial=0)]
+    
+    for index, (label, size) in enumerate(zip(labels, sizes)):
+        start, end = angles[index], angles[index + 1]
+        ax.add_patch(Wedge((0, 0), 1, start, end, width=width,
+                           facecolor=colors[index]))
+        
+        middle = math.radians((start + end) / 2)
+        x, y = math.cos(middle), math.sin(middle)
+        ax.text(1.1 * x, 1.1 * y, label, fontsize=10,
+                ha='left' if x > 0 else 'right', va='center')
+        ax.text(pct_distance * x, pct_distance * y, f"{size / total:.1%}",
+                fontsize=10, ha='center', va='center')
+    
+    ax.set_xlim(-1.25, 1.25)
+    ax.set_ylim(-1.25, 1.25)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+
 def generate_pie_chart(data: Dict[str, int], title: str, chart_name: str) -> str:
     """Generate a pie chart."""
     if not data or sum(data.values()) == 0:
         return None
     
-    fig, ax = plt.subplots(figsize=(8, 6))
+    filepath = get_temp_chart_path(f"{chart_name}_{chart_input_key(data, title)}")
+    if os.path.exists(filepath):
+        return filepath
+    
+    fig = get_chart_figure((8, 6))
+    ax = fig.add_subplot()
     
     labels = list(data.keys())
     sizes = list(data.values())
     colors = [STATUS_COLORS.get(label.lower(), COLORS['primary']) for label in labels]
     
-    ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
-           startangle=90, textprops={'fontsize': 10})
-    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-    ax.axis('equal')
+    if len(sizes) <= SMALL_PIE_SLICES:
+        _draw_small_pie(ax, labels, sizes, colors)
+    else:
+        ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
+               startangle=90, textprops={'fontsize': 10})
+        ax.axis('equal')
+    ax.set_title(title, **TITLE_STYLE)
     
-    filepath = get_temp_chart_path(chart_name)
-    plt.tight_layout()
-    plt.savefig(filepath, dpi=100, bbox_inches='tight', facecolor='white')
-    plt.close(fig)
+    fig.tight_layout()
+    save_chart(fig, filepath, dpi=100, facecolor='white')
     
     return filepath
 
@@ -73,28 +160,31 @@ def generate_donut_chart(data: Dict[str, int], title: str, chart_name: str) -> s
     if not data or sum(data.values()) == 0:
         return None
     
-    fig, ax = plt.subplots(figsize=(8, 6))
+    filepath = get_temp_chart_path(f"{chart_name}_{chart_input_key(data, title)}")
+    if os.path.exists(filepath):
+        return filepath
+    
+    fig = get_chart_figure((8, 6))
+    ax = fig.add_subplot()
     
     labels = list(data.keys())
     sizes = list(data.values())
     colors = [STATUS_COLORS.get(label.lower(), COLORS['primary']) for label in labels]
     
-    wedges, texts, autotexts = ax.pie(sizes, labels=labels, colors=colors,
-                                       autopct='%1.1f%%', startangle=90,
-                                       textprops={'fontsize': 10},
-                                       pctdistance=0.85)
-    
-    # Draw circle for donut
-    centre_circle = plt.Circle((0, 0), 0.70, fc='white')
-    ax.add_artist(centre_circle)
-    
-    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-    ax.axis('equal')
-    
-    filepath = get_temp_chart_path(chart_name)
-    plt.tight_layout()
-    plt.savefig(filepath, dpi=100, bbox_inches='tight', facecolor='white')
-    plt.close(fig)
+    if len(sizes) <= SMALL_PIE_SLICES:
+        _draw_small_pie(ax, labels, sizes, colors, pct_distance=0.85, width=0.3)
+    else:
+        ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
+               startangle=90, textprops={'fontsize': 10}, pctdistance=0.85)
+        
+        # Draw circle for donut
+        centre_circle = Circle((0, 0), 0.70, fc='white')
+        ax.add_artist(centre_circle)
+        ax.axis('equal')
+    ax.set_title(title, **TITLE_STYLE)
+    
+    fig.tight_layout()
+    save_chart(fig, filepath, dpi=100, facecolor='white')
     
     return filepath
 
@@ -104,26 +194,31 @@ def generate_bar_chart(data: Dict[str, int], title: str, xlabel: str, ylabel: st
     if not data:
         return None
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    filepath = get_temp_chart_path(f"{chart_name}_{chart_input_key(data, title, xlabel, ylabel)}")
+    if os.path.exists(filepath):
+        return filepath
+    
+    fig = get_chart_figure((10, 6))
+    ax = fig.add_subplot()
     
     labels = list(data.keys())
     values = list(data.values())
     
     bars = ax.bar(labels, values, color=COLORS['primary'], alpha=0.8)
     
-    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-    ax.set_xlabel(xlabel, fontsize=11)
-    ax.set_ylabel(ylabel, fontsize=11)
+    ax.set_title(title, **TITLE_STYLE)
+    ax.set_xlabel(xlabel, **LABEL_STYLE)
+    ax.set_ylabel(ylabel, **LABEL_STYLE)
     ax.grid(axis='y', alpha=0.3)
     
     # Rotate x labels if too many
     if len(labels) > 10:
-        plt.xticks(rotation=45, ha='right')
+        ax.tick_params(axis='x', labelrotation=45)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')
     
-    filepath = get_temp_chart_path(chart_name)
-    plt.tight_layout()
-    plt.savefig(filepath, dpi=100, bbox_inches='tight', facecolor='white')
-    plt.close(fig)
+    fig.tight_layout()
+    save_chart(fig, filepath, dpi=100, facecolor='white')
     
     return filepath
 
@@ -133,7 +228,12 @@ def generate_horizontal_bar(data: Dict[str, float], title: str, xlabel: str, cha
     if not data:
         return None
     
-    fig, ax = plt.subplots(figsize=(10, max(6, len(data) * 0.5)))
+    filepath = get_temp_chart_path(f"{chart_name}_{chart_input_key(data, title, xlabel)}")
+    if os.path.exists(filepath):
+        return filepath
+    
+    fig = get_chart_figure((10, max(6, len(data) * 0.5)))
+    ax = fig.add_subplot()
     
     labels = list(data.keys())
     values = list(data.values())
@@ -143,8 +243,8 @@ def generate_horizontal_bar(data: Dict[str, float], title: str, xlabel: str, cha
     
     ax.set_yticks(y_pos)
     ax.set_yticklabels(labels, fontsize=10)
-    ax.set_xlabel(xlabel, fontsize=11)
-    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+    ax.set_xlabel(xlabel, **LABEL_STYLE)
+    ax.set_title(title, **TITLE_STYLE)
     ax.grid(axis='x', alpha=0.3)
     
     # Add value labels on bars
@@ -154,10 +254,8 @@ def generate_horizontal_bar(data: Dict[str, float], title: str, xlabel: str, cha
                 f'{value:.1f}h',
                 ha='left', va='center', fontsize=9, color='black')
     
-    filepath = get_temp_chart_path(chart_name)
-    plt.tight_layout()
-    plt.savefig(filepath, dpi=100, bbox_inches='tight', facecolor='white')
-    plt.close(fig)
+    fig.tight_layout()
+    save_chart(fig, filepath, dpi=100, facecolor='white')
     
     return filepath
 
@@ -167,7 +265,12 @@ def generate_line_chart(data: Dict[str, int], title: str, xlabel: str, ylabel: s
     if not data:
         return None
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    filepath = get_temp_chart_path(f"{chart_name}_{chart_input_key(data, title, xlabel, ylabel)}")
+    if os.path.exists(filepath):
+        return filepath
+    
+    fig = get_chart_figure((12, 6))
+    ax = fig.add_subplot()
     
     labels = list(data.keys())
     values = list(data.values())
@@ -176,23 +279,23 @@ def generate_line_chart(data: Dict[str, int], title: str, xlabel: str, ylabel: s
             color=COLORS['primary'], markerfacecolor=COLORS['secondary'])
     ax.fill_between(range(len(values)), values, alpha=0.2, color=COLORS['primary'])
     
-    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-    ax.set_xlabel(xlabel, fontsize=11)
-    ax.set_ylabel(ylabel, fontsize=11)
+    ax.set_title(title, **TITLE_STYLE)
+    ax.set_xlabel(xlabel, **LABEL_STYLE)
+    ax.set_ylabel(ylabel, **LABEL_STYLE)
     ax.grid(True, alpha=0.3)
     
     # Rotate x labels
     if len(labels) > 15:
-        plt.xticks(rotation=45, ha='right')
+        ax.tick_params(axis='x', labelrotation=45)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')
         # Show every nth label to avoid crowding
         nth = max(1, len(labels) // 15)
         for i, label in enumerate(ax.get_xticklabels()):
             if i % nth != 0:
                 label.set_visible(False)
     
-    filepath = get_temp_chart_path(chart_name)
-    plt.tight_layout()
-    plt.savefig(filepath, dpi=100, bbox_inches='tight', facecolor='white')
-    plt.close(fig)
+    fig.tight_layout()
+    save_chart(fig, filepath, dpi=100, facecolor='white')
     
     return filepath
@@ -1,7 +1,10 @@
 """
 Centralized error handling and logging.
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -19,15 +22,23 @@ def setup_logging():
     # Create log file
     log_file = LOGS_DIR / "error.log"
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.ERROR,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()  # Also print to console
-        ]
-    )
+    # Log calls only enqueue; a listener thread does the file and console writes
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    console_handler = logging.StreamHandler()  # Also print to console
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    atexit.register(listener.stop)  # Drain queued records on shutdown
+    
+    # The queued record already carries its message and traceback; the listener adds the rest
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logging.basicConfig(level=logging.ERROR, handlers=[queue_handler])
     
     return logging.getLogger(__name__)
 
@@ -39,11 +50,17 @@ logger = setup_logging()
 class ErrorHandler:
     """Centralized error handling for the application."""
     
+    # Dialogs are hidden rather than destroyed and reused per (kind, parent)
+    _dialogs = {}
+    
+    # (width, height) of the screen, read once for centering dialogs
+    _screen_size = None
+    
     @staticmethod
     def handle_storage_error(exception: Exception, context: str = "Storage operation"):
         """Handle storage and file I/O errors."""
-        error_msg = f"{context} failed: {str(exception)}"
-        logger.error(error_msg, exc_info=True)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(f"{context} failed: {exception}", exc_info=exception)
         
         ErrorHandler.show_error_dialog(
             "Storage Error",
@@ -58,7 +75,7 @@ class ErrorHandler:
         else:
             full_message = message
         
-        logger.warning(f"Validation error: {full_message}")
+        logger.warning("Validation error: %s", full_message)
         
         ErrorHandler.show_warning_dialog(
             "Validation Error",
@@ -68,8 +85,8 @@ class ErrorHandler:
     @staticmethod
     def handle_parsing_error(exception: Exception, data_type: str = "data"):
         """Handle JSON/date parsing errors."""
-        error_msg = f"Failed to parse {data_type}: {str(exception)}"
-        logger.error(error_msg, exc_info=True)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(f"Failed to parse {data_type}: {exception}", exc_info=exception)
         
         ErrorHandler.show_error_dialog(
             "Parse Error",
@@ -79,8 +96,8 @@ class ErrorHandler:
     @staticmethod
     def handle_unexpected_error(exception: Exception, context: str = "Operation"):
         """Handle unexpected/unknown errors."""
-        error_msg = f"Unexpected error during {context}: {str(exception)}"
-        logger.error(error_msg, exc_info=True)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(f"Unexpected error during {context}: {exception}", exc_info=exception)
         
         ErrorHandler.show_error_dialog(
             "Unexpected Error",
@@ -88,125 +105,111 @@ class ErrorHandler:
         )
     
     @staticmethod
-    def show_error_dialog(title: str, message: str, parent=None):
-        """Display error dialog to user."""
+    def _get_dialog(kind: str, parent=None) -> ctk.CTkToplevel:
+        """Get the reusable dialog of this kind for a parent, building it on first use."""
+        key = (kind, parent)
+        dialog = ErrorHandler._dialogs.get(key)
+        if dialog is not None and dialog.winfo_exists():
+            return dialog
+        
         dialog = ctk.CTkToplevel(parent) if parent else ctk.CTkToplevel()
-        dialog.title(title)
-        dialog.geometry("450x200")
         dialog.resizable(False, False)
-        
-        # Make modal if parent exists
         if parent:
             dialog.transient(parent)
-            dialog.grab_set()
         
-        # Icon and message
+        def close():
+            if dialog.close_after_id is not None:
+                dialog.after_cancel(dialog.close_after_id)
+                dialog.close_after_id = None
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        dialog.close_after_id = None
+        
         content_frame = ctk.CTkFrame(dialog, fg_color="transparent")
         content_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        ctk.CTkLabel(
-            content_frame,
-            text="❌ " + title,
-            font=("Segoe UI", 14, "bold"),
-            text_color="red"
-        ).pack(pady=(0, 10))
+        dialog.heading_label = ctk.CTkLabel(content_frame)
+        dialog.heading_label.pack(pady=(10, 20) if kind == "success" else (0, 10))
         
-        ctk.CTkLabel(
+        # The success message has no body; its text goes in the heading
+        dialog.message_label = ctk.CTkLabel(
             content_frame,
-            text=message,
             font=("Segoe UI", 12),
             wraplength=400,
             justify="left"
-        ).pack(pady=(0, 20))
+        )
+        if kind != "success":
+            dialog.message_label.pack(pady=(0, 20))
         
         ctk.CTkButton(
             content_frame,
             text="OK",
-            command=dialog.destroy,
+            command=close,
             width=100
         ).pack()
         
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
+        dialog.close = close
+        ErrorHandler._dialogs[key] = dialog
+        return dialog
     
     @staticmethod
-    def show_warning_dialog(title: str, message: str, parent=None):
-        """Display warning dialog to user."""
-        dialog = ctk.CTkToplevel(parent) if parent else ctk.CTkToplevel()
-        dialog.title(title)
-        dialog.geometry("450x180")
-        dialog.resizable(False, False)
+    def _present_dialog(dialog: ctk.CTkToplevel, title: str, size: str, modal: bool):
+        """Show a prepared dialog of a fixed "WxH" size centered on screen."""
+        if ErrorHandler._screen_size is None:
+            ErrorHandler._screen_size = (dialog.winfo_screenwidth(), dialog.winfo_screenheight())
+        screen_width, screen_height = ErrorHandler._screen_size
         
-        if parent:
-            dialog.transient(parent)
-            dialog.grab_set()
+        # Center from the known size instead of waiting for Tk to lay the dialog out
+        width, height = map(int, size.split("x"))
+        x = (screen_width // 2) - (width // 2)
+        y = (screen_height // 2) - (height // 2)
         
-        content_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        content_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        dialog.title(title)
+        dialog.geometry(f"{size}+{x}+{y}")
+        dialog.deiconify()
         
-        ctk.CTkLabel(
-            content_frame,
+        # Make modal if parent exists
+        if modal:
+            dialog.grab_set()
+    
+    @staticmethod
+    def show_error_dialog(title: str, message: str, parent=None):
+        """Display error dialog to user."""
+        dialog = ErrorHandler._get_dialog("error", parent)
+        dialog.heading_label.configure(
+            text="❌ " + title,
+            font=("Segoe UI", 14, "bold"),
+            text_color="red"
+        )
+        dialog.message_label.configure(text=message)
+        ErrorHandler._present_dialog(dialog, title, "450x200", modal=bool(parent))
+    
+    @staticmethod
+    def show_warning_dialog(title: str, message: str, parent=None):
+        """Display warning dialog to user."""
+        dialog = ErrorHandler._get_dialog("warning", parent)
+        dialog.heading_label.configure(
             text="⚠️ " + title,
             font=("Segoe UI", 14, "bold"),
             text_color="orange"
-        ).pack(pady=(0, 10))
-        
-        ctk.CTkLabel(
-            content_frame,
-            text=message,
-            font=("Segoe UI", 12),
-            wraplength=400,
-            justify="left"
-        ).pack(pady=(0, 20))
-        
-        ctk.CTkButton(
-            content_frame,
-            text="OK",
-            command=dialog.destroy,
-            width=100
-        ).pack()
-        
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
+        )
+        dialog.message_label.configure(text=message)
+        ErrorHandler._present_dialog(dialog, title, "450x180", modal=bool(parent))
     
     @staticmethod
     def show_success_message(message: str, parent=None):
         """Show success notification."""
-        dialog = ctk.CTkToplevel(parent) if parent else ctk.CTkToplevel()
-        dialog.title("Success")
-        dialog.geometry("350x120")
-        dialog.resizable(False, False)
-        
-        if parent:
-            dialog.transient(parent)
-        
-        content_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        content_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        ctk.CTkLabel(
-            content_frame,
+        dialog = ErrorHandler._get_dialog("success", parent)
+        dialog.heading_label.configure(
             text="✓ " + message,
             font=("Segoe UI", 13),
             text_color=("#4CAF50", "#66BB6A")
-        ).pack(pady=(10, 20))
-        
-        ctk.CTkButton(
-            content_frame,
-            text="OK",
-            command=dialog.destroy,
-            width=100
-        ).pack()
-        
-        # Center and auto-close after 2 seconds
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
+        )
+        ErrorHandler._present_dialog(dialog, "Success", "350x120", modal=False)
         
-        dialog.after(2000, dialog.destroy)
+        # Auto-close after 2 seconds, restarting the countdown if already shown
+        if dialog.close_after_id is not None:
+            dialog.after_cancel(dialog.close_after_id)
+        dialog.close_after_id = dialog.after(2000, dialog.close)
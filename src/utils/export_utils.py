@@ -3,6 +3,7 @@ Export and import utilities for data management.
 """
 import json
 import csv
+from operator import attrgetter
 from pathlib import Path
 from typing import List
 from datetime import datetime
@@ -11,15 +12,37 @@ from models.project import Project
 from models.task import Task
 from models.daily_plan import DailyPlan
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is the fallback
+    orjson = None
+
+
+# Exports write many small pieces; a large buffer turns them into a few big writes
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Fetch a record's CSV fields in one C-level call, in CSV column order
+_PROJECT_CSV_FIELDS = attrgetter(
+    'id', 'name', 'description', 'status', 'priority', 'color',
+    'created_at', 'updated_at', 'start_date', 'target_date',
+    'completion_date', 'progress_percentage', 'repository_url',
+    'tech_stack', 'team_members', 'notes', 'tags'
+)
+_TASK_CSV_FIELDS = attrgetter(
+    'id', 'project_id', 'title', 'description', 'status', 'priority',
+    'created_at', 'updated_at', 'due_date', 'completed_at',
+    'estimated_hours', 'actual_hours', 'tags', 'blocked_reason'
+)
+
 
 def export_projects_csv(projects: List[Project], filepath: str) -> bool:
     """Export projects to CSV file."""
     try:
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             if not projects:
                 return True
             
-            # Define CSV headers
+            # Define CSV headers; each row tuple below follows this order
             headers = [
                 'ID', 'Name', 'Description', 'Status', 'Priority', 'Color',
                 'Created At', 'Updated At', 'Start Date', 'Target Date',
@@ -27,29 +50,23 @@ def export_projects_csv(projects: List[Project], filepath: str) -> bool:
                 'Tech Stack', 'Team Members', 'Notes', 'Tags'
             ]
             
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            
-            for project in projects:
-                writer.writerow({
-                    'ID': project.id,
-                    'Name': project.name,
-                    'Description': project.description,
-                    'Status': project.status,
-                    'Priority': project.priority,
-                    'Color': project.color,
-                    'Created At': project.created_at,
-                    'Updated At': project.updated_at,
-                    'Start Date': project.start_date or '',
-                    'Target Date': project.target_date or '',
-                    'Completion Date': project.completion_date or '',
-                    'Progress %': project.progress_percentage,
-                    'Repository URL': project.repository_url or '',
-                    'Tech Stack': ', '.join(project.tech_stack),
-                    'Team Members': ', '.join(project.team_members),
-                    'Notes': project.notes,
-                    'Tags': ', '.join(project.tags)
-                })
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            join = ', '.join
+            writer.writerows(
+                (
+                    project_id, name, description, status, priority, color,
+                    created_at, updated_at, start_date or '', target_date or '',
+                    completion_date or '', progress, repository_url or '',
+                    join(tech_stack), join(team_members), notes, join(tags)
+                )
+                for (
+                    project_id, name, description, status, priority, color,
+                    created_at, updated_at, start_date, target_date,
+                    completion_date, progress, repository_url,
+                    tech_stack, team_members, notes, tags
+                ) in map(_PROJECT_CSV_FIELDS, projects)
+            )
         
         return True
     except Exception as e:
@@ -60,7 +77,7 @@ def export_projects_csv(projects: List[Project], filepath: str) -> bool:
 def export_tasks_csv(tasks: List[Task], filepath: str) -> bool:
     """Export tasks to CSV file."""
     try:
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             if not tasks:
                 return True
             
@@ -70,26 +87,22 @@ def export_tasks_csv(tasks: List[Task], filepath: str) -> bool:
                 'Estimated Hours', 'Actual Hours', 'Tags', 'Blocked Reason'
             ]
             
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            
-            for task in tasks:
-                writer.writerow({
-                    'ID': task.id,
-                    'Project ID': task.project_id or '',
-                    'Title': task.title,
-                    'Description': task.description,
-                    'Status': task.status,
-                    'Priority': task.priority,
-                    'Created At': task.created_at,
-                    'Updated At': task.updated_at,
-                    'Due Date': task.due_date or '',
-                    'Completed At': task.completed_at or '',
-                    'Estimated Hours': task.estimated_hours or '',
-                    'Actual Hours': task.actual_hours or '',
-                    'Tags': ', '.join(task.tags),
-                    'Blocked Reason': task.blocked_reason or ''
-                })
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            join = ', '.join
+            writer.writerows(
+                (
+                    task_id, project_id or '', title, description, status, priority,
+                    created_at, updated_at, due_date or '', completed_at or '',
+                    estimated_hours or '', actual_hours or '', join(tags),
+                    blocked_reason or ''
+                )
+                for (
+                    task_id, project_id, title, description, status, priority,
+                    created_at, updated_at, due_date, completed_at,
+                    estimated_hours, actual_hours, tags, blocked_reason
+                ) in map(_TASK_CSV_FIELDS, tasks)
+            )
         
         return True
     except Exception as e:
@@ -100,7 +113,7 @@ def export_tasks_csv(tasks: List[Task], filepath: str) -> bool:
 def export_daily_plans_csv(plans: List[DailyPlan], filepath: str) -> bool:
     """Export daily plans to CSV file."""
     try:
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             if not plans:
                 return True
             
@@ -109,25 +122,25 @@ def export_daily_plans_csv(plans: List[DailyPlan], filepath: str) -> bool:
                 'Notes', 'Mood', 'Completed'
             ]
             
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            
-            for plan in plans:
-                time_blocks_str = '; '.join([
-                    f"{b.start_time}-{b.end_time}: {b.activity}"
-                    for b in plan.time_blocks
-                ])
-                
-                writer.writerow({
-                    'ID': plan.id,
-                    'Date': plan.date,
-                    'Focus Goal': plan.focus_goal,
-                    'Tasks': ', '.join(plan.tasks),
-                    'Time Blocks': time_blocks_str,
-                    'Notes': plan.notes,
-                    'Mood': plan.mood or '',
-                    'Completed': plan.completed
-                })
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            join = ', '.join
+            writer.writerows(
+                (
+                    plan.id,
+                    plan.date,
+                    plan.focus_goal,
+                    join(plan.tasks),
+                    '; '.join(
+                        f"{b.start_time}-{b.end_time}: {b.activity}"
+                        for b in plan.time_blocks
+                    ),
+                    plan.notes,
+                    plan.mood or '',
+                    plan.completed
+                )
+                for plan in plans
+            )
         
         return True
     except Exception as e:
@@ -135,26 +148,60 @@ def export_daily_plans_csv(plans: List[DailyPlan], filepath: str) -> bool:
         return False
 
 
-def export_all_data_json(storage, filepath: str) -> bool:
-    """Export all data to JSON file."""
+def _dumps(record: dict, pretty: bool = False) -> str:
+    """Serialize one record to JSON, with orjson when it is installed; compact unless pretty."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2 if pretty else None).decode('utf-8')
+    if pretty:
+        return json.dumps(record, indent=2, ensure_ascii=False)
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+
+def _load_json_file(filepath: str):
+    """Read a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_export(f, sections, pretty: bool = False):
+    """Write an export object, streaming each record list one record at a time."""
+    f.write('{\n  "export_date": ')
+    f.write(json.dumps(datetime.now().isoformat()))
+    
+    for name, records in sections:
+        f.write(f',\n  {json.dumps(name)}: [')
+        separator = '\n    '
+        for record in records:
+            f.write(separator)
+            # Indented records are shifted to sit inside their array
+            text = _dumps(record.to_dict(), pretty)
+            f.write(text.replace('\n', '\n    ') if pretty else text)
+            separator = ',\n    '
+        f.write(']' if separator == '\n    ' else '\n  ]')
+    
+    f.write('\n}\n')
+
+
+def export_all_data_json(storage, filepath: str, pretty: bool = False) -> bool:
+    """Export all data to JSON file; records are compact unless pretty is set."""
     try:
-        data = {
-            'export_date': datetime.now().isoformat(),
-            'projects': [p.to_dict() for p in storage.get_all_projects()],
-            'tasks': [t.to_dict() for t in storage.get_all_tasks()],
-            'daily_plans': []  # Daily plans export
-        }
-        
         # Get all daily plans (last 90 days)
-        from datetime import timedelta
-        start_date = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
-        end_date = datetime.now().strftime("%Y-%m-%d")
+        from datetime import date, timedelta
+        today = date.today()
+        start_date = (today - timedelta(days=90)).isoformat()
+        end_date = today.isoformat()
         
-        daily_plans = storage.get_daily_plans_range(start_date, end_date)
-        data['daily_plans'] = [p.to_dict() for p in daily_plans]
+        sections = (
+            ('projects', storage.get_all_projects()),
+            ('tasks', storage.get_all_tasks()),
+            ('daily_plans', storage.get_daily_plans_range(start_date, end_date))
+        )
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            _write_json_export(f, sections, pretty)
         
         return True
     except Exception as e:
@@ -162,16 +209,11 @@ def export_all_data_json(storage, filepath: str) -> bool:
         return False
 
 
-def export_projects_json(projects: List[Project], filepath: str) -> bool:
-    """Export projects only to JSON file."""
+def export_projects_json(projects: List[Project], filepath: str, pretty: bool = False) -> bool:
+    """Export projects only to JSON file; records are compact unless pretty is set."""
     try:
-        data = {
-            'export_date': datetime.now().isoformat(),
-            'projects': [p.to_dict() for p in projects]
-        }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            _write_json_export(f, [('projects', projects)], pretty)
         
         return True
     except Exception as e:
@@ -179,16 +221,11 @@ def export_projects_json(projects: List[Project], filepath: str) -> bool:
         return False
 
 
-def export_tasks_json(tasks: List[Task], filepath: str) -> bool:
-    """Export tasks only to JSON file."""
+def export_tasks_json(tasks: List[Task], filepath: str, pretty: bool = False) -> bool:
+    """Export tasks only to JSON file; records are compact unless pretty is set."""
     try:
-        data = {
-            'export_date': datetime.now().isoformat(),
-            'tasks': [t.to_dict() for t in tasks]
-        }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            _write_json_export(f, [('tasks', tasks)], pretty)
         
         return True
     except Exception as e:
@@ -199,18 +236,12 @@ def export_tasks_json(tasks: List[Task], filepath: str) -> bool:
 def import_projects_json(filepath: str, storage) -> tuple[bool, str]:
     """Import projects from JSON file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json_file(filepath)
         
-        projects_data = data.get('projects', [])
-        count = 0
+        projects = [Project.from_dict(d) for d in data.get('projects', [])]
+        storage.save_projects_bulk(projects)
         
-        for project_dict in projects_data:
-            project = Project.from_dict(project_dict)
-            storage.save_project(project)
-            count += 1
-        
-        return True, f"Imported {count} projects successfully"
+        return True, f"Imported {len(projects)} projects successfully"
     except Exception as e:
         return False, f"Error importing projects: {str(e)}"
 
@@ -218,18 +249,12 @@ def import_projects_json(filepath: str, storage) -> tuple[bool, str]:
 def import_tasks_json(filepath: str, storage) -> tuple[bool, str]:
     """Import tasks from JSON file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        tasks_data = data.get('tasks', [])
-        count = 0
+        data = _load_json_file(filepath)
         
-        for task_dict in tasks_data:
-            task = Task.from_dict(task_dict)
-            storage.save_task(task)
-            count += 1
+        tasks = [Task.from_dict(d) for d in data.get('tasks', [])]
+        storage.save_tasks_bulk(tasks)
         
-        return True, f"Imported {count} tasks successfully"
+        return True, f"Imported {len(tasks)} tasks successfully"
     except Exception as e:
         return False, f"Error importing tasks: {str(e)}"
 
@@ -237,28 +262,21 @@ def import_tasks_json(filepath: str, storage) -> tuple[bool, str]:
 def import_all_data_json(filepath: str, storage) -> tuple[bool, str]:
     """Import all data from JSON file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json_file(filepath)
         
         # Import projects
-        projects_data = data.get('projects', [])
-        for project_dict in projects_data:
-            project = Project.from_dict(project_dict)
-            storage.save_project(project)
+        projects = [Project.from_dict(d) for d in data.get('projects', [])]
+        storage.save_projects_bulk(projects)
         
         # Import tasks
-        tasks_data = data.get('tasks', [])
-        for task_dict in tasks_data:
-            task = Task.from_dict(task_dict)
-            storage.save_task(task)
+        tasks = [Task.from_dict(d) for d in data.get('tasks', [])]
+        storage.save_tasks_bulk(tasks)
         
         # Import daily plans
-        plans_data = data.get('daily_plans', [])
-        for plan_dict in plans_data:
-            plan = DailyPlan.from_dict(plan_dict)
-            storage.save_daily_plan(plan)
+        plans = [DailyPlan.from_dict(d) for d in data.get('daily_plans', [])]
+        storage.save_daily_plans_bulk(plans)
         
-        total = len(projects_data) + len(tasks_data) + len(plans_data)
+        total = len(projects) + len(tasks) + len(plans)
         return True, f"Imported {total} items successfully"
     except Exception as e:
         return False, f"Error importing data: {str(e)}"
@@ -1,32 +1,49 @@
 """
 Utility helper functions.
 """
+import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
+# Every stored date starts with YYYY-MM-DD; anything else is rejected without raising
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# A "#RRGGBB" hex color
+_HEX_COLOR_MATCH = re.compile(r"#[0-9A-Fa-f]{6}").fullmatch
+
+
+@lru_cache(maxsize=4096)
+def parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO date or datetime string, or None if it is missing or malformed."""
+    if not isinstance(value, str) or not _ISO_DATE_RE.match(value):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=2048)
 def format_date(iso_date: Optional[str], format_str: str = "%b %d, %Y") -> str:
     """Format ISO date string to readable format."""
     if not iso_date:
         return "Not set"
     
-    try:
-        date = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
-        return date.strftime(format_str)
-    except:
-        return "Invalid date"
+    date = parse_iso(iso_date)
+    return date.strftime(format_str) if date else "Invalid date"
 
 
+@lru_cache(maxsize=2048)
 def format_datetime(iso_datetime: Optional[str]) -> str:
     """Format ISO datetime string to readable format."""
     if not iso_datetime:
         return "Not set"
     
-    try:
-        dt = datetime.fromisoformat(iso_datetime.replace("Z", "+00:00"))
-        return dt.strftime("%b %d, %Y at %I:%M %p")
-    except:
-        return "Invalid datetime"
+    dt = parse_iso(iso_datetime)
+    return dt.strftime("%b %d, %Y at %I:%M %p") if dt else "Invalid datetime"
 
 
 def time_ago(iso_datetime: Optional[str]) -> str:
@@ -34,28 +51,36 @@ def time_ago(iso_datetime: Optional[str]) -> str:
     if not iso_datetime:
         return "Never"
     
-    try:
-        dt = datetime.fromisoformat(iso_datetime.replace("Z", "+00:00"))
-        now = datetime.now()
-        diff = now - dt
-        
-        seconds = diff.total_seconds()
-        if seconds < 60:
-            return "Just now"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            return f"{hours} hour{'s' if hours > 1 else ''} ago"
-        elif seconds < 604800:
-            days = int(seconds / 86400)
-            return f"{days} day{'s' if days > 1 else ''} ago"
-        else:
-            weeks = int(seconds / 604800)
-            return f"{weeks} week{'s' if weeks > 1 else ''} ago"
-    except:
+    dt = parse_iso(iso_datetime)
+    if dt is None:
         return "Unknown"
+    
+    seconds = (datetime.now(dt.tzinfo) - dt).total_seconds()
+    if seconds < 60:
+        return "Just now"
+    elif seconds < 3600:
+        minutes = int(seconds / 60)
+        return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
+    elif seconds < 86400:
+        hours = int(seconds / 3600)
+        return f"{hours} hour{'s' if hours > 1 else ''} ago"
+    elif seconds < 604800:
+        days = int(seconds / 86400)
+        return f"{days} day{'s' if days > 1 else ''} ago"
+    else:
+        weeks = int(seconds / 604800)
+        return f"{weeks} week{'s' if weeks > 1 else ''} ago"
+
+
+@lru_cache(maxsize=4096)
+def _time_ago_for_minute(iso_datetime: Optional[str], minute: int) -> str:
+    """Memoized time_ago; the minute argument expires entries as time passes."""
+    return time_ago(iso_datetime)
+
+
+def cached_time_ago(iso_datetime: Optional[str]) -> str:
+    """time_ago() cached per timestamp for the current minute."""
+    return _time_ago_for_minute(iso_datetime, int(time.time() // 60))
 
 
 def truncate_text(text: str, max_length: int = 50) -> str:
@@ -67,12 +92,4 @@ def truncate_text(text: str, max_length: int = 50) -> str:
 
 def validate_color(color: str) -> bool:
     """Validate hex color format."""
-    if not color.startswith("#"):
-        return False
-    if len(color) != 7:
-        return False
-    try:
-        int(color[1:], 16)
-        return True
-    except ValueError:
-        return False
+    return _HEX_COLOR_MATCH(color) is not None
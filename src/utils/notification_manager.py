@@ -2,9 +2,12 @@
 Notification and reminder management system.
 """
 from datetime import datetime, timedelta
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional, Set
 import threading
-import time
+
+
+# Shortest wait between checks, so a stale wake time cannot spin the timer
+MIN_CHECK_DELAY = 1.0
 
 
 class NotificationManager:
@@ -14,8 +17,8 @@ class NotificationManager:
         self.storage = storage_manager
         self.show_notification = show_notification_callback
         self.running = False
-        self.check_interval = 300  # Check every 5 minutes
-        self.thread = None
+        self.check_interval = 300  # Check at least every 5 minutes
+        self.timer = None
         
         # Get notification settings
         settings = self.storage.get_settings()
@@ -32,144 +35,149 @@ class NotificationManager:
                 "notification_duration": 5000
             }
         
-        self.daily_summary_shown_today = False
+        self._apply_settings()
+        self._summary_shown_on: Optional[str] = None  # Date the daily summary was last shown
+        
+        # Tasks already reminded about, by ID, so repeat checks stay quiet
+        self._notified_due_soon: Set[str] = set()
+        self._notified_overdue: Dict[str, datetime] = {}
+    
+    def _apply_settings(self):
+        """Read the notification settings once so the check loop needs no lookups."""
+        self._enabled = bool(self.settings.get("enabled", True))
+        self._daily_summary = bool(self.settings.get("daily_summary", True))
+        self._due_soon = bool(self.settings.get("task_due_soon", True))
+        self._overdue = bool(self.settings.get("task_overdue", True))
+        self._summary_time = self.settings.get("daily_summary_time", "09:00")
+        self._notify_duration = int(self.settings.get("notification_duration", 5000))
     
     def start(self):
         """Start the notification manager."""
-        if not self.settings.get("enabled", True):
+        if not self._enabled:
             return
         
         self.running = True
-        self.thread = threading.Thread(target=self._check_loop, daemon=True)
-        self.thread.start()
+        self._schedule(0)
     
     def stop(self):
         """Stop the notification manager."""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=1)
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
     
-    def _check_loop(self):
-        """Main loop to check for notifications."""
-        while self.running:
-            try:
-                # Check daily summary
-                if self.settings.get("daily_summary", True):
-                    self._check_daily_summary()
-                
-                # Check due soon tasks
-                if self.settings.get("task_due_soon", True):
-                    self._check_due_soon_tasks()
-                
-                # Check overdue tasks
-                if self.settings.get("task_overdue", True):
-                    self._check_overdue_tasks()
-                
-                # Sleep for interval
-                time.sleep(self.check_interval)
-                
-            except Exception as e:
-                print(f"Notification check error: {e}")
-                time.sleep(self.check_interval)
+    def _schedule(self, delay: float):
+        """Run the next check after delay seconds."""
+        self.timer = threading.Timer(delay, self._tick)
+        self.timer.daemon = True
+        self.timer.start()
     
-    def _check_daily_summary(self):
-        """Check if daily summary should be shown."""
-        now = datetime.now()
-        summary_time = self.settings.get("daily_summary_time", "09:00")
+    def _tick(self):
+        """Run the checks, then sleep until the next time something can change."""
+        if not self.running:
+            return
         
+        now = datetime.now()
+        next_wake = now + timedelta(seconds=self.check_interval)
         try:
-            hour, minute = map(int, summary_time.split(":"))
-            target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            
-            # Show if within 5 minutes of target time and not shown today
-            if abs((now - target_time).total_seconds()) < 300 and not self.daily_summary_shown_today:
-                tasks = self.storage.get_all_tasks()
-                today_tasks = [
-                    t for t in tasks 
-                    if t.due_date and t.due_date.startswith(now.strftime("%Y-%m-%d"))
-                    and t.status != "completed"
-                ]
-                
-                if today_tasks:
-                    self.show_notification(
-                        "Daily Summary",
-                        f"You have {len(today_tasks)} task{'s' if len(today_tasks) != 1 else ''} due today",
-                        self.settings.get("notification_duration", 5000),
-                        lambda: self._open_tasks_view()
-                    )
-                    self.daily_summary_shown_today = True
-            
-            # Reset flag at midnight
-            if now.hour == 0 and now.minute == 0:
-                self.daily_summary_shown_today = False
-                
+            # Uncompleted tasks with a due date, checked in a single pass
+            next_wake = self._check_tasks(self.storage.get_open_tasks_with_due_date(), now)
         except Exception as e:
-            print(f"Daily summary check error: {e}")
-    
-    def _check_due_soon_tasks(self):
-        """Check for tasks due within 24 hours."""
-        now = datetime.now()
-        tomorrow = now + timedelta(days=1)
+            print(f"Notification check error: {e}")
         
-        try:
-            tasks = self.storage.get_all_tasks()
-        except:
-            return
+        if self.running:
+            self._schedule(max(MIN_CHECK_DELAY, (next_wake - datetime.now()).total_seconds()))
+    
+    def _check_tasks(self, tasks: List, now: datetime) -> datetime:
+        """
+        Run the due today, due soon and overdue checks in one pass over the tasks.
+        Returns when the next reminder can fire, capped at check_interval so new tasks are seen.
+        """
+        today = now.strftime("%Y-%m-%d")
+        due_today = 0
+        next_wake = now + timedelta(seconds=self.check_interval)
         
         for task in tasks:
-            if task.status == "completed" or not task.due_date:
+            if task.due_date[:10] == today:
+                due_today += 1
+            
+            # due_dt parses each distinct due date string once, not every tick
+            due = task.due_dt
+            if due is None:
                 continue
             
             try:
-                due = datetime.fromisoformat(task.due_date)
-                hours_until_due = (due - now).total_seconds() / 3600
+                if now > due:
+                    if self._overdue:
+                        self._notify_overdue(task, due, now)
+                        next_wake = min(next_wake, self._notified_overdue[task.id] + timedelta(days=1))
+                    continue
                 
-                # Notify if due within 24 hours but not yet overdue
-                if 0 < hours_until_due < 24:
-                    # Check if we already notified (simple check - could be improved)
-                    if not hasattr(task, '_notified_due_soon'):
-                        self.show_notification(
-                            "Task Due Soon",
-                            f"'{task.title}' is due in {int(hours_until_due)} hour{'s' if int(hours_until_due) != 1 else ''}",
-                            self.settings.get("notification_duration", 5000),
-                            lambda t=task: self._open_task(t)
-                        )
-                        task._notified_due_soon = True
+                if self._overdue:
+                    next_wake = min(next_wake, due)
+                if self._due_soon:
+                    hours_until_due = (due - now).total_seconds() / 3600
+                    # Notify if due within 24 hours but not yet overdue
+                    if hours_until_due < 24:
+                        self._notify_due_soon(task, hours_until_due)
+                    else:
+                        next_wake = min(next_wake, due - timedelta(days=1))
             except Exception:
                 # Silently skip tasks with validation or parsing errors
                 continue
-    
-    def _check_overdue_tasks(self):
-        """Check for overdue tasks."""
-        now = datetime.now()
         
+        if self._daily_summary:
+            next_wake = min(next_wake, self._check_daily_summary(now, due_today))
+        return next_wake
+    
+    def _check_daily_summary(self, now: datetime, due_today: int) -> datetime:
+        """Check if daily summary should be shown; returns when its next window opens."""
+        next_window = now + timedelta(seconds=self.check_interval)
         try:
-            tasks = self.storage.get_all_tasks()
-        except:
-            return
-        
-        for task in tasks:
-            if task.status == "completed" or not task.due_date:
-                continue
+            hour, minute = map(int, self._summary_time.split(":"))
+            target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            window_start = target_time - timedelta(minutes=5)
             
-            try:
-                due = datetime.fromisoformat(task.due_date)
-                if now > due:
-                    # Check if we already notified (every 24 hours)
-                    if not hasattr(task, '_notified_overdue') or \
-                       (now - task._notified_overdue).total_seconds() > 86400:
-                        
-                        days_overdue = (now - due).days
-                        self.show_notification(
-                            "Task Overdue",
-                            f"'{task.title}' is {days_overdue} day{'s' if days_overdue != 1 else ''} overdue",
-                            self.settings.get("notification_duration", 5000),
-                            lambda t=task: self._open_task(t)
-                        )
-                        task._notified_overdue = now
-            except Exception:
-                # Silently skip tasks with validation or parsing errors
-                continue
+            # Show if within 5 minutes of target time and not shown today
+            today = now.strftime("%Y-%m-%d")
+            if abs((now - target_time).total_seconds()) < 300 and self._summary_shown_on != today:
+                if due_today:
+                    self.show_notification(
+                        "Daily Summary",
+                        f"You have {due_today} task{'s' if due_today != 1 else ''} due today",
+                        self._notify_duration,
+                        lambda: self._open_tasks_view()
+                    )
+                    self._summary_shown_on = today
+            
+            next_window = window_start if now < window_start else window_start + timedelta(days=1)
+        except Exception as e:
+            print(f"Daily summary check error: {e}")
+        return next_window
+    
+    def _notify_due_soon(self, task, hours_until_due: float):
+        """Notify once that a task is due within 24 hours."""
+        if task.id not in self._notified_due_soon:
+            self.show_notification(
+                "Task Due Soon",
+                f"'{task.title}' is due in {int(hours_until_due)} hour{'s' if int(hours_until_due) != 1 else ''}",
+                self._notify_duration,
+                lambda t=task: self._open_task(t)
+            )
+            self._notified_due_soon.add(task.id)
+    
+    def _notify_overdue(self, task, due: datetime, now: datetime):
+        """Notify that a task is overdue, at most once every 24 hours."""
+        notified_at = self._notified_overdue.get(task.id)
+        if notified_at is None or (now - notified_at).total_seconds() > 86400:
+            days_overdue = (now - due).days
+            self.show_notification(
+                "Task Overdue",
+                f"'{task.title}' is {days_overdue} day{'s' if days_overdue != 1 else ''} overdue",
+                self._notify_duration,
+                lambda t=task: self._open_task(t)
+            )
+            self._notified_overdue[task.id] = now
     
     def _open_tasks_view(self):
         """Callback to open tasks view."""
@@ -184,10 +192,11 @@ class NotificationManager:
     def update_settings(self, settings: dict):
         """Update notification settings."""
         self.settings.update(settings)
+        self._apply_settings()
         
         # Restart if enabled status changed
         was_running = self.running
-        if settings.get("enabled", True) and not was_running:
+        if self._enabled and not was_running:
             self.start()
-        elif not settings.get("enabled", True) and was_running:
+        elif not self._enabled and was_running:
             self.stop()